@@ -0,0 +1,172 @@
+"""
+Persistent on-disk cache for the per-file parsing results.
+
+Parsing is, by far, the most expensive step of reading a codebase, while most of the
+files are exactly the same between two runs. This module stores each file's extracted
+statements inside a cache dir, addressed by a key built from the file content plus
+the versions of everything able to change the extraction: Mosheh itself, the handler
+used and the Python interpreter, whose AST may differ between releases.
+
+The cache layout is as simple as possible, sharded by the first two key chars to
+avoid huge directories:
+
+```
+.mosheh_cache/
+├── .gitignore
+├── 3f/
+│   └── 3f9a...e1.pickle
+└── a0/
+    └── a0c4...7b.pickle
+```
+
+Entries are written atomically, through a temporary file plus `os.replace`, so
+concurrent workers can share the same cache dir safely. Any broken entry is treated
+just as a cache miss, while any failing write is skipped, never breaking the run.
+"""
+
+import pickle
+from contextlib import suppress
+from functools import cache
+from hashlib import sha256
+from importlib.metadata import PackageNotFoundError, version
+from logging import Logger, getLogger
+from os import makedirs, path, remove, replace
+from sys import version_info
+from tempfile import NamedTemporaryFile
+from typing import Any
+
+
+logger: Logger = getLogger('mosheh')
+
+
+@cache
+def mosheh_version() -> str:
+    """
+    Returns the installed Mosheh version, used to invalidate stale cache entries.
+
+    If the package metadata is not available, which happens when running straight from
+    the source tree, falls back to `'unknown'`.
+
+    :return: The Mosheh version, e.g. `'2.0.4'`.
+    :rtype: str
+    """
+
+    try:
+        return version('mosheh')
+    except PackageNotFoundError:
+        return 'unknown'
+
+
+def cache_key(content: bytes, *salt: str) -> str:
+    """
+    Builds the cache key for some content, salted with the given version strings.
+
+    The key is the SHA-256 hexdigest of the salt - always prefixed with the Mosheh and
+    Python versions - followed by the content itself, so changing any of them leads to
+    a different key.
+
+    Example:
+
+    ```python
+    cache_key(b'import os', 'python-handler-1')
+    # '5d1c...9f'
+    ```
+
+    :param content: The raw content being cached, e.g. a Python file bytes.
+    :type content: bytes
+    :param salt: Extra version strings, such as the handler version.
+    :type salt: str
+    :return: The hexdigest key.
+    :rtype: str
+    """
+
+    digest = sha256()
+
+    for part in (mosheh_version(), f'{version_info.major}.{version_info.minor}', *salt):
+        digest.update(part.encode())
+        digest.update(b'\0')
+
+    digest.update(content)
+
+    return digest.hexdigest()
+
+
+def read_cache(cache_dir: str, key: str) -> Any | None:
+    """
+    Loads a cached entry, returning `None` if missing or unreadable.
+
+    :param cache_dir: The cache root dir.
+    :type cache_dir: str
+    :param key: The entry key, as built by `cache_key`.
+    :type key: str
+    :return: The cached object or `None` on cache miss.
+    :rtype: Any | None
+    """
+
+    try:
+        with open(_entry_path(cache_dir, key), 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f'\tIgnoring broken cache entry {key}: {e}')
+        return None
+
+
+def write_cache(cache_dir: str, key: str, data: Any) -> None:
+    """
+    Stores an entry into the cache, atomically replacing any existing one.
+
+    The cache dir is created on demand, together with a `.gitignore` so it never ends
+    up versioned by accident. A failing write, e.g. an unpicklable object or a full
+    disk, is just logged and skipped, leaving no temporary file behind.
+
+    :param cache_dir: The cache root dir.
+    :type cache_dir: str
+    :param key: The entry key, as built by `cache_key`.
+    :type key: str
+    :param data: Any picklable object to be stored.
+    :type data: Any
+    :return: None
+    :rtype: None
+    """
+
+    entry: str = _entry_path(cache_dir, key)
+    shard: str = path.dirname(entry)
+    tmp_name: str | None = None
+
+    try:
+        if not path.exists(shard):
+            makedirs(shard, exist_ok=True)
+
+            gitignore: str = path.join(cache_dir, '.gitignore')
+            if not path.exists(gitignore):
+                with open(gitignore, 'w', encoding='utf-8') as f:
+                    f.write('*\n')
+
+        with NamedTemporaryFile('wb', dir=shard, delete=False) as tmp:
+            tmp_name = tmp.name
+            pickle.dump(data, tmp, protocol=pickle.HIGHEST_PROTOCOL)
+
+        replace(tmp_name, entry)
+    except Exception as e:
+        logger.warning(f'Skipping cache entry {key}: {type(e).__name__}: {e}')
+
+        if tmp_name is not None:
+            with suppress(OSError):
+                remove(tmp_name)
+
+
+def _entry_path(cache_dir: str, key: str) -> str:
+    """
+    Defines where the entry for a given key lives inside the cache dir.
+
+    :param cache_dir: The cache root dir.
+    :type cache_dir: str
+    :param key: The entry key, as built by `cache_key`.
+    :type key: str
+    :return: The entry file path.
+    :rtype: str
+    """
+
+    return path.join(cache_dir, key[:2], f'{key}.pickle')
@@ -12,19 +12,36 @@ Key Functions:
 - `read_codebase`: Orchestrates the entire process by iterating through the codebase,
     parsing Python files, and storing structured information about their contents.
 
-- `_iterate`: Recursively yields file paths within the provided root directory for
-    iteration.
+- `stream_codebase`: The streaming sibling of `read_codebase`, returning just the path
+    tree of the codebase and parsing each file lazily, as it's consumed.
+
+- `parse_files`: Parses a given set of Python files, serially or over a process pool,
+    yielding each file statements; used directly when just some files are needed.
+
+- `list_python_files`: Lists the Python files of the codebase, walked by `_iterate`.
+
+- `_iterate`: Yields file paths within the provided root directory, pruning the dirs
+    left out by `mosheh.ignore` without entering them.
+
+- `_parse_in_parallel`: Fans the Python files parsing out over a process pool, keeping
+    the results in the same order as a serial run.
 
 How It Works:
 
 1. The `read_codebase` function starts by invoking `_iterate` to navigate into the
-    directory tree starting from the given root path.
+    directory tree starting from the given root path, skipping every dir and file left
+    out by the built-in defaults, the `.gitignore` files and the `exclude` patterns,
+    unless re-included by the `include` ones.
 
 2. For each file encountered, if a valid, expected extension, the file is read and its
     AST or content - if not a programming language file - is parsed to extract relevant
     information.
 
-3. The result is a comprehensive dictionary (`CodebaseDict`) containing all collected
+3. When running with more than one job, the files are parsed by worker processes and
+    merged back following the iteration order, so the output is exactly the same as the
+    serial one, no matter how many workers are used.
+
+4. The result is a comprehensive dictionary (`CodebaseDict`) containing all collected
     data, which is returned as a standard dictionary for compatibility.
 
 This module is a foundational component for automated documentation generation,
@@ -32,21 +49,43 @@ providing the structural insights needed for subsequent steps in the documentati
 pipeline.
 """
 
-from collections import defaultdict
-from collections.abc import Generator
+from collections.abc import Generator, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from logging import Logger, getLogger
-from os import path, walk
-from typing import Any
+from os import DirEntry, cpu_count, path, scandir, sep
+from typing import Any, Final
 
-from mosheh.handlers import handle_python_file
-from mosheh.types.basic import CodebaseDict
-from mosheh.utils import convert_to_regular_dict, nested_defaultdict
+from mosheh.handlers import parse_python_file
+from mosheh.ignore import (
+    DEFAULT_EXCLUDE,
+    GITIGNORE,
+    RuleSet,
+    compile_rules,
+    includes_inside,
+    is_ignored,
+    parent_gitignores,
+    read_gitignore,
+)
+from mosheh.modules import ModuleIndex, build_module_index
+from mosheh.types.basic import CodebaseDict, FilePath
+from mosheh.types.contracts import FileContract
+from mosheh.utils import add_to_codebase_tree, build_path_tree
 
 
 logger: Logger = getLogger('mosheh')
 
+MAX_CHUNKSIZE: Final[int] = 64
+
 
-def read_codebase(root: str) -> CodebaseDict:
+def read_codebase(
+    root: str,
+    jobs: int = 1,
+    cache_dir: str | None = None,
+    skip_function_bodies: bool = True,
+    exclude: Sequence[str] = (),
+    include: Sequence[str] = (),
+) -> CodebaseDict:
     """
     Iterates through the codebase and collects all info possibly needed.
 
@@ -57,37 +96,296 @@ def read_codebase(root: str) -> CodebaseDict:
     Also works as a dispatch-like, matching the files extensions,
     leading each file to its flow.
 
+    The Python files are parsed through `parse_files`, so `jobs`, `cache_dir` and
+    `skip_function_bodies` have the same meaning here; either way, the per-file
+    statements are merged following the iteration order, so the result is identical
+    to the serial one.
+
+    Before parsing, the Python files found are indexed by `modules.build_module_index`,
+    so the imports of the project own modules are classified as local and the relative
+    ones resolved, no matter the current working dir.
+
     :param root: The root path/dir to be iterated.
     :type root: str
+    :param jobs: Number of processes parsing files, less than 1 meaning all CPUs.
+    :type jobs: int = 1
+    :param cache_dir: Dir of the parsing cache, `None` for disabling it.
+    :type cache_dir: str | None = None
+    :param skip_function_bodies: If the statements inside functions are left out.
+    :type skip_function_bodies: bool = True
+    :param exclude: `.gitignore`-like patterns of paths to be left out.
+    :type exclude: Sequence[str] = ()
+    :param include: `.gitignore`-like patterns of paths to be walked anyway.
+    :type include: Sequence[str] = ()
     :return: All the codebase data collected.
     :rtype: CodebaseDict
     """
 
-    codebase: defaultdict[Any, Any] = nested_defaultdict()
+    codebase: CodebaseDict = {}
+    files: list[FilePath] = list_python_files(root, exclude, include)
+    index: ModuleIndex = build_module_index(root, files)
 
-    for file in _iterate(root):
-        if file.endswith('.py') or file.endswith('.pyi'):
+    for file, statements in parse_files(
+        files, jobs, cache_dir, skip_function_bodies, index
+    ):
+        add_to_codebase_tree(codebase, file.split(sep), statements)
+        logger.debug(f'\t{file} parsing successfully done')
+
+    return codebase
+
+
+def stream_codebase(
+    root: str,
+    jobs: int = 1,
+    cache_dir: str | None = None,
+    skip_function_bodies: bool = True,
+    exclude: Sequence[str] = (),
+    include: Sequence[str] = (),
+) -> tuple[CodebaseDict, Iterator[tuple[FilePath, FileContract]]]:
+    """
+    Lists the codebase as `read_codebase` does, but leaves the parsing for later.
+
+    Instead of holding every file statements at once, returns the path tree of the
+    codebase - the very same `CodebaseDict`, but with empty lists as files - and an
+    iterator parsing each file just when it's consumed, in the same order. So, by
+    rendering and writing each file before asking for the next one, the memory used
+    does not grow with the codebase size.
+
+    The arguments have exactly the same meaning of the `read_codebase` ones.
+
+    Example:
+
+    ```python
+    tree, parsed = stream_codebase('PROJECT')
+    # tree: {'PROJECT': {'manage.py': [], 'core': {'urls.py': []}}}
+    next(parsed)
+    # ('PROJECT/manage.py', [FileMetaContract(...), ImportContract(...), ...])
+    ```
+
+    :param root: The root path/dir to be iterated.
+    :type root: str
+    :param jobs: Number of processes parsing files, less than 1 meaning all CPUs.
+    :type jobs: int = 1
+    :param cache_dir: Dir of the parsing cache, `None` for disabling it.
+    :type cache_dir: str | None = None
+    :param skip_function_bodies: If the statements inside functions are left out.
+    :type skip_function_bodies: bool = True
+    :param exclude: `.gitignore`-like patterns of paths to be left out.
+    :type exclude: Sequence[str] = ()
+    :param include: `.gitignore`-like patterns of paths to be walked anyway.
+    :type include: Sequence[str] = ()
+    :return: The codebase path tree and each file path paired with it's statements.
+    :rtype: tuple[CodebaseDict, Iterator[tuple[FilePath, FileContract]]]
+    """
+
+    files: list[FilePath] = list_python_files(root, exclude, include)
+    index: ModuleIndex = build_module_index(root, files)
+
+    return build_path_tree(files), parse_files(
+        files, jobs, cache_dir, skip_function_bodies, index
+    )
+
+
+def parse_files(
+    files: Iterable[FilePath],
+    jobs: int = 1,
+    cache_dir: str | None = None,
+    skip_function_bodies: bool = True,
+    index: ModuleIndex | None = None,
+) -> Iterator[tuple[FilePath, FileContract]]:
+    """
+    Parses the given Python files, yielding each one with it's statements.
+
+    If `jobs` is greater than 1, the files are parsed by a pool of `jobs` processes; if
+    lower than 1, the pool uses every CPU available. The files are always yielded in the
+    received order, no matter how many workers are used.
+
+    If `cache_dir` is provided, every file parsing is cached there, so unchanged files
+    are not parsed again on the next runs.
+
+    If `skip_function_bodies`, the default, nothing defined inside functions is parsed
+    as a documented statement.
+
+    If an `index` of the project modules is provided, the imports are classified and
+    resolved against it.
+
+    :param files: The Python files paths.
+    :type files: Iterable[FilePath]
+    :param jobs: Number of processes parsing files, less than 1 meaning all CPUs.
+    :type jobs: int = 1
+    :param cache_dir: Dir of the parsing cache, `None` for disabling it.
+    :type cache_dir: str | None = None
+    :param skip_function_bodies: If the statements inside functions are left out.
+    :type skip_function_bodies: bool = True
+    :param index: The project module index, for classifying the imports.
+    :type index: ModuleIndex | None = None
+    :return: Each file path paired with it's parsed statements.
+    :rtype: Iterator[tuple[FilePath, FileContract]]
+    """
+
+    workers: int = jobs if jobs > 0 else cpu_count() or 1
+
+    if workers == 1:
+        for file in files:
             logger.info(f'Handling Python file: {file}')
-            codebase = handle_python_file(codebase, file)
-        else:
+            yield (
+                file,
+                parse_python_file(file, cache_dir, skip_function_bodies, index),
+            )
+    else:
+        for file, statements in _parse_in_parallel(
+            list(files), workers, cache_dir, skip_function_bodies, index
+        ):
+            logger.info(f'Handled Python file: {file}')
+            yield file, statements
+
+
+def list_python_files(
+    root: str,
+    exclude: Sequence[str] = (),
+    include: Sequence[str] = (),
+    quiet: bool = False,
+) -> list[FilePath]:
+    """
+    Lists just the Python files found by `_iterate`, logging every other one.
+
+    :param root: The root to be used as basedir.
+    :type root: str
+    :param exclude: `.gitignore`-like patterns of paths to be left out.
+    :type exclude: Sequence[str] = ()
+    :param include: `.gitignore`-like patterns of paths to be walked anyway.
+    :type include: Sequence[str] = ()
+    :param quiet: If the other files are not logged, e.g. when walking again and again.
+    :type quiet: bool = False
+    :return: The path for each Python file, in the walking order.
+    :rtype: list[FilePath]
+    """
+
+    files: list[FilePath] = []
+
+    for file in _iterate(root, exclude, include):
+        if file.endswith('.py') or file.endswith('.pyi'):
+            files.append(file)
+        elif not quiet:
             logger.info(f'File not handled: {file}')
 
-    return convert_to_regular_dict(codebase)
+    return files
+
+
+def _parse_in_parallel(
+    files: list[FilePath],
+    workers: int,
+    cache_dir: str | None = None,
+    skip_function_bodies: bool = True,
+    index: ModuleIndex | None = None,
+) -> Iterator[tuple[FilePath, FileContract]]:
+    """
+    Parses the Python files over a process pool, yielding them in the received order.
+
+    Since `ProcessPoolExecutor.map` returns the results following the input order,
+    regardless of which worker finishes first, the caller can merge them into the
+    codebase exactly as a serial run would do. The files are sent in chunks, so the
+    IPC overhead is paid per chunk instead of per file.
+
+    The chunks are up to `MAX_CHUNKSIZE` files and just 4 of them per worker are
+    submitted at once, so a caller slower than the pool, e.g. writing each file docs
+    while streaming, never has more than these files results waiting in memory.
+
+    :param files: The Python files paths, in the iteration order.
+    :type files: list[FilePath]
+    :param workers: Number of processes on the pool.
+    :type workers: int
+    :param cache_dir: Dir of the parsing cache, `None` for disabling it.
+    :type cache_dir: str | None = None
+    :param skip_function_bodies: If the statements inside functions are left out.
+    :type skip_function_bodies: bool = True
+    :param index: The project module index, for classifying the imports.
+    :type index: ModuleIndex | None = None
+    :return: Each file path paired with it's parsed statements.
+    :rtype: Iterator[tuple[FilePath, FileContract]]
+    """
+
+    chunksize: int = max(1, min(len(files) // (workers * 4), MAX_CHUNKSIZE))
+    window: int = chunksize * workers * 4
+    logger.debug(f'\tParsing {len(files)} files with {workers} workers')
+
+    parse: partial[FileContract] = partial(
+        parse_python_file,
+        cache_dir=cache_dir,
+        skip_function_bodies=skip_function_bodies,
+        index=index,
+    )
 
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for start in range(0, len(files), window):
+            batch: list[FilePath] = files[start : start + window]
+            yield from zip(batch, executor.map(parse, batch, chunksize=chunksize))
 
-def _iterate(root: str) -> Generator[str, Any, Any]:
+
+def _iterate(
+    root: str, exclude: Sequence[str] = (), include: Sequence[str] = ()
+) -> Generator[str, Any, Any]:
     """
     Iterates through every dir and file starting at provided root.
 
-    Iterates using for-loop in os.walk and for dirpath and file in
-    files yields the path for each file from the provided root to it.
+    Walks exactly as `os.walk` does, top-down and yielding each dir files before
+    entering it's subdirs, but with `os.scandir` straight away, so each entry type
+    comes from the dir listing itself, with no extra `stat` call.
+
+    Every entry is checked against `mosheh.ignore` rules before being yielded or
+    entered, so ignored dirs, such as `.venv` or `node_modules`, are pruned as a whole:
+    the built-in `DEFAULT_EXCLUDE` ones, the `.gitignore` files, from the Git repo
+    root down to the current dir, and then `exclude`, re-included by `include`. Just
+    like `os.walk`, symlinks to dirs are not followed.
 
     :param root: The root to be used as basedir.
     :type root: str
+    :param exclude: `.gitignore`-like patterns of paths to be left out.
+    :type exclude: Sequence[str] = ()
+    :param include: `.gitignore`-like patterns of paths to be walked anyway.
+    :type include: Sequence[str] = ()
     :return: The path for each file on for-loop.
     :rtype: Generator[str, Any, Any]
     """
 
-    for dirpath, _, files in walk(root):
-        for file in files:
-            yield path.join(dirpath, file)
+    base_sets: list[RuleSet] = [
+        compile_rules(DEFAULT_EXCLUDE, root),
+        *parent_gitignores(root),
+    ]
+    exclude_set: RuleSet = compile_rules(exclude, root)
+    include_set: RuleSet | None = compile_rules(include, root) if include else None
+    stack: list[tuple[str, list[RuleSet], bool]] = [(root, base_sets, False)]
+
+    while stack:
+        dirpath, sets, forced = stack.pop()
+        abs_dirpath: str = path.abspath(dirpath)
+
+        try:
+            with scandir(dirpath) as it:
+                entries: list[DirEntry[str]] = list(it)
+        except OSError:
+            continue
+
+        if any(i.name == GITIGNORE for i in entries) and (
+            gitignore := read_gitignore(dirpath)
+        ):
+            sets = [*sets, gitignore]
+
+        checked: list[RuleSet] = [*sets, exclude_set]
+        subdirs: list[tuple[str, bool]] = []
+
+        for entry in entries:
+            is_dir: bool = entry.is_dir()
+            abs_path: str = f'{abs_dirpath}{sep}{entry.name}'
+
+            if not is_ignored(abs_path, is_dir, checked, include_set, forced):
+                if not is_dir:
+                    yield entry.path
+                elif not entry.is_symlink():
+                    subdirs.append((entry.path, False))
+            elif is_dir and include_set and includes_inside(include_set, abs_path):
+                subdirs.append((entry.path, True))
+            else:
+                logger.debug(f'\tIgnored: {entry.path}')
+
+        stack.extend((i, sets, ignored) for i, ignored in reversed(subdirs))
@@ -1,6 +1,44 @@
-from mosheh.commands.create_cmd import create
-from mosheh.commands.init_cmd import init
-from mosheh.commands.update_cmd import update
+"""
+The CLI commands, each one living on it's own module.
 
+Since importing `create`, `update` or `watch` loads the whole parsing and rendering
+stack - `yaml`, the handlers, the builtins tables - the commands are only imported when
+first accessed, so `mosheh --help` or `mosheh init` never pay for what they do not use.
+"""
 
-__all__ = ['init', 'create', 'update']
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Final
+
+
+if TYPE_CHECKING:
+    from mosheh.commands.create_cmd import create
+    from mosheh.commands.init_cmd import init
+    from mosheh.commands.update_cmd import update
+    from mosheh.commands.watch_cmd import watch
+
+
+COMMANDS: Final[dict[str, str]] = {
+    'init': 'mosheh.commands.init_cmd',
+    'create': 'mosheh.commands.create_cmd',
+    'update': 'mosheh.commands.update_cmd',
+    'watch': 'mosheh.commands.watch_cmd',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports a command module on the first access to the command.
+
+    :param name: The command name, e.g. `'create'`.
+    :type name: str
+    :return: The command function.
+    :rtype: Any
+    """
+
+    if name not in COMMANDS:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    return getattr(import_module(COMMANDS[name]), name)
+
+
+__all__ = ['init', 'create', 'update', 'watch']
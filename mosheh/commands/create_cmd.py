@@ -8,14 +8,15 @@ logic implementation itself.
 """
 
 from argparse import Namespace
+from collections.abc import Iterator
 from json import loads
 from logging import Logger, getLogger
 from os.path import abspath, join
-from subprocess import CalledProcessError
 
-from mosheh.codebase import read_codebase
+from mosheh.codebase import read_codebase, stream_codebase
 from mosheh.doc.create import create_doc
-from mosheh.types.basic import CodebaseDict
+from mosheh.types.basic import CodebaseDict, FilePath
+from mosheh.types.contracts import FileContract
 from mosheh.types.jsoncfg import IOJSON, DefaultJSON, DocumentationJSON
 
 
@@ -93,12 +94,52 @@ def create(args: Namespace) -> None:
     CODEBASE_NAV_PATH: str = doc_config.get('codebaseNavPath', 'Codebase')
     logger.debug(f'JSON "documentation.codebaseNavPath" = {CODEBASE_NAV_PATH}')
 
+    NAV_FILE: str | None = (
+        join(OUTPUT, nav_file)
+        if (nav_file := doc_config.get('codebaseNavFile'))
+        else None
+    )
+    logger.debug(f'JSON "documentation.codebaseNavFile" = {NAV_FILE}')
+
+    JOBS: int = args.jobs if args.jobs is not None else io_config.get('jobs', 1)
+    logger.debug(f'JSON "io.jobs" = {JOBS}')
+
+    CACHE_DIR: str | None = (
+        abspath(join(args.json, cache_dir))
+        if (cache_dir := io_config.get('cacheDir'))
+        else None
+    )
+    logger.debug(f'JSON "io.cacheDir" = {CACHE_DIR}')
+
+    SKIP_FUNCTION_BODIES: bool = io_config.get('skipFunctionBodies', True)
+    logger.debug(f'JSON "io.skipFunctionBodies" = {SKIP_FUNCTION_BODIES}')
+
+    STREAMING: bool = io_config.get('streaming', False)
+    logger.debug(f'JSON "io.streaming" = {STREAMING}')
+
+    EXCLUDE: list[str] = io_config.get('exclude', [])
+    logger.debug(f'JSON "io.exclude" = {EXCLUDE}')
+
+    INCLUDE: list[str] = io_config.get('include', [])
+    logger.debug(f'JSON "io.include" = {INCLUDE}')
+
     logger.info('Arguments parsed successfully')
 
     # Codebase Reading
     logger.info(f'Starting codebase loading at {ROOT}')
-    data: CodebaseDict = read_codebase(ROOT)
-    logger.info('Codebase successfully loaded')
+    data: CodebaseDict
+    parsed: Iterator[tuple[FilePath, FileContract]] | None = None
+
+    if STREAMING:
+        data, parsed = stream_codebase(
+            ROOT, JOBS, CACHE_DIR, SKIP_FUNCTION_BODIES, EXCLUDE, INCLUDE
+        )
+        logger.info('Codebase successfully listed, streaming it')
+    else:
+        data = read_codebase(
+            ROOT, JOBS, CACHE_DIR, SKIP_FUNCTION_BODIES, EXCLUDE, INCLUDE
+        )
+        logger.info('Codebase successfully loaded')
 
     # Doc Generation
     logger.info('Starting final documentation generation')
@@ -114,11 +155,13 @@ def create(args: Namespace) -> None:
             readme_path=README_PATH,
             output=OUTPUT,
             codebase_nav_path=CODEBASE_NAV_PATH,
+            skip_function_bodies=SKIP_FUNCTION_BODIES,
+            parsed=parsed,
+            jobs=JOBS,
+            nav_file=NAV_FILE,
         )
         logger.info('Documentation created successfully')
 
-    except CalledProcessError as e:
-        logger.error(e)
     except FileNotFoundError:
         logger.error(f'"{args.json}" does not exists as directory')
     except PermissionError:
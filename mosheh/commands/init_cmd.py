@@ -24,12 +24,19 @@ DOCUMENTATION_JSON: Final[DocumentationJSON] = DocumentationJSON(
     logoPath='./path/to/logo.svg',
     readmePath='./path/to/README.md',
     codebaseNavPath='Codebase',
+    codebaseNavFile=None,
 )
 
 
 IO_JSON: Final[IOJSON] = IOJSON(
     rootDir='./app/',
     outputDir='./path/to/output/',
+    jobs=1,
+    cacheDir='./.mosheh_cache/',
+    skipFunctionBodies=True,
+    streaming=False,
+    exclude=[],
+    include=[],
 )
 
 
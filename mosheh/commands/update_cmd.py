@@ -8,14 +8,23 @@ logic implementation itself.
 """
 
 from argparse import Namespace
+from collections.abc import Iterator
 from json import loads
 from logging import Logger, getLogger
 from os.path import abspath, join
 from subprocess import CalledProcessError
 
-from mosheh.codebase import read_codebase
-from mosheh.doc.update import update_doc
-from mosheh.types.basic import CodebaseDict
+from mosheh.codebase import (
+    list_python_files,
+    parse_files,
+    read_codebase,
+    stream_codebase,
+)
+from mosheh.doc.update import patch_doc, update_doc
+from mosheh.git import GitChanges, get_changed_files
+from mosheh.modules import ModuleIndex, build_module_index
+from mosheh.types.basic import CodebaseDict, FilePath
+from mosheh.types.contracts import FileContract
 from mosheh.types.jsoncfg import IOJSON, DefaultJSON, DocumentationJSON
 
 
@@ -90,12 +99,96 @@ def update(args: Namespace) -> None:
     CODEBASE_NAV_PATH: str = doc_config.get('codebaseNavPath', 'Codebase')
     logger.debug(f'JSON "documentation.codebaseNavPath" = {CODEBASE_NAV_PATH}')
 
+    NAV_FILE: str | None = (
+        join(OUTPUT, nav_file)
+        if (nav_file := doc_config.get('codebaseNavFile'))
+        else None
+    )
+    logger.debug(f'JSON "documentation.codebaseNavFile" = {NAV_FILE}')
+
+    JOBS: int = args.jobs if args.jobs is not None else io_config.get('jobs', 1)
+    logger.debug(f'JSON "io.jobs" = {JOBS}')
+
+    CACHE_DIR: str | None = (
+        abspath(join(args.json, cache_dir))
+        if (cache_dir := io_config.get('cacheDir'))
+        else None
+    )
+    logger.debug(f'JSON "io.cacheDir" = {CACHE_DIR}')
+
+    SKIP_FUNCTION_BODIES: bool = io_config.get('skipFunctionBodies', True)
+    logger.debug(f'JSON "io.skipFunctionBodies" = {SKIP_FUNCTION_BODIES}')
+
+    STREAMING: bool = io_config.get('streaming', False)
+    logger.debug(f'JSON "io.streaming" = {STREAMING}')
+
+    EXCLUDE: list[str] = io_config.get('exclude', [])
+    logger.debug(f'JSON "io.exclude" = {EXCLUDE}')
+
+    INCLUDE: list[str] = io_config.get('include', [])
+    logger.debug(f'JSON "io.include" = {INCLUDE}')
+
+    SINCE: str | None = args.since
+    logger.debug(f'"--since" = {SINCE}')
+
     logger.info('Arguments parsed successfully')
 
+    # Changed Files Patching
+    if SINCE is not None:
+        logger.info(f'Starting changed files loading since "{SINCE}"')
+        try:
+            changes: GitChanges = get_changed_files(ROOT, SINCE)
+            files: list[FilePath] = list_python_files(ROOT, EXCLUDE, INCLUDE)
+            walked: set[FilePath] = set(files)
+            index: ModuleIndex = build_module_index(ROOT, files)
+            patched: bool = patch_doc(
+                parsed=parse_files(
+                    [i for i in (*changes.added, *changes.modified) if i in walked],
+                    JOBS,
+                    CACHE_DIR,
+                    SKIP_FUNCTION_BODIES,
+                    index,
+                ),
+                deleted=changes.deleted,
+                index=index,
+                root=ROOT,
+                readme_path=README_PATH,
+                output=OUTPUT,
+                codebase_nav_path=CODEBASE_NAV_PATH,
+                skip_function_bodies=SKIP_FUNCTION_BODIES,
+                jobs=JOBS,
+                nav_file=NAV_FILE,
+            )
+        except CalledProcessError as e:
+            logger.error(
+                f'Git failed listing changes since "{SINCE}": {e.stderr.strip()}'
+            )
+            return
+        except FileNotFoundError:
+            logger.error('"--since" requires Git to be installed')
+            return
+
+        if patched:
+            logger.info('Documentation updated successfully')
+            return
+
+        logger.warning('No usable manifest found, falling back to a full update')
+
     # Codebase Reading
     logger.info(f'Starting codebase loading at {ROOT}')
-    data: CodebaseDict = read_codebase(ROOT)
-    logger.info('Codebase successfully loaded')
+    data: CodebaseDict
+    parsed: Iterator[tuple[FilePath, FileContract]] | None = None
+
+    if STREAMING:
+        data, parsed = stream_codebase(
+            ROOT, JOBS, CACHE_DIR, SKIP_FUNCTION_BODIES, EXCLUDE, INCLUDE
+        )
+        logger.info('Codebase successfully listed, streaming it')
+    else:
+        data = read_codebase(
+            ROOT, JOBS, CACHE_DIR, SKIP_FUNCTION_BODIES, EXCLUDE, INCLUDE
+        )
+        logger.info('Codebase successfully loaded')
 
     # Doc Generation
     logger.info('Starting final documentation updating')
@@ -106,6 +199,10 @@ def update(args: Namespace) -> None:
             readme_path=README_PATH,
             output=OUTPUT,
             codebase_nav_path=CODEBASE_NAV_PATH,
+            skip_function_bodies=SKIP_FUNCTION_BODIES,
+            parsed=parsed,
+            jobs=JOBS,
+            nav_file=NAV_FILE,
         )
         logger.info('Documentation updated successfully')
 
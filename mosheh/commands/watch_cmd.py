@@ -0,0 +1,272 @@
+"""
+Encapsulating the `watch` command logic, this file keeps the codebase documentation
+up to date while the code is being edited.
+
+After a regular `update`, the process is kept warm - the Python files list and the
+module index loaded - waiting for changes; each burst of them, as reported by
+`mosheh.watch`, has just the touched files parsed again and their pages patched by
+`doc.update.patch_doc`, the Nav being rewritten only when files are added or removed.
+Adding or removing a module, or installing a package, may change how the imports of any
+file are classified, so then the documentation is updated as a whole.
+
+A file failing to be parsed, e.g. half-saved with a syntax error or deleted while
+being read, just keeps it's previous page until the next change fixing it; so the
+watching is never stopped by the code being edited.
+"""
+
+from argparse import Namespace
+from json import loads
+from logging import Logger, getLogger
+from os.path import abspath, exists, join
+from time import perf_counter
+
+from mosheh.codebase import MAX_CHUNKSIZE, parse_files, read_codebase
+from mosheh.doc.update import patch_doc, update_doc
+from mosheh.handlers import parse_python_file
+from mosheh.modules import ModuleIndex, build_module_index
+from mosheh.types.basic import CodebaseDict, FilePath
+from mosheh.types.contracts import FileContract
+from mosheh.types.jsoncfg import IOJSON, DefaultJSON, DocumentationJSON
+from mosheh.utils import (
+    get_codebase_prefix,
+    iter_codebase_files,
+    remove_abspath_from_codebase,
+)
+from mosheh.watch import FileChanges, watch_changes
+
+
+logger: Logger = getLogger('mosheh')
+
+
+def watch(args: Namespace) -> None:
+    """
+    Runs the Mosheh's feature for watching the codebase and patching it's documentation.
+
+    While handling the IO and data validation from the `mosheh.json` config file, just
+    like `update` does, once everything is ok, updates the documentation as a whole and
+    then patches it on every change, until interrupted.
+
+    :param args: Namespace object containing the watching information.
+    :type args: argparse.Namespace
+    :return: None
+    :rtype: None
+    """
+
+    success_json_reading: bool = False
+    doc_config: DocumentationJSON | None = None
+    io_config: IOJSON | None = None
+
+    try:
+        with open(join(args.json, 'mosheh.json'), encoding='utf-8') as f:
+            json_config: DefaultJSON = loads(f.read())
+
+        doc_config = DocumentationJSON(**json_config['documentation'])
+        io_config = IOJSON(**json_config['io'])
+
+        success_json_reading = True
+    except FileNotFoundError:
+        logger.error(f'"{args.json}" does not exists as directory')
+    except KeyError:
+        logger.error(
+            '"mosheh.json" must follow the `init` cmd struct with documentation and io'
+        )
+    except Exception as e:
+        logger.critical(f'Not implemented logic for {type(e).__name__}: {e}')
+
+    if not success_json_reading:
+        return
+
+    assert io_config and doc_config, 'io_config and doc_config must not be None'
+
+    ROOT: str = abspath(join(args.json, io_config.get('rootDir', './')))
+    logger.debug(f'JSON "io.rootDir" = {ROOT}')
+
+    OUTPUT: str = abspath(join(args.json, io_config.get('outputDir', './')))
+    logger.debug(f'JSON "io.outputDir" = {OUTPUT}')
+
+    README_PATH: str | None = doc_config.get('readmePath')
+    logger.debug(f'JSON "documentation.readmePath" = {README_PATH}')
+
+    CODEBASE_NAV_PATH: str = doc_config.get('codebaseNavPath', 'Codebase')
+    logger.debug(f'JSON "documentation.codebaseNavPath" = {CODEBASE_NAV_PATH}')
+
+    NAV_FILE: str | None = (
+        join(OUTPUT, nav_file)
+        if (nav_file := doc_config.get('codebaseNavFile'))
+        else None
+    )
+    logger.debug(f'JSON "documentation.codebaseNavFile" = {NAV_FILE}')
+
+    JOBS: int = args.jobs if args.jobs is not None else io_config.get('jobs', 1)
+    logger.debug(f'JSON "io.jobs" = {JOBS}')
+
+    CACHE_DIR: str | None = (
+        abspath(join(args.json, cache_dir))
+        if (cache_dir := io_config.get('cacheDir'))
+        else None
+    )
+    logger.debug(f'JSON "io.cacheDir" = {CACHE_DIR}')
+
+    SKIP_FUNCTION_BODIES: bool = io_config.get('skipFunctionBodies', True)
+    logger.debug(f'JSON "io.skipFunctionBodies" = {SKIP_FUNCTION_BODIES}')
+
+    EXCLUDE: list[str] = io_config.get('exclude', [])
+    logger.debug(f'JSON "io.exclude" = {EXCLUDE}')
+
+    INCLUDE: list[str] = io_config.get('include', [])
+    logger.debug(f'JSON "io.include" = {INCLUDE}')
+
+    DEBOUNCE: float = args.debounce / 1000
+    logger.debug(f'"--debounce" = {args.debounce}')
+
+    logger.info('Arguments parsed successfully')
+
+    if not exists(join(OUTPUT, 'mkdocs.yml')):
+        logger.error(f'No documentation found at "{OUTPUT}", run `create` first')
+        return
+
+    # Doc Updating
+    logger.info(f'Starting codebase loading at {ROOT}')
+    data: CodebaseDict = read_codebase(
+        ROOT, JOBS, CACHE_DIR, SKIP_FUNCTION_BODIES, EXCLUDE, INCLUDE
+    )
+    prefix: FilePath = get_codebase_prefix(data)
+    files: set[FilePath] = {
+        join(prefix, i)
+        for i, _ in iter_codebase_files(remove_abspath_from_codebase(data))
+    }
+    index: ModuleIndex = build_module_index(ROOT, files)
+
+    update_doc(
+        codebase=data,
+        root=ROOT,
+        readme_path=README_PATH,
+        output=OUTPUT,
+        codebase_nav_path=CODEBASE_NAV_PATH,
+        skip_function_bodies=SKIP_FUNCTION_BODIES,
+        jobs=JOBS,
+        nav_file=NAV_FILE,
+    )
+    logger.info('Documentation updated successfully')
+
+    # Changes Watching
+    logger.info(f'Watching {ROOT} for changes, press Ctrl+C to stop')
+    try:
+        for changes in watch_changes(ROOT, files, EXCLUDE, INCLUDE, DEBOUNCE):
+            start: float = perf_counter()
+            touched: list[FilePath] = [*changes.added, *changes.modified]
+            jobs: int = JOBS if len(touched) > MAX_CHUNKSIZE else 1
+
+            if changes.added or changes.deleted:
+                files.difference_update(changes.deleted)
+                files.update(changes.added)
+                index = build_module_index(ROOT, files)
+
+            _log_changes(changes)
+
+            try:
+                if not patch_doc(
+                    parsed=_parse_changes(
+                        touched, jobs, CACHE_DIR, SKIP_FUNCTION_BODIES, index
+                    ),
+                    deleted=changes.deleted,
+                    index=index,
+                    root=ROOT,
+                    readme_path=README_PATH,
+                    output=OUTPUT,
+                    codebase_nav_path=CODEBASE_NAV_PATH,
+                    skip_function_bodies=SKIP_FUNCTION_BODIES,
+                    jobs=jobs,
+                    nav_file=NAV_FILE,
+                ):
+                    logger.info('Modules changed, updating the whole documentation')
+                    update_doc(
+                        codebase=read_codebase(
+                            ROOT,
+                            JOBS,
+                            CACHE_DIR,
+                            SKIP_FUNCTION_BODIES,
+                            EXCLUDE,
+                            INCLUDE,
+                        ),
+                        root=ROOT,
+                        readme_path=README_PATH,
+                        output=OUTPUT,
+                        codebase_nav_path=CODEBASE_NAV_PATH,
+                        skip_function_bodies=SKIP_FUNCTION_BODIES,
+                        jobs=JOBS,
+                        nav_file=NAV_FILE,
+                    )
+            except Exception as e:
+                logger.error(f'Documentation not patched: {type(e).__name__}: {e}')
+                continue
+
+            logger.info(
+                f'Documentation patched in {(perf_counter() - start) * 1000:.0f}ms'
+            )
+    except KeyboardInterrupt:
+        logger.info('Watching stopped')
+
+
+def _log_changes(changes: FileChanges) -> None:
+    """
+    Logs how many files were added, modified and deleted on a burst of changes.
+
+    :param changes: The changed files, from `watch.watch_changes`.
+    :type changes: FileChanges
+    :return: None
+    :rtype: None
+    """
+
+    logger.info(
+        f'Changes: {len(changes.added)} added, {len(changes.modified)} modified, '
+        f'{len(changes.deleted)} deleted'
+    )
+
+
+def _parse_changes(
+    files: list[FilePath],
+    jobs: int,
+    cache_dir: str | None,
+    skip_function_bodies: bool,
+    index: ModuleIndex,
+) -> list[tuple[FilePath, FileContract]]:
+    """
+    Parses the changed files, leaving out, and logging, the ones failing to be parsed.
+
+    The batch is parsed at once by `codebase.parse_files`; if any file fails, it's
+    parsed again one by one, so just the failing files are left out, keeping their
+    previous pages, while every other one is still patched.
+
+    :param files: The added and modified files absolute paths.
+    :type files: list[FilePath]
+    :param jobs: Number of processes parsing files.
+    :type jobs: int
+    :param cache_dir: Dir of the parsing cache, `None` for disabling it.
+    :type cache_dir: str | None
+    :param skip_function_bodies: If the statements inside functions are left out.
+    :type skip_function_bodies: bool
+    :param index: The project module index, for classifying the imports.
+    :type index: ModuleIndex
+    :return: Each file parsed successfully paired with it's statements.
+    :rtype: list[tuple[FilePath, FileContract]]
+    """
+
+    try:
+        return list(parse_files(files, jobs, cache_dir, skip_function_bodies, index))
+    except (SyntaxError, ValueError, OSError):
+        pass
+
+    parsed: list[tuple[FilePath, FileContract]] = []
+
+    for file in files:
+        try:
+            parsed.append(
+                (file, parse_python_file(file, cache_dir, skip_function_bodies, index))
+            )
+        except (SyntaxError, ValueError, OSError) as e:
+            logger.error(
+                f'{file} not parsed, the previous page is kept: {type(e).__name__}: {e}'
+            )
+
+    return parsed
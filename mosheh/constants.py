@@ -6,20 +6,22 @@ development and documentation process.
 
 The constants defined here are:
 
-1. `BUILTIN_MODULES`: A comprehensive `sorted` object of Python's built-in modules for
-    reference or validation purposes.
+1. `BUILTIN_MODULES`: A `frozenset` of Python's built-in modules for reference or
+    validation purposes.
 
-2. `BUILTIN_FUNCTIONS`: A `sorted` object of Python's built-in functions to support
+2. `BUILTIN_FUNCTIONS`: A `frozenset` of Python's built-in functions to support
     validation, documentation or tooling needs.
 
-3. `BUILTIN_DUNDER_METHODS`: A `sorted` object commonly used double-underscore (dunder)
+3. `BUILTIN_DUNDER_METHODS`: A `frozenset` of commonly used double-underscore (dunder)
     methods in Python, aiding in validation or documentation.
 
-4. `ACCEPTABLE_LOWER_CONSTANTS`: Lowercase constants acceptable in the project to
-    enforce naming conventions.
+4. `ACCEPTABLE_LOWER_CONSTANTS`: A `frozenset` of lowercase constants acceptable in the
+    project to enforce naming conventions.
 
 5. `DEFAULT_MKDOCS_YML`: A template for MkDocs configuration using the Material theme,
     with custom settings for a consistent and professional documentation structure.
+    Along with `DEFAULT_INDEX_MD`, the placeholder homepage, it makes the whole project
+    skeleton, written without calling `mkdocs new`.
 
 6. Markdown Templates:
     * Files (`FILE_MARKDOWN`)
@@ -29,6 +31,12 @@ The constants defined here are:
     * Functions (`FUNCTION_DEF_MD_STRUCT`)
     * Assertions (`ASSERT_MD_STRUCT`)
 
+    Each one is also precompiled by `compile_template`, e.g. `IMPORT_MD_TEMPLATE`, into
+    the form the renderer actually fills.
+
+The builtins tables - the first three ones - are computed from the running interpreter
+itself, and only on their first access, not when importing this module.
+
 These constants can be imported and reused wherever needed in the project. Be careful
 when updating this file to maintain consistency across the project. Remember that this
 file should remain immutable during runtime and utilize Python's `typing.Final` type
@@ -36,55 +44,110 @@ hint to mark constants as non-overridable.
 """
 
 import builtins
+import re
+import sys
+from collections.abc import Callable
+from functools import cache
 from inspect import isclass
-from sys import version_info
 from types import BuiltinFunctionType
 from typing import Final
 
-from stdlib_list import stdlib_list
 
+@cache
+def _builtin_modules() -> frozenset[str]:
+    """
+    Lists every stdlib and builtin module of the running interpreter.
 
-BUILTIN_MODULES: Final[list[str]] = sorted(
-    stdlib_list(f'{version_info.major}.{version_info.minor}')
-)
+    Taken from `sys.stdlib_module_names` and `sys.builtin_module_names`, so it's exactly
+    what `modules.build_module_map` classifies as native.
+
+    :return: The stdlib modules top-level names.
+    :rtype: frozenset[str]
+    """
+
+    return frozenset(sys.stdlib_module_names) | frozenset(sys.builtin_module_names)
+
+
+@cache
+def _builtin_functions() -> frozenset[str]:
+    """
+    Scans `builtins` for it's functions and non-exception types, such as `len` or `int`.
 
-BUILTIN_FUNCTIONS: Final[list[str]] = sorted(
-    name
-    for name in dir(builtins)
-    if (obj := getattr(builtins, name)) is not None
-    and (
-        isinstance(obj, BuiltinFunctionType)
-        or (isinstance(obj, type) and not issubclass(obj, BaseException))
+    :return: The builtin functions names.
+    :rtype: frozenset[str]
+    """
+
+    return frozenset(
+        name
+        for name in dir(builtins)
+        if (obj := getattr(builtins, name)) is not None
+        and (
+            isinstance(obj, BuiltinFunctionType)
+            or (isinstance(obj, type) and not issubclass(obj, BaseException))
+        )
     )
-)
 
-BUILTIN_DUNDER_METHODS: Final[list[str]] = sorted(
-    {
+
+@cache
+def _builtin_dunder_methods() -> frozenset[str]:
+    """
+    Scans every `builtins` class for it's dunder attributes, such as `__init__`.
+
+    :return: The dunder methods names.
+    :rtype: frozenset[str]
+    """
+
+    return frozenset(
         attr
         for name in dir(builtins)
         if (cls := getattr(builtins, name)) is not None and isclass(cls)
         for attr in dir(cls)
         if attr.startswith('__') and attr.endswith('__')
-    }
-)
+    )
+
+
+LAZY_CONSTANTS: Final[dict[str, Callable[[], frozenset[str]]]] = {
+    'BUILTIN_MODULES': _builtin_modules,
+    'BUILTIN_FUNCTIONS': _builtin_functions,
+    'BUILTIN_DUNDER_METHODS': _builtin_dunder_methods,
+}
+
+
+def __getattr__(name: str) -> frozenset[str]:
+    """
+    Computes the builtins tables on their first access, instead of on import.
+
+    :param name: The constant name, e.g. `'BUILTIN_MODULES'`.
+    :type name: str
+    :return: The constant value.
+    :rtype: frozenset[str]
+    """
+
+    if name not in LAZY_CONSTANTS:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    return LAZY_CONSTANTS[name]()
+
 
-ACCEPTABLE_LOWER_CONSTANTS: Final[tuple[str, ...]] = (
-    '__author__',
-    '__copyright__',
-    '__credits__',
-    '__date__',
-    '__email__',
-    '__keywords__',
-    '__license__',
-    '__maintainer__',
-    '__repository__',
-    '__status__',
-    '__version__',
-    'app',
-    'app_name',
-    'application',
-    'main',
-    'urlpatterns',
+ACCEPTABLE_LOWER_CONSTANTS: Final[frozenset[str]] = frozenset(
+    {
+        '__author__',
+        '__copyright__',
+        '__credits__',
+        '__date__',
+        '__email__',
+        '__keywords__',
+        '__license__',
+        '__maintainer__',
+        '__repository__',
+        '__status__',
+        '__version__',
+        'app',
+        'app_name',
+        'application',
+        'main',
+        'urlpatterns',
+    }
 )
 
 DEFAULT_MKDOCS_YML: Final[str] = """site_name: {proj_name}
@@ -205,7 +268,7 @@ plugins:
       enabled: true
       fallback_to_build_date: true
       locale: en
-
+{mosheh_plugin}
 
 extra:
   tags:
@@ -233,6 +296,25 @@ nav:
 
 """
 
+DEFAULT_INDEX_MD: Final[str] = """# Welcome to MkDocs
+
+For full documentation visit [mkdocs.org](https://www.mkdocs.org).
+
+## Commands
+
+* `mkdocs new [dir-name]` - Create a new project.
+* `mkdocs serve` - Start the live-reloading docs server.
+* `mkdocs build` - Build the documentation site.
+* `mkdocs -h` - Print help message and exit.
+
+## Project layout
+
+    mkdocs.yml    # The configuration file.
+    docs/
+        index.md  # The documentation homepage.
+        ...       # Other markdown pages, images and other files.
+"""
+
 FILE_MARKDOWN: Final[str] = """# File: `{filename}`
 
 Role: {role}
@@ -355,3 +437,41 @@ Message: `#!py {msg}`
     ```
 
 """
+
+
+def compile_template(template: str) -> str:
+    """
+    Turns a `str.format` Markdown template into a `%` one, keyed by the same fields.
+
+    Filling a `%` template from a dict skips parsing the format specs and the keyword
+    arguments on every call, which adds up when rendering thousands of statements.
+
+    Example:
+
+    ```python
+    compile_template('### `#!py import {name}` - 100%')
+    # '### `#!py import %(name)s` - 100%%'
+    compile_template('### `#!py import {name}`') % {'name': 'os'}
+    # '### `#!py import os`'
+    ```
+
+    :param template: The template, with plain `{field}` replacement fields only.
+    :type template: str
+    :return: The equivalent `%` template.
+    :rtype: str
+    """
+
+    return re.sub(r'\{(\w+)\}', r'%(\1)s', template.replace('%', '%%'))
+
+
+FILE_MD_TEMPLATE: Final[str] = compile_template(FILE_MARKDOWN)
+
+IMPORT_MD_TEMPLATE: Final[str] = compile_template(IMPORT_MD_STRUCT)
+
+ASSIGN_MD_TEMPLATE: Final[str] = compile_template(ASSIGN_MD_STRUCT)
+
+CLASS_DEF_MD_TEMPLATE: Final[str] = compile_template(CLASS_DEF_MD_STRUCT)
+
+FUNCTION_DEF_MD_TEMPLATE: Final[str] = compile_template(FUNCTION_DEF_MD_STRUCT)
+
+ASSERT_MD_TEMPLATE: Final[str] = compile_template(ASSERT_MD_STRUCT)
@@ -11,15 +11,32 @@ all using internal calls for functions such as `process_codebase` and
 `get_update_set_nav`.
 """
 
-import subprocess
+from collections.abc import Iterable
 from logging import Logger, getLogger
 from os import makedirs, path
 from shutil import copy2
 
-from mosheh.constants import DEFAULT_MKDOCS_YML
-from mosheh.doc.shared import get_update_set_nav, process_codebase, write_homepage
+from mosheh.constants import DEFAULT_INDEX_MD, DEFAULT_MKDOCS_YML
+from mosheh.doc.manifest import (
+    ManifestEntry,
+    diff_manifest,
+    manifest_key,
+    save_manifest,
+)
+from mosheh.doc.shared import (
+    get_update_set_nav,
+    process_codebase,
+    process_files,
+    write_homepage,
+)
+from mosheh.modules import ModuleIndex, build_module_index
 from mosheh.types.basic import CodebaseDict, FilePath
-from mosheh.utils import remove_abspath_from_codebase
+from mosheh.types.contracts import FileContract
+from mosheh.utils import (
+    get_codebase_prefix,
+    iter_codebase_files,
+    remove_abspath_from_codebase,
+)
 
 
 logger: Logger = getLogger('mosheh')
@@ -38,6 +55,10 @@ def create_doc(
     repo_url: str = 'https://github.com',
     codebase_nav_path: str = 'Codebase',
     site_url: str = 'https://lucasgoncsilva.github.io/mosheh',
+    skip_function_bodies: bool = True,
+    parsed: Iterable[tuple[FilePath, FileContract]] | None = None,
+    jobs: int = 1,
+    nav_file: str | None = None,
 ) -> None:
     """
     Generates a documentation for a Python codebase using MkDocs.
@@ -53,8 +74,14 @@ def create_doc(
       and their stmts.
     - Configuration: Builds a `mkdocs.yml` configuration file with project details,
       including repository information and editing URI.
-    - Homepage: If `readme_path` is provided, so the `index.md` file provided by MkDocs
+    - Homepage: If `readme_path` is provided, so the placeholder `index.md` file
       is overwriten by the `README.md` found at provided `readme_path` file.
+    - Manifest: Writes the `doc.manifest` of every page rendered, so the next `update`
+      only renders what changed.
+    - Streaming: If `parsed` is provided, `codebase` is just it's path tree, as from
+      `codebase.stream_codebase`, and each file page is written as soon as it's parsed.
+    - Nav File: If `nav_file` is provided, the codebase Nav section is written there,
+      read by the `mosheh` MkDocs plugin enabled on `mkdocs.yml`, instead of on it.
 
     :param codebase: Dict containing nodes representing `.py` files and their stmts.
     :type codebase: CodebaseDict
@@ -79,6 +106,14 @@ def create_doc(
     :type codebase_nav_path: str = 'Codebase'
     :param site_url: URL of the documentation website
     :type site_url: str = 'https://lucasgoncsilva.github.io/mosheh'
+    :param skip_function_bodies: If the codebase was read without function bodies.
+    :type skip_function_bodies: bool = True
+    :param parsed: Each file path paired with it's stmts, for streaming them.
+    :type parsed: Iterable[tuple[FilePath, FileContract]] | None = None
+    :param jobs: Number of processes rendering pages, less than 1 meaning all CPUs.
+    :type jobs: int = 1
+    :param nav_file: Separate file holding the codebase Nav section, if any.
+    :type nav_file: str | None = None
     :return: None
     :rtype: None
     """
@@ -87,19 +122,9 @@ def create_doc(
     output_path: str = path.abspath(output)
     mkdocs_yml: str = path.join(output_path, 'mkdocs.yml')
 
-    try:
-        logger.info('Running MkDocs project')
-        result = subprocess.run(
-            ['mkdocs', 'new', output_path],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        logger.debug(f'\t{result.stdout}' or '\tNo MkDocs output')
-        logger.info('MkDocs project created')
-    except subprocess.CalledProcessError as e:
-        logger.error(f'Error: {e.stderr}')
-        raise e
+    logger.info('Creating MkDocs project')
+    _create_project_skeleton(output_path)
+    logger.info('MkDocs project created')
 
     logger.info('Creating default "mkdocs.yml"')
     _create_default_mkdocs(
@@ -112,21 +137,85 @@ def create_doc(
         repo_url,
         codebase_nav_path,
         site_url,
+        nav_file,
     )
     logger.info('Default "mkdocs.yml" created')
 
     logger.info('Processing codebase')
-    process_codebase(clean_codebase, root, output, codebase_nav_path=codebase_nav_path)
+    prefix: FilePath = get_codebase_prefix(codebase)
+    index: ModuleIndex = build_module_index(
+        root, (path.join(prefix, i) for i, _ in iter_codebase_files(clean_codebase))
+    )
+    files: dict[FilePath, ManifestEntry] = diff_manifest(
+        iter_codebase_files(clean_codebase),
+        prefix,
+        output_path,
+        {},
+        codebase_nav_path,
+    )[0]
+
+    written: int
+
+    if parsed is None:
+        written = process_codebase(
+            clean_codebase,
+            root,
+            output,
+            codebase_nav_path=codebase_nav_path,
+            jobs=jobs,
+        )
+    else:
+        written = process_files(
+            parsed,
+            (i for i, _ in iter_codebase_files(clean_codebase)),
+            prefix,
+            root,
+            output,
+            codebase_nav_path,
+        )
+
+    save_manifest(
+        output_path,
+        manifest_key(codebase_nav_path, skip_function_bodies, index),
+        prefix,
+        files,
+    )
+    logger.info(f'Pages: {written} of {len(files)} written')
     logger.info('Codebase processed successfully')
 
     logger.info('Getting and updating Nav')
-    get_update_set_nav(mkdocs_yml, clean_codebase, codebase_nav_path)
-    logger.debug('\tNav addeded to mkdocs.yml')
+    get_update_set_nav(mkdocs_yml, clean_codebase, codebase_nav_path, nav_file)
+    logger.debug(f'\tNav addeded to {nav_file or mkdocs_yml}')
 
     if readme_path:
         write_homepage(output_path, readme_path)
 
 
+def _create_project_skeleton(output_path: FilePath) -> None:
+    """
+    Creates the MkDocs project skeleton, the same one as `mkdocs new` does.
+
+    Instead of running MkDocs on a subprocess, just for the `mkdocs.yml` written by it
+    to be overwriten right after, the `docs/` dir and it's placeholder `index.md` are
+    created right here. An already existing homepage is kept, as MkDocs keeps it too.
+
+    :param output_path: Absolute path of the documentation output.
+    :type output_path: FilePath
+    :return: None
+    :rtype: None
+    """
+
+    docs_path: FilePath = path.join(output_path, 'docs')
+    index_md: FilePath = path.join(docs_path, 'index.md')
+
+    makedirs(docs_path, exist_ok=True)
+
+    if not path.exists(index_md):
+        with open(index_md, 'w', encoding='utf-8') as f:
+            f.write(DEFAULT_INDEX_MD)
+        logger.debug(f'\t{index_md} created')
+
+
 def _create_default_mkdocs(
     mkdocs_yml: FilePath,
     output: str,
@@ -137,6 +226,7 @@ def _create_default_mkdocs(
     repo_url: str = 'https://github.com',
     codebase_nav_path: str = 'Codebase',
     site_url: str = 'https://lucasgoncsilva.github.io/mosheh',
+    nav_file: str | None = None,
 ) -> None:
     with open(mkdocs_yml, 'w', encoding='utf-8') as f:
         f.write(
@@ -149,6 +239,7 @@ def _create_default_mkdocs(
                 repo_url=repo_url,
                 codebase_nav_path=codebase_nav_path,
                 site_url=site_url,
+                nav_file=nav_file,
             )
         )
 
@@ -163,6 +254,7 @@ def _default_doc_config(
     repo_name: str = 'GitHub',
     repo_url: str = 'https://github.com/',
     codebase_nav_path: str = 'Codebase',
+    nav_file: str | None = None,
 ) -> str:
     """
     Generates the default configuration for an MkDocs documentation project.
@@ -191,6 +283,11 @@ def _default_doc_config(
     :type site_url: str = 'https://lucasgoncsilva.github.io/mosheh'
     :param repo_url: The URL of the repository, used for linking in the documentation.
     :type repo_url: str
+    :param codebase_nav_path: Expected codebase nav name to be used/found.
+    :type codebase_nav_path: str = 'Codebase'
+    :param nav_file: Separate file holding the codebase Nav section, enabling the
+        `mosheh` plugin for reading it.
+    :type nav_file: str | None = None
     :return: Formatted MkDocs YAML configuration.
     :rtype: str
     """
@@ -215,6 +312,12 @@ def _default_doc_config(
     else:
         new_logo_path = 'https://squidfunk.github.io/mkdocs-material/assets/favicon.png'
 
+    mosheh_plugin: str = ''
+
+    if nav_file:
+        rel_nav_file: str = path.relpath(nav_file, path.abspath(output))
+        mosheh_plugin = f'  - mosheh:\n      nav_file: {rel_nav_file}\n'
+
     return DEFAULT_MKDOCS_YML.format(
         proj_name=proj_name,
         site_url=site_url,
@@ -223,4 +326,5 @@ def _default_doc_config(
         repo_url=repo_url,
         logo_path=new_logo_path,
         codebase_nav_path=codebase_nav_path,
+        mosheh_plugin=mosheh_plugin,
     )
@@ -0,0 +1,319 @@
+"""
+Keeps track of which Markdown page was generated from which source file, allowing the
+`update` command to work incrementally.
+
+The manifest is a JSON file written next to the `docs/` dir, mapping each source file,
+relative to the codebase, to it's fingerprint and output page:
+
+```json
+{
+  "key": "5d1c...9f",
+  "prefix": "../..",
+  "files": {
+    "PROJECT/manage.py": {
+      "mtime": 1729000000000000000,
+      "size": 663,
+      "hash": "a0c4...7b",
+      "page": "docs/Codebase/PROJECT/manage.py.md"
+    }
+  }
+}
+```
+
+The `prefix` is the dir the source paths are relative to, itself relative to the
+documentation output, so the manifest keeps working if the whole project is moved.
+
+The `key` changes with the Mosheh, Python and handler versions, the handler options,
+the codebase nav path, the installed packages and the project modules, since any of
+them may change the pages for the same sources - e.g. a new `src/yaml.py` turns every
+`import yaml` into a local one; when it does not match, the whole manifest is discarded
+and every page is rendered again.
+
+When comparing the current codebase against the manifest, each parsed file entry is
+taken from it's `SourceStamp`, fingerprinting the very bytes it was parsed from, so the
+manifest always matches what was rendered and no file is read twice. For files not
+parsed yet, e.g. when streaming, the content hash is only recomputed if the file
+`mtime` or `size` changed, so a no-op run costs one `stat` call per source file.
+"""
+
+from collections.abc import Iterable
+from hashlib import sha256
+from json import JSONDecodeError, dumps, loads
+from logging import Logger, getLogger
+from os import path, remove, rmdir, stat, stat_result
+from typing import Final, NamedTuple, TypedDict
+
+from mosheh.cache import cache_key
+from mosheh.handlers.python import handler_salt
+from mosheh.modules import ModuleIndex, module_map_fingerprint
+from mosheh.types.basic import FilePath
+from mosheh.types.contracts import FileContract, SourceStamp
+
+
+logger: Logger = getLogger('mosheh')
+
+
+MANIFEST_FILE: Final[str] = '.mosheh_manifest.json'
+
+
+class ManifestEntry(TypedDict):
+    """Typed-Dict class to ensure right typing for each manifest file entry."""
+
+    mtime: int
+    size: int
+    hash: str
+    page: FilePath
+
+
+class ManifestJSON(TypedDict):
+    """Typed-Dict class to ensure right typing for the manifest file itself."""
+
+    key: str
+    prefix: FilePath
+    files: dict[FilePath, ManifestEntry]
+
+
+class ManifestDiff(NamedTuple):
+    """Source files, relative to the codebase, grouped by what happened to them."""
+
+    added: list[FilePath]
+    changed: list[FilePath]
+    removed: list[FilePath]
+    unchanged: list[FilePath]
+
+
+def manifest_key(
+    codebase_nav_path: str = 'Codebase',
+    skip_function_bodies: bool = True,
+    index: ModuleIndex | None = None,
+) -> str:
+    """
+    Builds the key identifying which manifests are still valid for this execution.
+
+    Unlike the parse cache key, it includes the installed packages and the project
+    modules set, as the imports categories rendered on every page depend on them.
+
+    :param codebase_nav_path: Expected codebase nav name to be used/found.
+    :type codebase_nav_path: str = 'Codebase'
+    :param skip_function_bodies: If the statements inside functions were left out.
+    :type skip_function_bodies: bool = True
+    :param index: The project module index, the imports were classified with.
+    :type index: ModuleIndex | None = None
+    :return: The manifest key.
+    :rtype: str
+    """
+
+    return cache_key(
+        codebase_nav_path.encode(),
+        handler_salt(skip_function_bodies),
+        module_map_fingerprint(),
+        '\0'.join(sorted(index.modules)) if index is not None else '',
+    )
+
+
+def load_manifest(output: FilePath, key: str) -> ManifestJSON | None:
+    """
+    Reads the manifest file at the output dir.
+
+    If there is no manifest, it's unreadable or it's key does not match the expected
+    one, `None` is returned, leading every page to be rendered again.
+
+    :param output: Path for documentation output, where the manifest lives.
+    :type output: FilePath
+    :param key: The expected manifest key, from `manifest_key`.
+    :type key: str
+    :return: The manifest itself, with an absolute prefix, or `None` if unusable.
+    :rtype: ManifestJSON | None
+    """
+
+    try:
+        with open(path.join(output, MANIFEST_FILE), encoding='utf-8') as f:
+            manifest: ManifestJSON = loads(f.read())
+    except FileNotFoundError:
+        logger.debug('\tNo manifest found, rendering every page')
+        return None
+    except (OSError, JSONDecodeError) as e:
+        logger.warning(f'Ignoring unreadable manifest: {e}')
+        return None
+
+    if manifest.get('key') != key:
+        logger.debug('\tOutdated manifest, rendering every page')
+        return None
+
+    manifest['prefix'] = path.normpath(path.join(output, manifest['prefix']))
+
+    return manifest
+
+
+def save_manifest(
+    output: FilePath,
+    key: str,
+    prefix: FilePath,
+    files: dict[FilePath, ManifestEntry],
+) -> None:
+    """
+    Writes the manifest file at the output dir.
+
+    :param output: Path for documentation output, where the manifest lives.
+    :type output: FilePath
+    :param key: The manifest key, from `manifest_key`.
+    :type key: str
+    :param prefix: Dir the relative source paths are based on.
+    :type prefix: FilePath
+    :param files: The manifest entries, keyed by source file relative path.
+    :type files: dict[FilePath, ManifestEntry]
+    :return: None
+    :rtype: None
+    """
+
+    manifest: ManifestJSON = {
+        'key': key,
+        'prefix': path.relpath(prefix, output),
+        'files': files,
+    }
+
+    with open(path.join(output, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        f.write(dumps(manifest, indent=2))
+
+    logger.debug(f'\tManifest written with {len(files)} files')
+
+
+def diff_manifest(
+    sources: Iterable[tuple[FilePath, FileContract]],
+    prefix: FilePath,
+    output: FilePath,
+    previous: dict[FilePath, ManifestEntry],
+    codebase_nav_path: str = 'Codebase',
+) -> tuple[dict[FilePath, ManifestEntry], ManifestDiff]:
+    """
+    Compares the current source files against the previous manifest entries.
+
+    For each source file, relative to `prefix`, builds it's new manifest entry and
+    classifies it as added, changed or unchanged; a file is unchanged only if it's
+    content hash is the same and it's page still exists. Every previous entry not
+    found anymore is classified as removed.
+
+    Each source comes with it's record, as from `utils.iter_codebase_files`; if parsed
+    already, the entry is it's `SourceStamp`, otherwise the file is fingerprinted from
+    disk, as for the empty lists of a path tree.
+
+    :param sources: Source files paths, relative to `prefix`, paired with their records.
+    :type sources: Iterable[tuple[FilePath, FileContract]]
+    :param prefix: Dir the relative source paths are based on.
+    :type prefix: FilePath
+    :param output: Path for documentation output.
+    :type output: FilePath
+    :param previous: The previous manifest entries, from `load_manifest`.
+    :type previous: dict[FilePath, ManifestEntry]
+    :param codebase_nav_path: Expected codebase nav name to be used/found.
+    :type codebase_nav_path: str = 'Codebase'
+    :return: The new manifest entries and the files classification.
+    :rtype: tuple[dict[FilePath, ManifestEntry], ManifestDiff]
+    """
+
+    current: dict[FilePath, ManifestEntry] = {}
+    diff: ManifestDiff = ManifestDiff([], [], [], [])
+
+    for source, record in sources:
+        old: ManifestEntry | None = previous.get(source)
+        entry: ManifestEntry = _build_entry(
+            path.join(prefix, source),
+            path.join('docs', codebase_nav_path, f'{source}.md'),
+            old,
+            record.stamp if isinstance(record, FileContract) else None,
+        )
+        current[source] = entry
+
+        if old is None:
+            diff.added.append(source)
+        elif old['hash'] != entry['hash'] or not path.exists(
+            path.join(output, entry['page'])
+        ):
+            diff.changed.append(source)
+        else:
+            diff.unchanged.append(source)
+
+    diff.removed.extend(i for i in previous if i not in current)
+
+    return current, diff
+
+
+def remove_pages(output: FilePath, pages: Iterable[FilePath]) -> None:
+    """
+    Deletes orphaned pages, pruning the dirs left empty up to the `docs/` one.
+
+    :param output: Path for documentation output.
+    :type output: FilePath
+    :param pages: The pages paths, relative to `output`.
+    :type pages: Iterable[FilePath]
+    :return: None
+    :rtype: None
+    """
+
+    docs_path: FilePath = path.join(output, 'docs')
+
+    for page in pages:
+        page_path: FilePath = path.join(output, page)
+
+        try:
+            remove(page_path)
+            logger.debug(f'\tRemoved orphaned page "{page}"')
+        except FileNotFoundError:
+            continue
+
+        folder_path: FilePath = path.dirname(page_path)
+
+        while folder_path.startswith(docs_path) and folder_path != docs_path:
+            try:
+                rmdir(folder_path)
+            except OSError:
+                break
+
+            folder_path = path.dirname(folder_path)
+
+
+def _build_entry(
+    source: FilePath,
+    page: FilePath,
+    previous: ManifestEntry | None,
+    stamp: SourceStamp | None = None,
+) -> ManifestEntry:
+    """
+    Fingerprints a source file, reusing the previous hash when `mtime` and `size` match.
+
+    With the `stamp` of the parsed bytes, nothing is read at all. Otherwise, the file
+    is `stat`ed before being read, so a change while hashing it is still caught by the
+    next run, by it's `mtime`.
+
+    :param source: The source file path.
+    :type source: FilePath
+    :param page: The page path, relative to the documentation output.
+    :type page: FilePath
+    :param previous: The previous manifest entry for this file, if any.
+    :type previous: ManifestEntry | None
+    :param stamp: The fingerprint of the bytes the file was parsed from, if any.
+    :type stamp: SourceStamp | None = None
+    :return: The file manifest entry.
+    :rtype: ManifestEntry
+    """
+
+    if stamp is not None:
+        return ManifestEntry(
+            mtime=stamp.mtime, size=stamp.size, hash=stamp.hash, page=page
+        )
+
+    st: stat_result = stat(source)
+
+    if (
+        previous is not None
+        and previous['mtime'] == st.st_mtime_ns
+        and previous['size'] == st.st_size
+    ):
+        file_hash: str = previous['hash']
+    else:
+        with open(source, 'rb') as f:
+            file_hash = sha256(f.read()).hexdigest()
+
+    return ManifestEntry(
+        mtime=st.st_mtime_ns, size=st.st_size, hash=file_hash, page=page
+    )
@@ -2,158 +2,414 @@
 Containing the logic and functions shared between the commands, more specifically the
 logic and functions related to documentation creation/updating.
 
-Two main functions are defined and exported here:
+The main functions defined and exported here are:
 
 - `process_codebase`: Recursively processes a codebase and generates documentation for
     each file.
+- `process_files`: Generates the documentation of each file as soon as it's parsed,
+    for streaming the codebase instead of holding it whole.
+- `render_pages`: Renders every file page without writing any, for serving them
+    straight from memory, as the MkDocs plugin does.
+- `plan_output_dirs` and `make_output_dirs`: List the output dirs of every page and
+    create them, once each, before any page is written.
 - `get_update_set_nav`: Sets the `mkdocs.yml` Nav "Codebase" section to the current
-    state, updating it.
+    state, updating it just if changed, or writes it to it's own separate file.
 
 Every other function is a private/internal one, being called only for the other ones
 from this same file; this is to keep the logic in the same space, while keeping the
 code base less confusing.
 """
 
+from collections.abc import Collection, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from json import dumps
 from logging import Logger, getLogger
-from os import makedirs, path, sep
-from typing import Any, cast
+from os import cpu_count, linesep, makedirs, mkdir, path, sep, stat
+from typing import Any, Final, cast
 
 from yaml import CDumper, CLoader, dump, load
 
+from mosheh.codebase import MAX_CHUNKSIZE
 from mosheh.constants import (
-    ASSERT_MD_STRUCT,
-    ASSIGN_MD_STRUCT,
-    CLASS_DEF_MD_STRUCT,
-    FILE_MARKDOWN,
-    FUNCTION_DEF_MD_STRUCT,
-    IMPORT_MD_STRUCT,
+    ASSERT_MD_TEMPLATE,
+    ASSIGN_MD_TEMPLATE,
+    CLASS_DEF_MD_TEMPLATE,
+    FILE_MD_TEMPLATE,
+    FUNCTION_DEF_MD_TEMPLATE,
+    IMPORT_MD_TEMPLATE,
 )
 from mosheh.types.basic import (
     Annotation,
-    Args,
     AssertionMessage,
     AssertionTest,
     CodeSnippet,
     CodebaseDict,
     Decorator,
-    Docstring,
     FilePath,
     ImportedIdentifier,
     Inheritance,
     Kwargs,
     ModuleName,
     ModulePath,
-    StandardReturn,
     Token,
     Value,
 )
+from mosheh.types.contracts import (
+    AnnAssignContract,
+    AssertContract,
+    AssignContract,
+    AsyncFunctionDefContract,
+    ClassDefContract,
+    FileContract,
+    FileMetaContract,
+    FunctionDefContract,
+    ImportContract,
+    ImportFromContract,
+)
 from mosheh.types.enums import (
-    FileRole,
     FunctionType,
     ImportType,
-    Statement,
 )
-from mosheh.utils import build_nav_struct, indent_code
+from mosheh.utils import (
+    build_nav_struct,
+    indent_code,
+    iter_codebase_files,
+    walk_codebase,
+)
 
 
 logger: Logger = getLogger('mosheh')
 
+WRITE_WORKERS: Final[int] = 4
+
+EMPTY_SECTIONS: Final[dict[str, str]] = {
+    'imports': '!!! info "NO IMPORT DEFINED HERE"',
+    'constants': '!!! info "NO CONSTANT DEFINED HERE"',
+    'classes': '!!! info "NO CLASS DEFINED HERE"',
+    'functions': '!!! info "NO FUNCTION DEFINED HERE"',
+    'assertions': '!!! info "NO ASSERT DEFINED HERE"',
+}
+
 
 def process_codebase(
-    codebase: dict[str, CodebaseDict] | dict[str, list[StandardReturn]],
+    codebase: dict[str, CodebaseDict] | dict[str, FileContract],
     root: str,
     exit: str,
     basedir: str = '',
     codebase_nav_path: str = 'Codebase',
-) -> None:
+    only: Collection[FilePath] | None = None,
+    jobs: int = 1,
+) -> int:
     """
     Recursively processes a codebase and generates documentation for each file.
 
     This function traverses a codebase structure, processes each file's statements
     and generates corresponding Markdown documentation. The documentation is written
     to the specified output directory. If some file contains nested dictionaries,
-    the function recursively processes each nested level.
+    the function goes through each nested level, following `utils.iter_codebase_files`.
 
     Key concepts:
     - Recursive Processing: Handles both individual and nested dirs and files.
     - File Documentation: Converts statements into documentation and writes to a common
         standardized structure.
-    - Directory Structure: Preserves directory structure in the output documentation.
+    - Directory Structure: Preserves directory structure in the output documentation,
+        creating every needed dir at once, before writing any page.
+    - Parallelism: With more than one job, the pages are rendered by a process pool
+        and written by a thread pool, as `_process_in_parallel` does; each page path
+        and content depend only on it's file, so the output is the same either way.
 
     Example:
 
     ```python
     process_codebase(codebase, '/root', '/output')
     # Processes the codebase and generates documentation in the '/output' directory.
+    process_codebase(codebase, '/root', '/output', jobs=4)
+    # Does exactly the same, rendering the pages with 4 processes.
     ```
 
     :param codebase: The codebase to process, which can contain files or nested dirs.
-    :type codebase: dict[str, CodebaseDict] | dict[str, list[StandardReturn]]
+    :type codebase: dict[str, CodebaseDict] | dict[str, FileContract]
     :param root: The root directory of the project.
     :type root: str
     :param exit: The output directory where documentation will be saved.
     :type exit: str
-    :param basedir: The base directory used during the recursive traversal.
+    :param basedir: The base directory the files paths start from.
     :type basedir: str = ''
     :param codebase_nav_path: Expected codebase nav name to be used/found.
     :type codebase_nav_path: str = 'Codebase'
-    :return: None
-    :rtype: None
+    :param only: If provided, just the files with these paths are processed.
+    :type only: Collection[FilePath] | None = None
+    :param jobs: Number of processes rendering pages, less than 1 meaning all CPUs.
+    :type jobs: int = 1
+    :return: How many pages were actually written, i.e. new or changed.
+    :rtype: int
     """
 
-    parents: list[str] = list(codebase.keys())
     docs_path: FilePath = path.join(exit, 'docs')
+    workers: int = jobs if jobs > 0 else cpu_count() or 1
+    files: list[tuple[FilePath, FileContract]] = [
+        (i, record)
+        for i, record in iter_codebase_files(cast(CodebaseDict, codebase), basedir)
+        if only is None or i in only
+    ]
 
-    for key in parents:
-        value = codebase[key]
-        new_path: str = path.join(basedir, key)
-
-        if isinstance(value, list):
-            logger.debug(f"\tEvaluating file '{key}' of {parents}")
-            _process_file(
-                key,
-                value,
-                new_path,
-                root,
-                docs_path,
-                codebase_nav_path=codebase_nav_path,
-            )
-        else:
-            logger.debug(f"\tReprocessing dir '{key}' of {parents}")
-            process_codebase(value, root, exit, new_path)
+    make_output_dirs(
+        path.join(docs_path, codebase_nav_path),
+        plan_output_dirs((i for i, _ in files), root, docs_path, codebase_nav_path),
+    )
+
+    if workers > 1 and len(files) > 1:
+        return _process_in_parallel(files, root, docs_path, codebase_nav_path, workers)
+
+    written: int = 0
+
+    for file_path, record in files:
+        logger.debug(f"\tEvaluating file '{file_path}'")
+        written += _process_file(
+            path.basename(file_path),
+            record,
+            file_path,
+            root,
+            docs_path,
+            codebase_nav_path=codebase_nav_path,
+        )
+
+    return written
+
+
+def process_files(
+    parsed: Iterable[tuple[FilePath, FileContract]],
+    files: Iterable[FilePath],
+    prefix: FilePath,
+    root: str,
+    exit: str,
+    codebase_nav_path: str = 'Codebase',
+    only: Collection[FilePath] | None = None,
+) -> int:
+    """
+    Generates the documentation for each file, as soon as it's received.
+
+    The streaming sibling of `process_codebase`: instead of a whole codebase, receives
+    the files paths paired with their stmts, one by one, e.g. from
+    `codebase.stream_codebase`, writing each page before asking for the next file, so
+    no more than one file stmts are needed at once. The pages are exactly the same
+    `process_codebase` writes for the codebase these files belong to.
+
+    The files paths are known before they are parsed, so the output dirs are all
+    created beforehand, as `process_codebase` does.
+
+    Example:
+
+    ```python
+    tree, parsed = stream_codebase('/root/PROJECT')
+    files = [i for i, _ in iter_codebase_files(remove_abspath_from_codebase(tree))]
+    process_files(parsed, files, get_codebase_prefix(tree), '/root', '/output')
+    # Writes '/output/docs/Codebase/PROJECT/...' pages while parsing the codebase.
+    ```
+
+    :param parsed: Each file path paired with it's stmts.
+    :type parsed: Iterable[tuple[FilePath, FileContract]]
+    :param files: The relative paths of every file `parsed` may yield.
+    :type files: Iterable[FilePath]
+    :param prefix: The path removed from the files paths, as `get_codebase_prefix`.
+    :type prefix: FilePath
+    :param root: The root directory of the project.
+    :type root: str
+    :param exit: The output directory where documentation will be saved.
+    :type exit: str
+    :param codebase_nav_path: Expected codebase nav name to be used/found.
+    :type codebase_nav_path: str = 'Codebase'
+    :param only: If provided, just the files with these relative paths are processed.
+    :type only: Collection[FilePath] | None = None
+    :return: How many pages were actually written, i.e. new or changed.
+    :rtype: int
+    """
+
+    docs_path: FilePath = path.join(exit, 'docs')
+    written: int = 0
+
+    make_output_dirs(
+        path.join(docs_path, codebase_nav_path),
+        plan_output_dirs(
+            (i for i in files if only is None or i in only),
+            root,
+            docs_path,
+            codebase_nav_path,
+        ),
+    )
+
+    for file, stmts in parsed:
+        file_path: FilePath = path.relpath(file, prefix)
+
+        if only is not None and file_path not in only:
+            continue
+
+        logger.debug(f"\tEvaluating file '{file_path}'")
+        written += _process_file(
+            path.basename(file_path),
+            stmts,
+            file_path,
+            root,
+            docs_path,
+            codebase_nav_path=codebase_nav_path,
+        )
+
+    return written
+
+
+def render_pages(
+    codebase: CodebaseDict,
+    codebase_nav_path: str = 'Codebase',
+    jobs: int = 1,
+) -> list[tuple[FilePath, str]]:
+    """
+    Renders the page of each file of a cleaned codebase, without writing any of them.
+
+    The pages are exactly the ones `process_codebase` writes, but kept in memory, for
+    whoever serves them straight from there, as `plugin.MoshehPlugin` does for MkDocs.
+    With more than one job, they are rendered by a process pool, as well.
+
+    :param codebase: The codebase, with no abspath, as `remove_abspath_from_codebase`.
+    :type codebase: CodebaseDict
+    :param codebase_nav_path: Expected codebase nav name to be used/found.
+    :type codebase_nav_path: str = 'Codebase'
+    :param jobs: Number of processes rendering pages, less than 1 meaning all CPUs.
+    :type jobs: int = 1
+    :return: Each page path, `/`-separated and relative to the docs dir, paired with
+        it's Markdown content.
+    :rtype: list[tuple[FilePath, str]]
+    """
+
+    workers: int = jobs if jobs > 0 else cpu_count() or 1
+    files: list[tuple[FilePath, FileContract]] = list(iter_codebase_files(codebase))
+    render: partial[tuple[FilePath, str]] = partial(
+        _render_page, root='', docs_path='', codebase_nav_path=codebase_nav_path
+    )
+    pages: list[tuple[FilePath, str]]
+
+    if workers > 1 and len(files) > 1:
+        chunksize: int = max(1, min(len(files) // (workers * 4), MAX_CHUNKSIZE))
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pages = list(executor.map(render, files, chunksize=chunksize))
+    else:
+        pages = list(map(render, files))
+
+    return [(page.replace(sep, '/'), content) for page, content in pages]
+
+
+def plan_output_dirs(
+    files: Iterable[FilePath],
+    root: str,
+    docs_path: FilePath,
+    codebase_nav_path: str = 'Codebase',
+) -> list[FilePath]:
+    """
+    Lists every dir the files pages are written to, each parent before it's children.
+
+    Just the dirs inside the codebase nav one are listed, each one once, no matter how
+    many pages it holds; so creating them in this order never needs to check, or
+    create, any parent dir.
+
+    Example:
+
+    ```python
+    plan_output_dirs(['PROJECT/manage.py', 'PROJECT/core/urls.py'], '', 'out/docs')
+    # ['out/docs/Codebase/PROJECT', 'out/docs/Codebase/PROJECT/core']
+    ```
+
+    :param files: The relative paths of the files to be documented.
+    :type files: Iterable[FilePath]
+    :param root: The root directory of the project.
+    :type root: str
+    :param docs_path: The path to the documentation directory.
+    :type docs_path: FilePath
+    :param codebase_nav_path: Expected codebase nav name to be used/found.
+    :type codebase_nav_path: str = 'Codebase'
+    :return: The output dirs, sorted by depth.
+    :rtype: list[FilePath]
+    """
+
+    base: FilePath = path.join(docs_path, codebase_nav_path) + sep
+    dirs: set[FilePath] = set()
+
+    for file in files:
+        folder: FilePath = path.dirname(
+            _page_path(file, root, docs_path, codebase_nav_path)
+        )
+
+        while folder.startswith(base) and folder not in dirs:
+            dirs.add(folder)
+            folder = path.dirname(folder)
+
+    return sorted(dirs, key=lambda x: (x.count(sep), x))
+
+
+def make_output_dirs(base: FilePath, dirs: Iterable[FilePath]) -> int:
+    """
+    Creates the output dirs planned by `plan_output_dirs`, with one syscall each.
+
+    Only `base`, the codebase nav dir, may miss it's parents, since the docs dir is
+    created by MkDocs; the planned ones are created in order, an existing dir being
+    told by the creation failing instead of checking it beforehand.
+
+    :param base: The codebase nav dir, holding every planned one.
+    :type base: FilePath
+    :param dirs: The planned dirs, each parent before it's children.
+    :type dirs: Iterable[FilePath]
+    :return: How many dirs were actually created.
+    :rtype: int
+    """
+
+    created: int = 0
+    makedirs(base, exist_ok=True)
+
+    for dirpath in dirs:
+        try:
+            mkdir(dirpath)
+        except FileExistsError:
+            continue
+
+        created += 1
+        logger.debug(f'\t\tCreated path "{dirpath}"')
+
+    return created
 
 
 def _process_file(
     key: str,
-    stmts: list[StandardReturn],
+    record: FileContract,
     file_path: FilePath,
     root: str,
     docs_path: FilePath,
     codebase_nav_path: str = 'Codebase',
-) -> None:
+) -> bool:
     """
     Processes a file's stmts and generates it's corresponding documentation.
 
-    Converts a list of stmts into a Markdown document, writes the content to
-    the appropriate file path, and updates the navigation structure for the
-    documentation. If the necessary folder path does not exist, it is created.
+    Converts the parsed file into a Markdown document, without changing it, writes
+    the content to the appropriate file path, and updates the navigation structure
+    for the documentation. The folder path must already exist, as `make_output_dirs`
+    creates the ones of every file beforehand.
 
     Key concepts:
     - Statement Processing: Converts stmts into Markdown format.
-    - File Writing: Saves the generated content to the appropriate file.
+    - File Writing: Saves the generated content to the appropriate file, unless it's
+        already there exactly as generated.
     - Navigation Update: Updates the documentation's navigation structure.
 
     Example:
 
     ```python
-    _process_file('module_name', stmts, 'src/module.py', '/root', '/docs')
+    _process_file('module_name', record, 'src/module.py', '/root', '/docs')
     # Processes the stmts from 'module.py' and generates corresponding markdown docs.
     ```
 
     :param key: The key representing the module or file being processed.
     :type key: str
-    :param stmts: The list of stmts that represent the code to be documented.
-    :type stmts: list[StandardReturn]
+    :param record: The parsed file, it's metadata and stmts.
+    :type record: FileContract
     :param file_path: The path to the source file, used to derive output locations.
     :type file_path: str
     :param root: The root directory of the project.
@@ -162,32 +418,126 @@ def _process_file(
     :type docs_path: str
     :param codebase_nav_path: Expected codebase nav name to be used/found.
     :type codebase_nav_path: str = 'Codebase'
-    :return: None
-    :rtype: None
+    :return: If the page was actually written.
+    :rtype: bool
+    """
+
+    logger.debug(f'\t\t{key} has {len(record.statements)} statements')
+
+    return _write_to_file(
+        *_render_page((file_path, record), root, docs_path, codebase_nav_path)
+    )
+
+
+def _process_in_parallel(
+    files: list[tuple[FilePath, FileContract]],
+    root: str,
+    docs_path: FilePath,
+    codebase_nav_path: str,
+    workers: int,
+) -> int:
+    """
+    Renders the pages over a process pool and writes them over a thread pool.
+
+    Rendering is CPU-bound, so it's spread over `workers` processes, in chunks of up
+    to `codebase.MAX_CHUNKSIZE` files, paying the IPC per chunk. Each page is handed
+    to one of the `WRITE_WORKERS` threads as soon as it's rendered, in the files
+    order, so comparing and writing the pages, I/O-bound, overlaps the rendering.
+
+    :param files: Each file path paired with it's parsed data.
+    :type files: list[tuple[FilePath, FileContract]]
+    :param root: The root directory of the project.
+    :type root: str
+    :param docs_path: The path to the documentation directory.
+    :type docs_path: FilePath
+    :param codebase_nav_path: Expected codebase nav name to be used/found.
+    :type codebase_nav_path: str
+    :param workers: Number of processes on the pool.
+    :type workers: int
+    :return: How many pages were actually written, i.e. new or changed.
+    :rtype: int
     """
 
-    if not stmts:
-        logger.debug(f'\t\t{key} empty, has no statement')
-        return
+    chunksize: int = max(1, min(len(files) // (workers * 4), MAX_CHUNKSIZE))
+    logger.debug(f'\tRendering {len(files)} pages with {workers} workers')
 
-    content: str = _codebase_to_markdown(stmts, file_path)
-    output_file_path: FilePath = path.join(
-        docs_path, codebase_nav_path, file_path.removeprefix(root) + '.md'
+    render: partial[tuple[FilePath, str]] = partial(
+        _render_page,
+        root=root,
+        docs_path=docs_path,
+        codebase_nav_path=codebase_nav_path,
     )
-    folder_path: FilePath = path.dirname(output_file_path)
 
-    if not path.exists(path.join('.', folder_path)):
-        makedirs(path.join('.', folder_path))
-        logger.debug(f'\t\tCreated path "{folder_path}"')
+    with (
+        ProcessPoolExecutor(max_workers=workers) as executor,
+        ThreadPoolExecutor(max_workers=WRITE_WORKERS) as writer,
+    ):
+        written: list[Future[bool]] = [
+            writer.submit(_write_to_file, page, content)
+            for page, content in executor.map(render, files, chunksize=chunksize)
+        ]
 
-    _write_to_file(output_file_path, content)
+    return sum(i.result() for i in written)
 
 
-def _codebase_to_markdown(file_data: list[StandardReturn], basedir: str) -> str:
+def _render_page(
+    file: tuple[FilePath, FileContract],
+    root: str,
+    docs_path: FilePath,
+    codebase_nav_path: str,
+) -> tuple[FilePath, str]:
+    """
+    Renders the page of a parsed file, without writing it.
+
+    Being a pure function of it's arguments, with a picklable return, it is safe to
+    be called from worker processes.
+
+    :param file: The file path paired with it's parsed data.
+    :type file: tuple[FilePath, FileContract]
+    :param root: The root directory of the project.
+    :type root: str
+    :param docs_path: The path to the documentation directory.
+    :type docs_path: FilePath
+    :param codebase_nav_path: Expected codebase nav name to be used/found.
+    :type codebase_nav_path: str
+    :return: The page path paired with it's Markdown content.
+    :rtype: tuple[FilePath, str]
+    """
+
+    file_path, record = file
+
+    return (
+        _page_path(file_path, root, docs_path, codebase_nav_path),
+        _codebase_to_markdown(record, file_path),
+    )
+
+
+def _page_path(
+    file_path: FilePath, root: str, docs_path: FilePath, codebase_nav_path: str
+) -> FilePath:
+    """
+    Derives the page path of a source file, inside the codebase nav dir.
+
+    :param file_path: The path to the source file.
+    :type file_path: FilePath
+    :param root: The root directory of the project.
+    :type root: str
+    :param docs_path: The path to the documentation directory.
+    :type docs_path: FilePath
+    :param codebase_nav_path: Expected codebase nav name to be used/found.
+    :type codebase_nav_path: str
+    :return: The Markdown page path.
+    :rtype: FilePath
+    """
+
+    return path.join(docs_path, codebase_nav_path, file_path.removeprefix(root) + '.md')
+
+
+def _codebase_to_markdown(record: FileContract, basedir: str) -> str:
     """
     Converts a file's processed data into a structured Markdown representation.
 
-    This function processes a list of stmts extracted from a Python file and
+    This function processes the stmts extracted from a Python file and
     generates a Markdown-formatted string. It categorizes stmts into imports,
     constants, classes, functions, and assertions, ensuring that each type is
     documented appropriately. If a category has no stmts, a default informational
@@ -198,33 +548,40 @@ def _codebase_to_markdown(file_data: list[StandardReturn], basedir: str) -> str:
         (imports, assignments, class and function definitions, etc.) and organizes
         them into corresponding sections.
     - Markdown Generation: The output is formatted using a predefined Markdown
-        template (`FILE_MARKDOWN`) that structures the documentation by category.
+        template (`FILE_MD_TEMPLATE`) that structures the documentation by category.
     - Category Defaults: If no stmts exist for a particular category, an
         informational block is added to indicate it's absence.
+    - Read-Only: The parsed file is never changed, so the same one can be rendered
+        again, cached or shared with other renderers.
+    - Accumulation: Each section collects it's blocks in a list, joined just once, so
+        a module with thousands of stmts is never copied over and over.
 
     Example:
 
     ```python
-    file_data: list[StandardReturn] = [
-        {'statement': Statement.Import, 'name': 'os', ...},
-        {'statement': Statement.ClassDef, 'name': 'MyClass', ...},
-    ]
-    _codebase_to_markdown(file_data, '/path/to/module/file.py')
+    record: FileContract = FileContract(
+        meta=FileMetaContract(role=FileRole.PythonSourceCode, docstring='...'),
+        statements=(
+            ImportContract(statement=Statement.Import, name='os', ...),
+            ClassDefContract(statement=Statement.ClassDef, name='MyClass', ...),
+        ),
+    )
+    _codebase_to_markdown(record, '/path/to/module/file.py')
     # Outputs a Markdown string with sections for imports and classes
     ```
 
-    :param file_data: A list of statement dict for the parsed contents of a Python file.
-    :type file_data: list[StandardReturn]
+    :param record: The parsed Python file, it's metadata and statements.
+    :type record: FileContract
     :param basedir: The file in-process' base dir, used to generate the module path.
     :type basedir: str
     :return: A Markdown-formatted string documenting the contents of the file.
     :rtype: str
     """
 
-    __meta__: StandardReturn = file_data.pop(0)
+    __meta__: FileMetaContract = record.meta
 
     filename: str = basedir.split(path.sep)[-1]
-    role: str = cast(FileRole, __meta__.get('__role__')).value
+    role: str = __meta__.role.value
     file_path: str = (
         basedir.removesuffix(filename)
         .replace(path.sep, '.')
@@ -232,104 +589,141 @@ def _codebase_to_markdown(file_data: list[StandardReturn], basedir: str) -> str:
         .removeprefix('.')
         .removesuffix('.')
     )
-    filedoc: str = cast(str, __meta__.get('__docstring__'))
-    imports: str = ''
-    constants: str = ''
-    classes: str = ''
-    functions: str = ''
-    assertions: str = ''
+    filedoc: str = __meta__.docstring
+    sections: dict[str, list[str]] = {
+        'imports': [],
+        'constants': [],
+        'classes': [],
+        'functions': [],
+        'assertions': [],
+    }
+    imports: list[str] = sections['imports']
+    constants: list[str] = sections['constants']
+    classes: list[str] = sections['classes']
+    functions: list[str] = sections['functions']
+    assertions: list[str] = sections['assertions']
 
     logger.debug(f'\t\t\tFile: {basedir}')
-    for stmt in file_data:
-        match stmt['statement']:
-            case Statement.Import:
-                imports += _handle_import(stmt)
+    for stmt in record.statements:
+        match stmt:
+            case ImportContract():
+                imports.append(_handle_import(stmt))
 
-            case Statement.ImportFrom:
-                imports += _handle_import_from(stmt)
+            case ImportFromContract():
+                imports.append(_handle_import_from(stmt))
 
-            case Statement.Assign:
-                constants += _handle_assign(stmt)
+            case AssignContract():
+                constants.append(_handle_assign(stmt))
 
-            case Statement.AnnAssign:
-                constants += _handle_annassign(stmt)
+            case AnnAssignContract():
+                constants.append(_handle_annassign(stmt))
 
-            case Statement.ClassDef:
-                classes += _handle_class_def(stmt)
+            case ClassDefContract():
+                classes.append(_handle_class_def(stmt))
 
-            case Statement.FunctionDef | Statement.AsyncFunctionDef:
-                functions += _handle_function_def(stmt)
+            case FunctionDefContract() | AsyncFunctionDefContract():
+                functions.append(_handle_function_def(stmt))
 
-            case Statement.Assert:
-                assertions += _handle_assert(stmt)
+            case AssertContract():
+                assertions.append(_handle_assert(stmt))
 
             case _:
-                logger.error(
-                    f'Statement shoud not be processed here: {stmt["statement"]}'
-                )
-
-    if not imports:
-        logger.debug('\t\t\tNo imports defined here')
-        imports = '!!! info "NO IMPORT DEFINED HERE"'
-    if not constants:
-        logger.debug('\t\t\tNo constants defined here')
-        constants = '!!! info "NO CONSTANT DEFINED HERE"'
-    if not classes:
-        logger.debug('\t\t\tNo classes defined here')
-        classes = '!!! info "NO CLASS DEFINED HERE"'
-    if not functions:
-        logger.debug('\t\t\tNo functions defined here')
-        functions = '!!! info "NO FUNCTION DEFINED HERE"'
-    if not assertions:
-        logger.debug('\t\t\tNo assertions defined here')
-        assertions = '!!! info "NO ASSERT DEFINED HERE"'
-
-    return FILE_MARKDOWN.format(
-        filename=filename,
-        role=role,
-        file_path=file_path,
-        filedoc=filedoc,
-        imports=imports,
-        constants=constants,
-        classes=classes,
-        functions=functions,
-        assertions=assertions,
-    )
+                logger.error(f'Statement shoud not be processed here: {stmt}')
+
+    content: dict[str, str] = {
+        'filename': filename,
+        'role': role,
+        'file_path': file_path,
+        'filedoc': filedoc,
+    }
+
+    for section, parts in sections.items():
+        if parts:
+            content[section] = ''.join(parts)
+            parts.clear()
+        else:
+            logger.debug(f'\t\t\tNo {section} defined here')
+            content[section] = EMPTY_SECTIONS[section]
+
+    return FILE_MD_TEMPLATE % content
 
 
-def _write_to_file(file_path: FilePath, content: str) -> None:
+def _write_to_file(file_path: FilePath, content: str) -> bool:
     """
-    Writes content to a specified file.
+    Writes content to a specified file, unless it already has exactly this content.
 
     This function opens a file at the given path in write mode and writes the provided
     content to it. The content is written using UTF-8 encoding, ensuring compatibility
     with various char sets.
 
+    If the file already exists with the very same content, it's left untouched, so
+    it's mtime is kept and nothing watching the docs, such as `mkdocs serve` or a
+    rsync deploy, sees it as changed. Comparing the sizes first, most changed files
+    are told apart without even reading them.
+
     Key concepts:
     - File Writing: Opens a file for writing and writes the content.
     - UTF-8 Encoding: Ensures the file is written with UTF-8 for proper char handling.
+    - Skip Unchanged: Identical files are neither rewritten nor touched.
 
     Example:
 
     ```python
     _write_to_file('output.md', 'This is some content.')
-    # Writes the content "This is some content." to 'output.md'.
+    # True, writing the content "This is some content." to 'output.md'.
+    _write_to_file('output.md', 'This is some content.')
+    # False, since 'output.md' already has this content.
     ```
 
     :param file_path: The path to the file where the content will be written.
     :type file_path: FilePath
     :param content: The content to be written to the file.
     :type content: str
-    :return: None
-    :rtype: None
+    :return: If the file was actually written.
+    :rtype: bool
     """
 
-    with open(path.join('.', file_path), 'w', encoding='utf-8') as file:
+    target: FilePath = path.join('.', file_path)
+
+    if _has_content(target, content):
+        logger.debug(f'\t\t\tContent of "{file_path.split(sep)[-1]}" unchanged')
+        return False
+
+    with open(target, 'w', encoding='utf-8') as file:
         file.write(content)
         logger.debug(f'\t\t\tContent written to "{file_path.split(sep)[-1]}"')
 
+    return True
+
 
-def _handle_import(stmt: StandardReturn) -> str:
+def _has_content(file_path: FilePath, content: str) -> bool:
+    """
+    Checks if a file exists with exactly the given content, as written in text mode.
+
+    :param file_path: The path to the file to be checked.
+    :type file_path: FilePath
+    :param content: The expected content.
+    :type content: str
+    :return: If the file content is the same.
+    :rtype: bool
+    """
+
+    size: int = len(content.encode('utf-8'))
+
+    if linesep != '\n':
+        size += content.count('\n') * (len(linesep) - 1)
+
+    try:
+        if stat(file_path).st_size != size:
+            return False
+
+        with open(file_path, encoding='utf-8') as f:
+            return f.read() == content
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+def _handle_import(stmt: ImportContract) -> str:
     """
     Generates a Markdown representation for an `import` statement.
 
@@ -347,35 +741,35 @@ def _handle_import(stmt: StandardReturn) -> str:
     Example:
 
     ```python
-    stmt: StandardReturn = {
-        'statement': Statement.Import,
-        'name': 'os',
-        'category': ImportType.Native,
-        'code': 'import os',
-    }
+    stmt: ImportContract = ImportContract(
+        statement=Statement.Import,
+        name='os',
+        category=ImportType.Native,
+        code='import os',
+    )
     handle_import(stmt)
     # Outputs a formatted Markdown string representing the import
     ```
 
-    :param stmt: A dict containing the details of the import statement.
-    :type stmt: StandardReturn
+    :param stmt: A record containing the details of the import statement.
+    :type stmt: ImportContract
     :return: A formatted Markdown string documenting the import statement.
     :rtype: str
     """
 
-    name: ModuleName = cast(ModuleName, stmt['name'])
-    category: ImportType = cast(ImportType, stmt['category'])
-    code: CodeSnippet = indent_code(cast(CodeSnippet, stmt['code']))
+    name: ModuleName = stmt.name
+    category: ImportType = stmt.category
+    code: CodeSnippet = indent_code(str(stmt.code))
 
-    return IMPORT_MD_STRUCT.format(
-        name=name,
-        _path=None,
-        category=category.value,
-        code=code,
-    )
+    return IMPORT_MD_TEMPLATE % {
+        'name': name,
+        '_path': None,
+        'category': category.value,
+        'code': code,
+    }
 
 
-def _handle_import_from(stmt: StandardReturn) -> str:
+def _handle_import_from(stmt: ImportFromContract) -> str:
     """
     Generates a Markdown representation for an `import` statement.
 
@@ -393,36 +787,36 @@ def _handle_import_from(stmt: StandardReturn) -> str:
     Example:
 
     ```python
-    stmt: StandardReturn = {
-        'statement': Statement.ImportFrom,
-        'name': 'environ',
-        'category': ImportType.Native,
-        'code': 'from os import environ',
-    }
+    stmt: ImportFromContract = ImportFromContract(
+        statement=Statement.ImportFrom,
+        name='environ',
+        category=ImportType.Native,
+        code='from os import environ',
+    )
     handle_import(stmt)
     # Outputs a formatted Markdown string representing the import
     ```
 
-    :param stmt: A dict containing the details of the import statement.
-    :type stmt: StandardReturn
+    :param stmt: A record containing the details of the import statement.
+    :type stmt: ImportFromContract
     :return: A formatted Markdown string documenting the import statement.
     :rtype: str
     """
 
-    name: ImportedIdentifier = cast(ImportedIdentifier, stmt['name'])
-    _path: ModulePath = cast(ModulePath, stmt['path'])
-    category: ImportType = cast(ImportType, stmt['category'])
+    name: ImportedIdentifier = stmt.name
+    _path: ModulePath | None = stmt.path
+    category: ImportType = stmt.category
     code: CodeSnippet = indent_code(f'from {_path} import {name}')
 
-    return IMPORT_MD_STRUCT.format(
-        name=name,
-        _path=_path,
-        category=category.value,
-        code=code,
-    )
+    return IMPORT_MD_TEMPLATE % {
+        'name': name,
+        '_path': _path,
+        'category': category.value,
+        'code': code,
+    }
 
 
-def _handle_assign(stmt: StandardReturn) -> str:
+def _handle_assign(stmt: AssignContract) -> str:
     """
     Generates a Markdown representation for an `assign` statement.
 
@@ -440,35 +834,35 @@ def _handle_assign(stmt: StandardReturn) -> str:
     Example:
 
     ```python
-    stmt: StandardReturn = {
-        'statement': Statement.Assign,
-        'tokens': ['foo', 'bar'],
-        'value': '(True, False)',
-        'code': 'foo, bar = True, False',
-    }
+    stmt: AssignContract = AssignContract(
+        statement=Statement.Assign,
+        tokens=['foo', 'bar'],
+        value='(True, False)',
+        code='foo, bar = True, False',
+    )
     handle_assign(stmt)
     # Outputs a formatted Markdown string representing the assign
     ```
 
-    :param stmt: A dict containing the details of the assign statement.
-    :type stmt: StandardReturn
+    :param stmt: A record containing the details of the assign statement.
+    :type stmt: AssignContract
     :return: A formatted Markdown string documenting the assign statement.
     :rtype: str
     """
 
-    tokens: Token = ', '.join(cast(list[Token], stmt['tokens']))
-    value: Value = cast(Value, stmt['value'])
-    code: CodeSnippet = indent_code(cast(str, stmt['code']))
+    tokens: Token = ', '.join(stmt.tokens)
+    value: Value = stmt.value
+    code: CodeSnippet = indent_code(str(stmt.code))
 
-    return ASSIGN_MD_STRUCT.format(
-        token=tokens,
-        _type='Unknown',
-        value=value,
-        code=code,
-    )
+    return ASSIGN_MD_TEMPLATE % {
+        'token': tokens,
+        '_type': 'Unknown',
+        'value': value,
+        'code': code,
+    }
 
 
-def _handle_annassign(stmt: StandardReturn) -> str:
+def _handle_annassign(stmt: AnnAssignContract) -> str:
     """
     Generates a Markdown representation for an `annotated assign` statement.
 
@@ -486,37 +880,37 @@ def _handle_annassign(stmt: StandardReturn) -> str:
     Example:
 
     ```python
-    stmt: StandardReturn = {
-        'statement': Statement.AnnAssign,
-        'name': 'var',
-        'annot': 'str',
-        'value': '"example"',
-        'code': 'var: str = "example"',
-    }
+    stmt: AnnAssignContract = AnnAssignContract(
+        statement=Statement.AnnAssign,
+        name='var',
+        annot='str',
+        value='"example"',
+        code='var: str = "example"',
+    )
     handle_annassign(stmt)
     # Outputs a formatted Markdown string representing the annotated assign
     ```
 
-    :param stmt: A dict containing the details of the annassign statement.
-    :type stmt: StandardReturn
+    :param stmt: A record containing the details of the annassign statement.
+    :type stmt: AnnAssignContract
     :return: A formatted Markdown string documenting the annassign statement.
     :rtype: str
     """
 
-    name: Token = cast(Token, stmt['name'])
-    annot: Annotation = cast(Annotation, stmt['annot'])
-    value: Value = cast(Value, stmt['value'])
-    code: CodeSnippet = indent_code(cast(str, stmt['code']))
+    name: Token = stmt.name
+    annot: Annotation = stmt.annot
+    value: Value = stmt.value
+    code: CodeSnippet = indent_code(str(stmt.code))
 
-    return ASSIGN_MD_STRUCT.format(
-        token=name,
-        _type=annot,
-        value=value,
-        code=code,
-    )
+    return ASSIGN_MD_TEMPLATE % {
+        'token': name,
+        '_type': annot,
+        'value': value,
+        'code': code,
+    }
 
 
-def _handle_class_def(stmt: StandardReturn) -> str:
+def _handle_class_def(stmt: ClassDefContract) -> str:
     """
     Generates a Markdown representation for a `class` definition statement.
 
@@ -536,33 +930,31 @@ def _handle_class_def(stmt: StandardReturn) -> str:
     Example:
 
     ```python
-    stmt: StandardReturn = {
-        'statement': Statement.ClassDef,
-        'name': 'MyClass',
-        'inheritance': ['BaseClass'],
-        'decorators': ['@dataclass'],
-        'kwargs': '',
-        'code': '@dataclass\\nclass MyClass(BaseClass): ...',
-    }
+    stmt: ClassDefContract = ClassDefContract(
+        statement=Statement.ClassDef,
+        name='MyClass',
+        inheritance=['BaseClass'],
+        decorators=['@dataclass'],
+        kwargs='',
+        code='@dataclass\\nclass MyClass(BaseClass): ...',
+    )
     handle_class_def(stmt)
     # Outputs a formatted Markdown string representing the class definition
     ```
 
-    :param stmt: A dict containing the details of the class definition statement.
-    :type stmt: StandardReturn
+    :param stmt: A record containing the details of the class definition statement.
+    :type stmt: ClassDefContract
     :return: A formatted Markdown string documenting the class definition.
     :rtype: str
     """
 
-    name: Token = cast(Token, stmt['name'])
-    inheritance: Inheritance = ', '.join(cast(list[Inheritance], stmt['inheritance']))
-    decorators: Decorator = (
-        ', '.join(cast(list[Decorator], stmt['decorators'])) or 'None'
-    )
-    kwargs: Kwargs = cast(Kwargs, stmt['kwargs'])
-    code: CodeSnippet = indent_code(cast(str, stmt['code']))
+    name: Token = stmt.name
+    inheritance: Inheritance = ', '.join(stmt.inheritance)
+    decorators: Decorator = ', '.join(stmt.decorators) or 'None'
+    kwargs: Kwargs = stmt.kwargs
+    code: CodeSnippet = indent_code(str(stmt.code))
 
-    if docstring := cast(Docstring | None, stmt['docstring']):
+    if docstring := stmt.docstring:
         docstring = indent_code(docstring)
     else:
         docstring = indent_code('No docstring provided.')
@@ -573,17 +965,17 @@ def _handle_class_def(stmt: StandardReturn) -> str:
     if not kwargs:
         kwargs = 'None'
 
-    return CLASS_DEF_MD_STRUCT.format(
-        name=name,
-        docstring=docstring,
-        inheritance=inheritance,
-        decorators=decorators,
-        kwargs=kwargs,
-        code=code,
-    )
+    return CLASS_DEF_MD_TEMPLATE % {
+        'name': name,
+        'docstring': docstring,
+        'inheritance': inheritance,
+        'decorators': decorators,
+        'kwargs': kwargs,
+        'code': code,
+    }
 
 
-def _handle_function_def(stmt: StandardReturn) -> str:
+def _handle_function_def(stmt: FunctionDefContract | AsyncFunctionDefContract) -> str:
     """
     Generates a Markdown representation for a function definition statement.
 
@@ -603,34 +995,32 @@ def _handle_function_def(stmt: StandardReturn) -> str:
     Example:
 
     ```python
-    stmt: StandardReturn = {
-        'statement': Statement.FunctionDef,
-        'name': 'sum_thing',
-        'decorators': [''],
-        'args': 'x: int, y: int',
-        'kwargs': '',
-        'rtype': 'int',
-        'code': 'def sum_thing(x: int, y: int) -> int: return x + y',
-    }
+    stmt: FunctionDefContract = FunctionDefContract(
+        statement=Statement.FunctionDef,
+        name='sum_thing',
+        decorators=[''],
+        args='x: int, y: int',
+        kwargs='',
+        rtype='int',
+        code='def sum_thing(x: int, y: int) -> int: return x + y',
+    )
     handle_function_def(stmt)
     # Outputs a formatted Markdown string representing the function definition
     ```
 
-    :param stmt: A dict containing the details of the function definition statement.
-    :type stmt: StandardReturn
+    :param stmt: A record containing the details of the function definition statement.
+    :type stmt: FunctionDefContract | AsyncFunctionDefContract
     :return: A formatted Markdown string documenting the function definition.
     :rtype: str
     """
 
-    name: Token = cast(Token, stmt['name'])
-    decorators: Decorator = (
-        ', '.join(cast(list[Decorator], stmt['decorators'])) or 'None'
-    )
-    category: FunctionType = cast(FunctionType, stmt['category'])
-    rtype: Annotation = cast(Annotation, stmt['rtype']) or 'Unknown'
-    code: CodeSnippet = indent_code(cast(str, stmt['code']))
+    name: Token = stmt.name
+    decorators: Decorator = ', '.join(stmt.decorators) or 'None'
+    category: FunctionType = stmt.category
+    rtype: Annotation = stmt.rtype or 'Unknown'
+    code: CodeSnippet = indent_code(str(stmt.code))
 
-    if docstring := cast(Docstring | None, stmt['docstring']):
+    if docstring := stmt.docstring:
         docstring = indent_code(
             docstring.replace(':param', '\n:param')
             .replace(':type', '\n:type')
@@ -640,24 +1030,24 @@ def _handle_function_def(stmt: StandardReturn) -> str:
     else:
         docstring = indent_code('No docstring provided.')
 
-    if not (args := cast(Args, stmt['args'])):
+    if not (args := stmt.args):
         args = 'None'
-    if not (kwargs := cast(Kwargs, stmt['kwargs'])):
+    if not (kwargs := stmt.kwargs):
         kwargs = 'None'
 
-    return FUNCTION_DEF_MD_STRUCT.format(
-        name=name,
-        docstring=docstring,
-        decorators=decorators,
-        category=category.value,
-        args=args,
-        kwargs=kwargs,
-        rtype=rtype,
-        code=code,
-    )
+    return FUNCTION_DEF_MD_TEMPLATE % {
+        'name': name,
+        'docstring': docstring,
+        'decorators': decorators,
+        'category': category.value,
+        'args': args,
+        'kwargs': kwargs,
+        'rtype': rtype,
+        'code': code,
+    }
 
 
-def _handle_assert(stmt: StandardReturn) -> str:
+def _handle_assert(stmt: AssertContract) -> str:
     """
     Generates a Markdown representation for an `assert` statement.
 
@@ -676,42 +1066,48 @@ def _handle_assert(stmt: StandardReturn) -> str:
     Example:
 
     ```python
-    stmt: StandardReturn = {
-        'statement': Statement.Assert,
-        'test': 'x > 0',
-        'msg': '"x must be positive"',
-        'code': 'assert x > 0, "x must be positive"',
-    }
+    stmt: AssertContract = AssertContract(
+        statement=Statement.Assert,
+        test='x > 0',
+        msg='"x must be positive"',
+        code='assert x > 0, "x must be positive"',
+    )
     handle_assert(stmt)
     # Outputs a formatted Markdown string representing the assert statement
     ```
 
-    :param stmt: A dictionary containing the details of the assert statement.
-    :type stmt: StandardReturn
+    :param stmt: A record containing the details of the assert statement.
+    :type stmt: AssertContract
     :return: A formatted Markdown string documenting the assert statement.
     :rtype: str
     """
 
-    test: AssertionTest = cast(AssertionTest, stmt['test'])
-    msg: AssertionMessage = cast(AssertionMessage, stmt['msg'])
-    code: CodeSnippet = indent_code(cast(str, stmt['code']))
+    test: AssertionTest = stmt.test
+    msg: AssertionMessage | None = stmt.msg
+    code: CodeSnippet = indent_code(str(stmt.code))
 
-    return ASSERT_MD_STRUCT.format(test=test, msg=msg, code=code)
+    return ASSERT_MD_TEMPLATE % {'test': test, 'msg': msg, 'code': code}
 
 
 def get_update_set_nav(
     mkdocs_yml: FilePath,
     cleaned_codebase: CodebaseDict,
     codebase_nav_path: str = 'Codebase',
-) -> None:
+    nav_file: FilePath | None = None,
+) -> bool:
     """
     Sets the `mkdocs.yml` Nav "Codebase" section to the current state, updating it.
 
     Reading the current `mkdocs.yml` file, loads and parses it's data, extracts the
     "Nav" section and search for the Expected Codebase Nav path, defaulting to
-    `'Codebase'`; after this, if success, updates the nav list with the new codebase
-    data and, finally, saves this changes dumping the file updating just the codebase
-    section.
+    `'Codebase'`; after this, if success and the section actually changed, updates the
+    nav list with the new codebase data and, finally, saves this changes dumping the
+    file straight to disk. If nothing changed, the file is not even opened for writing,
+    so it's mtime is kept and `mkdocs serve` does not rebuild everything.
+
+    If `nav_file` is provided, the `mkdocs.yml` file is never touched: the section is
+    written to this separate file instead, by `_write_nav_file`, for the `mosheh`
+    MkDocs plugin to read it on build.
 
     :param mkdocs_yml: Ready-to-use "mkdocs.yml" path.
     :type mkdocs_yml: FilePath
@@ -719,10 +1115,15 @@ def get_update_set_nav(
     :type codebase: CodebaseDict
     :param codebase_nav_path: Expected codebase nav name to be used/found.
     :type codebase_nav_path: str = 'Codebase'
-    :return: None
-    :rtype: None
+    :param nav_file: Separate file holding the codebase Nav section, if any.
+    :type nav_file: FilePath | None = None
+    :return: If the Nav file was actually written.
+    :rtype: bool
     """
 
+    if nav_file is not None:
+        return _write_nav_file(nav_file, cleaned_codebase, codebase_nav_path)
+
     with open(mkdocs_yml, encoding='utf-8') as f:
         yml: dict[str, list[Any]] = load(f.read(), Loader=CLoader)
 
@@ -734,12 +1135,91 @@ def get_update_set_nav(
             logger.error(f'Nav section "{codebase_nav_path}" not found')
             exit()
 
-    yml['nav'][nav_section_index] = {
+    section: dict[str, Any] = {
         codebase_nav_path: build_nav_struct(cleaned_codebase, codebase_nav_path)
     }
 
+    if yml['nav'][nav_section_index] == section:
+        logger.debug('\tNav unchanged, mkdocs.yml left untouched')
+        return False
+
+    yml['nav'][nav_section_index] = section
+
     with open(mkdocs_yml, 'w', encoding='utf-8') as f:
-        f.write(dump(yml, Dumper=CDumper, sort_keys=False, indent=2))
+        dump(yml, f, Dumper=CDumper, sort_keys=False, indent=2)
+
+    return True
+
+
+def _write_nav_file(
+    nav_file: FilePath, cleaned_codebase: CodebaseDict, codebase_nav_path: str
+) -> bool:
+    """
+    Writes the codebase Nav section to it's own YAML file, unless it's already there.
+
+    The YAML is emitted line by line by `_emit_nav`, straight from the codebase tree,
+    so not even a huge Nav is ever held as a whole, neither as a struct nor as a
+    string; the current file is compared the same way, line by line, before writing.
+
+    :param nav_file: The separate file holding the codebase Nav section.
+    :type nav_file: FilePath
+    :param cleaned_codebase: The codebase, with no abspath.
+    :type cleaned_codebase: CodebaseDict
+    :param codebase_nav_path: Expected codebase nav name to be used/found.
+    :type codebase_nav_path: str
+    :return: If the Nav file was actually written.
+    :rtype: bool
+    """
+
+    try:
+        with open(nav_file, encoding='utf-8') as f:
+            current: Iterator[str] = iter(f)
+            lines: Iterator[str] = _emit_nav(cleaned_codebase, codebase_nav_path)
+
+            if all(i == next(current, None) for i in lines) and not next(current, ''):
+                logger.debug(f'\tNav unchanged, {nav_file} left untouched')
+                return False
+    except FileNotFoundError:
+        pass
+
+    with open(nav_file, 'w', encoding='utf-8') as f:
+        f.writelines(_emit_nav(cleaned_codebase, codebase_nav_path))
+
+    return True
+
+
+def _emit_nav(
+    tree: CodebaseDict, codebase_nav_path: str, prefix: str = ''
+) -> Iterator[str]:
+    """
+    Emits the YAML lines of the codebase Nav section, the same as `build_nav_struct`.
+
+    Every key and value is a JSON string, which is a valid YAML double-quoted scalar,
+    so no name needs any other escaping; non-ASCII chars are kept as they are. The tree
+    is walked by `utils.walk_codebase`, so no Nav struct is built in between.
+
+    :param tree: The codebase, with no abspath.
+    :type tree: CodebaseDict
+    :param codebase_nav_path: Expected codebase nav name to be used/found.
+    :type codebase_nav_path: str
+    :param prefix: Accumulative string path for concat.
+    :type prefix: str = ''
+    :return: Each YAML line, with it's line break.
+    :rtype: Iterator[str]
+    """
+
+    quote: partial[str] = partial(dumps, ensure_ascii=False)
+
+    for depth, name, full_path, content in walk_codebase(tree, prefix, '/'):
+        indent: str = '  ' * depth
+
+        if not isinstance(content, dict):
+            page: str = f'{codebase_nav_path}/{full_path}.md'
+            yield f'{indent}- {quote(name)}: {quote(page)}\n'
+        elif content:
+            yield f'{indent}- {quote(name)}:\n'
+        else:
+            yield f'{indent}- {quote(name)}: []\n'
 
 
 def write_homepage(output_path: FilePath, readme_path: FilePath) -> None:
@@ -763,17 +1243,16 @@ def write_homepage(output_path: FilePath, readme_path: FilePath) -> None:
     with open(readme_path, encoding='utf-8') as f:
         content: list[str] = f.readlines()
 
-    with open(homepage, 'w', encoding='utf-8') as f:
-        readme_to_write: list[str] = [
-            '---\n',
-            'hide:\n',
-            '  - navigation\n',
-            '  - toc\n',
-            '---\n',
-            '\n',
-            '<br>\n',
-            '\n',
-        ] + content
-        f.writelines(readme_to_write)
+    readme_to_write: list[str] = [
+        '---\n',
+        'hide:\n',
+        '  - navigation\n',
+        '  - toc\n',
+        '---\n',
+        '\n',
+        '<br>\n',
+        '\n',
+    ] + content
+    _write_to_file(homepage, ''.join(readme_to_write))
 
     logger.info('"README.md" copied to documentation')
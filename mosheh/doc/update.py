@@ -3,8 +3,13 @@ Used to update the Nav and optionally the homepage of a documentation site,
 this file handles the `types.basic.CodebaseDict` and rewrites the `mkdocs.yml`
 Nav structure based on its contents.
 
-The only existing function here is `update_doc`, which encapsulates all
-underlying logic and utility calls.
+The main function here is `update_doc`, which encapsulates all underlying logic and
+utility calls, while `patch_doc` is it's lighter sibling for when the changed files are
+already known, e.g. from Git.
+
+The update is incremental: using the `doc.manifest` written by the previous runs, just
+the pages of added or changed source files are rendered again, while the pages of
+removed source files are deleted.
 
 There’s logic for safely cleaning the codebase, rebuilding the navigation tree,
 modifying the YAML structure, and copying over the README to serve as homepage,
@@ -12,12 +17,36 @@ all using internal calls for functions such as `process_codebase` and
 `get_update_set_nav`.
 """
 
+from collections.abc import Iterable
 from logging import Logger, getLogger
-from os import path
+from os import path, sep
 
-from mosheh.doc.shared import get_update_set_nav, process_codebase, write_homepage
+from mosheh.doc.manifest import (
+    ManifestDiff,
+    ManifestEntry,
+    ManifestJSON,
+    diff_manifest,
+    load_manifest,
+    manifest_key,
+    remove_pages,
+    save_manifest,
+)
+from mosheh.doc.shared import (
+    get_update_set_nav,
+    process_codebase,
+    process_files,
+    write_homepage,
+)
+from mosheh.modules import ModuleIndex, build_module_index
 from mosheh.types.basic import CodebaseDict, FilePath
-from mosheh.utils import remove_abspath_from_codebase
+from mosheh.types.contracts import FileContract
+from mosheh.utils import (
+    add_to_codebase_tree,
+    build_path_tree,
+    get_codebase_prefix,
+    iter_codebase_files,
+    remove_abspath_from_codebase,
+)
 
 
 logger: Logger = getLogger('mosheh')
@@ -30,6 +59,10 @@ def update_doc(
     output: str,
     readme_path: str | None,
     codebase_nav_path: str = 'Codebase',
+    skip_function_bodies: bool = True,
+    parsed: Iterable[tuple[FilePath, FileContract]] | None = None,
+    jobs: int = 1,
+    nav_file: str | None = None,
 ) -> None:
     """
     Updates an existing documentation for a Python codebase using MkDocs.
@@ -44,10 +77,18 @@ def update_doc(
         - Codebase Processing: The function relies on `process_codebase` to handle the
         codebase structure and populate the documentation content based on Python files
         and their stmts.
+        - Incremental Rendering: Compares the codebase against the manifest from the
+        previous run, rendering only added or changed files and deleting the pages of
+        removed ones, then logs a short summary. Every page is rendered again if the
+        installed packages or the project modules changed, as their imports may be
+        classified differently.
         - Configuration: Rebuilds a `mkdocs.yml` Nav config file with new project
-        details.
+        details, just if changed, or the separate `nav_file` if provided.
         - Homepage: If `readme_path` is provided, so the `index.md` file provided by
         MkDocs is overwriten by the `README.md` found at provided `readme_path` file.
+        - Streaming: If `parsed` is provided, `codebase` is just it's path tree, as from
+        `codebase.stream_codebase`, and each file page is written as soon as it's
+        parsed.
 
     :param codebase: Dict containing nodes representing `.py` files and their stmts.
     :type codebase: CodebaseDict
@@ -59,6 +100,14 @@ def update_doc(
     :type readme_path: str | None
     :param codebase_nav_path: Expected codebase nav name to be used/found.
     :type codebase_nav_path: str = 'Codebase'
+    :param skip_function_bodies: If the codebase was read without function bodies.
+    :type skip_function_bodies: bool = True
+    :param parsed: Each file path paired with it's stmts, for streaming them.
+    :type parsed: Iterable[tuple[FilePath, FileContract]] | None = None
+    :param jobs: Number of processes rendering pages, less than 1 meaning all CPUs.
+    :type jobs: int = 1
+    :param nav_file: Separate file holding the codebase Nav section, if any.
+    :type nav_file: str | None = None
     :return: None
     :rtype: None
     """
@@ -67,13 +116,186 @@ def update_doc(
     output_path: str = path.abspath(output)
     mkdocs_yml: FilePath = path.join(output_path, 'mkdocs.yml')
 
+    prefix: FilePath = get_codebase_prefix(codebase)
+    index: ModuleIndex = build_module_index(
+        root, (path.join(prefix, i) for i, _ in iter_codebase_files(clean_codebase))
+    )
+    key: str = manifest_key(codebase_nav_path, skip_function_bodies, index)
+    manifest: ManifestJSON | None = load_manifest(output_path, key)
+    previous: dict[FilePath, ManifestEntry] = manifest['files'] if manifest else {}
+    files: dict[FilePath, ManifestEntry]
+    diff: ManifestDiff
+    files, diff = diff_manifest(
+        iter_codebase_files(clean_codebase),
+        prefix,
+        output_path,
+        previous,
+        codebase_nav_path,
+    )
+
     logger.info('Processing codebase')
-    process_codebase(clean_codebase, root, output, codebase_nav_path=codebase_nav_path)
+    remove_pages(output_path, (previous[i]['page'] for i in diff.removed))
+
+    written: int
+
+    if parsed is None:
+        written = process_codebase(
+            clean_codebase,
+            root,
+            output,
+            codebase_nav_path=codebase_nav_path,
+            only={*diff.added, *diff.changed},
+            jobs=jobs,
+        )
+    else:
+        written = process_files(
+            parsed,
+            (i for i, _ in iter_codebase_files(clean_codebase)),
+            prefix,
+            root,
+            output,
+            codebase_nav_path,
+            {*diff.added, *diff.changed},
+        )
+
+    save_manifest(output_path, key, prefix, files)
+    _log_summary(diff, written)
     logger.info('Codebase processed successfully')
 
     logger.info('Getting and updating Nav')
-    get_update_set_nav(mkdocs_yml, clean_codebase, codebase_nav_path)
-    logger.debug('\tNav addeded to mkdocs.yml')
+    if get_update_set_nav(mkdocs_yml, clean_codebase, codebase_nav_path, nav_file):
+        logger.debug(f'\tNav addeded to {nav_file or mkdocs_yml}')
 
     if readme_path:
         write_homepage(output_path, readme_path)
+
+
+def patch_doc(
+    *,
+    parsed: Iterable[tuple[FilePath, FileContract]],
+    deleted: Iterable[FilePath],
+    index: ModuleIndex,
+    root: str,
+    output: str,
+    readme_path: str | None,
+    codebase_nav_path: str = 'Codebase',
+    skip_function_bodies: bool = True,
+    jobs: int = 1,
+    nav_file: str | None = None,
+) -> bool:
+    """
+    Patches an existing documentation with just the source files known to be changed.
+
+    Unlike `update_doc`, the codebase is not read as a whole: only the `parsed` files
+    have their pages rendered and only the `deleted` ones have their pages removed,
+    while the `doc.manifest` from the previous run provides everything else. The Nav
+    is rebuilt from the manifest just if some file was added or removed.
+
+    If there is no usable manifest, e.g. when the installed packages or the project
+    modules changed since it was written, nothing is done and `False` is returned, so
+    the caller can fall back to a full `update_doc`.
+
+    :param parsed: Each added or modified file absolute path paired with it's stmts.
+    :type parsed: Iterable[tuple[FilePath, FileContract]]
+    :param deleted: The deleted files absolute paths.
+    :type deleted: Iterable[FilePath]
+    :param index: The project module index, after the changes, for keying the manifest.
+    :type index: ModuleIndex
+    :param root: Root dir, where the analysis starts.
+    :type root: str
+    :param output: Path for documentation output, where to be created.
+    :type output: str
+    :param readme_path: The path of the `README.md` file, to be used as homepage.
+    :type readme_path: str | None
+    :param codebase_nav_path: Expected codebase nav name to be used/found.
+    :type codebase_nav_path: str = 'Codebase'
+    :param skip_function_bodies: If the codebase was read without function bodies.
+    :type skip_function_bodies: bool = True
+    :param jobs: Number of processes rendering pages, less than 1 meaning all CPUs.
+    :type jobs: int = 1
+    :param nav_file: Separate file holding the codebase Nav section, if any.
+    :type nav_file: str | None = None
+    :return: If the documentation was patched.
+    :rtype: bool
+    """
+
+    output_path: str = path.abspath(output)
+    key: str = manifest_key(codebase_nav_path, skip_function_bodies, index)
+    manifest: ManifestJSON | None = load_manifest(output_path, key)
+
+    if not manifest or not manifest['files']:
+        return False
+
+    prefix: FilePath = manifest['prefix']
+    files: dict[FilePath, ManifestEntry] = manifest['files']
+    clean_changes: CodebaseDict = {}
+
+    for file, statements in parsed:
+        add_to_codebase_tree(
+            clean_changes, path.relpath(file, prefix).split(sep), statements
+        )
+
+    removed: list[FilePath] = [
+        i for i in (path.relpath(file, prefix) for file in deleted) if i in files
+    ]
+    changed: dict[FilePath, ManifestEntry]
+    diff: ManifestDiff
+    changed, diff = diff_manifest(
+        iter_codebase_files(clean_changes),
+        prefix,
+        output_path,
+        files,
+        codebase_nav_path,
+    )
+
+    logger.info('Processing changed files')
+    remove_pages(output_path, (files.pop(i)['page'] for i in removed))
+    written: int = process_codebase(
+        clean_changes,
+        root,
+        output,
+        codebase_nav_path=codebase_nav_path,
+        only={*diff.added, *diff.changed},
+        jobs=jobs,
+    )
+    files.update(changed)
+    save_manifest(output_path, key, prefix, files)
+    _log_summary(diff._replace(removed=removed), written)
+    logger.info('Changed files processed successfully')
+
+    if diff.added or removed:
+        logger.info('Getting and updating Nav')
+        mkdocs_yml: FilePath = path.join(output_path, 'mkdocs.yml')
+
+        if get_update_set_nav(
+            mkdocs_yml, build_path_tree(files), codebase_nav_path, nav_file
+        ):
+            logger.debug(f'\tNav addeded to {nav_file or mkdocs_yml}')
+
+    if readme_path:
+        write_homepage(output_path, readme_path)
+
+    return True
+
+
+def _log_summary(diff: ManifestDiff, written: int) -> None:
+    """
+    Logs how many pages were added, changed, removed and left untouched.
+
+    A changed source may still render the very same page, e.g. when just a function
+    body changed with `skip_function_bodies`, so `written` can be lower than the added
+    plus changed count.
+
+    :param diff: The files classification, from `doc.manifest.diff_manifest`.
+    :type diff: ManifestDiff
+    :param written: How many pages were actually written to disk.
+    :type written: int
+    :return: None
+    :rtype: None
+    """
+
+    logger.info(
+        f'Pages: {len(diff.added)} added, {len(diff.changed)} changed, '
+        f'{len(diff.removed)} removed, {len(diff.unchanged)} unchanged, '
+        f'{written} written'
+    )
@@ -0,0 +1,158 @@
+"""
+Asks the local Git repository which Python files changed since a given revision.
+
+Used by `update --since <rev>`, this module relies only on Git plumbing commands,
+reading the local repository without touching the network or the index:
+
+- `git rev-parse --show-toplevel`: finds the repository root, since every path Git
+    outputs is relative to it.
+- `git diff-index -M --name-status -z <rev>`: lists the files added, modified, deleted
+    and renamed between the revision and the working tree.
+- `git ls-files --others --exclude-standard -z`: lists the untracked files, which are
+    new files not known by the revision nor the index yet.
+
+Renamed files are reported as the old path deleted plus the new path added, which is
+exactly what the documentation needs: one page removed and another one created.
+"""
+
+import subprocess
+from logging import Logger, getLogger
+from os import path
+from typing import NamedTuple
+
+from mosheh.types.basic import FilePath
+
+
+logger: Logger = getLogger('mosheh')
+
+
+class GitChanges(NamedTuple):
+    """Absolute paths of the Python files changed, grouped by what happened to them."""
+
+    added: list[FilePath]
+    modified: list[FilePath]
+    deleted: list[FilePath]
+
+
+def get_changed_files(root: FilePath, since: str) -> GitChanges:
+    """
+    Lists the `.py` and `.pyi` files under `root` changed since the `since` revision.
+
+    Example:
+
+    ```python
+    get_changed_files('/home/user/project/app', 'origin/main')
+    # GitChanges(
+    #     added=['/home/user/project/app/new.py'],
+    #     modified=['/home/user/project/app/models.py'],
+    #     deleted=[],
+    # )
+    ```
+
+    :param root: The codebase root dir, inside a Git working tree.
+    :type root: FilePath
+    :param since: Any Git revision, e.g. `'HEAD~3'` or `'origin/main'`.
+    :type since: str
+    :return: The changed Python files absolute paths.
+    :rtype: GitChanges
+    """
+
+    toplevel: FilePath = _git(root, 'rev-parse', '--show-toplevel').strip()
+    changes: GitChanges = GitChanges([], [], [])
+
+    fields: list[str] = _git(
+        toplevel, 'diff-index', '-M', '--name-status', '-z', since, '--', root
+    ).split('\0')
+
+    i: int = 0
+    while i < len(fields) - 1:
+        status: str = fields[i][:1]
+
+        if status in ('R', 'C'):
+            old, new = fields[i + 1], fields[i + 2]
+            i += 3
+
+            if status == 'R':
+                changes.deleted.append(old)
+            changes.added.append(new)
+            continue
+
+        file: str = fields[i + 1]
+        i += 2
+
+        match status:
+            case 'A':
+                changes.added.append(file)
+            case 'D':
+                changes.deleted.append(file)
+            case _:
+                changes.modified.append(file)
+
+    changes.added.extend(
+        _git(
+            toplevel, 'ls-files', '--others', '--exclude-standard', '-z', '--', root
+        ).split('\0')
+    )
+
+    result: GitChanges = GitChanges(
+        *(_only_python(toplevel, root, files) for files in changes)
+    )
+
+    logger.debug(
+        f'\tGit changes since "{since}": {len(result.added)} added, '
+        f'{len(result.modified)} modified, {len(result.deleted)} deleted'
+    )
+
+    return result
+
+
+def _only_python(
+    toplevel: FilePath, root: FilePath, files: list[str]
+) -> list[FilePath]:
+    """
+    Keeps just the Python files inside `root`, converting them to absolute paths.
+
+    :param toplevel: The Git repository root, which the files are relative to.
+    :type toplevel: FilePath
+    :param root: The codebase root dir.
+    :type root: FilePath
+    :param files: The file paths as output by Git.
+    :type files: list[str]
+    :return: The Python files absolute paths, without duplicates.
+    :rtype: list[FilePath]
+    """
+
+    base: FilePath = path.join(path.realpath(root), '')
+    result: dict[FilePath, None] = {}
+
+    for file in files:
+        if not file.endswith(('.py', '.pyi')):
+            continue
+
+        full_path: FilePath = path.join(toplevel, path.normpath(file))
+
+        if full_path.startswith(base):
+            result[path.join(path.abspath(root), full_path.removeprefix(base))] = None
+
+    return list(result)
+
+
+def _git(cwd: FilePath, *args: str) -> str:
+    """
+    Runs a Git command, returning it's standard output.
+
+    :param cwd: Dir to run the command from.
+    :type cwd: FilePath
+    :param args: The Git command and it's arguments.
+    :type args: str
+    :return: The command output.
+    :rtype: str
+    """
+
+    return subprocess.run(
+        ['git', *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
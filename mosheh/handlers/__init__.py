@@ -1,4 +1,4 @@
-from mosheh.handlers.python import handle_python_file
+from mosheh.handlers.python import handle_python_file, parse_python_file
 
 
-__all__ = ['handle_python_file']
+__all__ = ['handle_python_file', 'parse_python_file']
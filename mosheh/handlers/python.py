@@ -6,19 +6,38 @@ and call the right handle func. The defined nodes are `ast.Import`, `ast.ImportF
 `ast.Assign`, `ast.AnnAssign`, `ast.FunctionDef`, `ast.AsyncFunctionDef`, `ast.ClassDef`
 and `ast.Assert`; if more nodes inside them, `_handle_node` is called to process the new
 one.
+
+Instead of `ast.walk`, which visits every single node - mostly the `ast.Name`,
+`ast.Constant` and `ast.Call` ones, never documented - the tree is traversed by
+`_walk_statements`, descending only into the fields able to hold statements, as listed
+by `STMT_FIELDS`. Each node visited is then dispatched by it's exact type through the
+`STD_NODE_HANDLERS` table, with no `isinstance` chain at all.
+
+By default, the traversal is also scope-aware: function bodies are never entered, as
+listed by `SCOPED_STMT_FIELDS`, so just the module-level and class-level statements are
+documented, leaving out nested helpers, local asserts and local assignments.
+
+The statements `code` is not regenerated by `ast.unparse`, but sliced straight from the
+file source as a lazy `source.SourceSegment`, keeping the original formatting and
+comments; `ast.unparse` is just the fallback when handling a node without it's source.
 """
 
 import ast
-from collections import defaultdict
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterator
+from hashlib import sha256
 from logging import Logger, getLogger
-from os import sep
-from typing import Any, Final
+from os import fstat, sep, stat_result
+from os.path import splitext
+from typing import Any, Final, cast
 
+from mosheh.cache import cache_key, read_cache, write_cache
 from mosheh.constants import (
     ACCEPTABLE_LOWER_CONSTANTS,
     BUILTIN_DUNDER_METHODS,
-    BUILTIN_MODULES,
 )
+from mosheh.modules import ModuleIndex, load_module_map
+from mosheh.source import Source
 from mosheh.types.basic import (
     Annotation,
     Args,
@@ -43,9 +62,12 @@ from mosheh.types.contracts import (
     AssignContract,
     AsyncFunctionDefContract,
     ClassDefContract,
+    FileContract,
+    FileMetaContract,
     FunctionDefContract,
     ImportContract,
     ImportFromContract,
+    SourceStamp,
 )
 from mosheh.types.enums import (
     FileRole,
@@ -55,74 +77,319 @@ from mosheh.types.enums import (
 )
 from mosheh.utils import (
     add_to_nested_defaultdict,
-    bin,
     get_import_type,
-    standard_struct,
 )
 
 
 logger: Logger = getLogger('mosheh')
 
+HANDLER_VERSION: Final[int] = 8
+
+STMT_FIELDS: Final[dict[type[ast.AST], tuple[str, ...]]] = {
+    ast.Module: ('body',),
+    ast.FunctionDef: ('body',),
+    ast.AsyncFunctionDef: ('body',),
+    ast.ClassDef: ('body',),
+    ast.For: ('body', 'orelse'),
+    ast.AsyncFor: ('body', 'orelse'),
+    ast.While: ('body', 'orelse'),
+    ast.If: ('body', 'orelse'),
+    ast.With: ('body',),
+    ast.AsyncWith: ('body',),
+    ast.Match: ('cases',),
+    ast.match_case: ('body',),
+    ast.Try: ('body', 'handlers', 'orelse', 'finalbody'),
+    ast.TryStar: ('body', 'handlers', 'orelse', 'finalbody'),
+    ast.ExceptHandler: ('body',),
+}
+
+SCOPED_STMT_FIELDS: Final[dict[type[ast.AST], tuple[str, ...]]] = {
+    k: v
+    for k, v in STMT_FIELDS.items()
+    if k not in (ast.FunctionDef, ast.AsyncFunctionDef)
+}
+
+
+def handler_salt(skip_function_bodies: bool = True) -> str:
+    """
+    Identifies the handler output format, used for salting cache and manifest keys.
+
+    Changes with `HANDLER_VERSION` and with every option able to change the statements
+    extracted from the same code, so results produced under different options never
+    get mixed. The installed packages are not part of it: the imports are classified
+    again after loading from the cache, by `_resolve_imports`, so installing or
+    removing any package keeps the cache valid.
+
+    :param skip_function_bodies: If the function bodies are left out.
+    :type skip_function_bodies: bool = True
+    :return: The salt, e.g. `'python-handler-5-scoped'`.
+    :rtype: str
+    """
+
+    scope: str = 'scoped' if skip_function_bodies else 'full'
+
+    return f'python-handler-{HANDLER_VERSION}-{scope}'
+
 
 def handle_python_file(
-    codebase: defaultdict[Any, Any], file: FilePath
+    codebase: defaultdict[Any, Any],
+    file: FilePath,
+    cache_dir: str | None = None,
+    skip_function_bodies: bool = True,
+    index: ModuleIndex | None = None,
 ) -> defaultdict[Any, Any]:
     """
     Processes the .py file and returns it's data.
 
-    By receiving the codebase datastructure, empty or not, and a file_path, first
-    parses the code, then defines the file metadata, such as role (from
-    `types.enums.FileRole`), navigates into it's AST nodes (statements) and calls the
-    `handle_std_nodes` function for dealing with the default observed statements.
+    By receiving the codebase datastructure, empty or not, and a file_path, calls
+    `parse_python_file` for extracting the file statements and then inserts them into
+    the codebase structure, following the file path splitted by the OS separator.
 
     :param codebase: Nested defaultdict with the codebase data, empty or not.
     :type codebase: defaultdict[Any, Any]
     :param file: Path for the Python file to be documented.
     :type file: FilePath
+    :param cache_dir: Dir of the parsing cache, `None` for disabling it.
+    :type cache_dir: str | None = None
+    :param skip_function_bodies: If the statements inside functions are left out.
+    :type skip_function_bodies: bool = True
+    :param index: The project module index, for classifying the imports.
+    :type index: ModuleIndex | None = None
     :return: The same codebase data struct, with the parsed file.
     :rtype: defaultdict[Any, Any]
     """
 
-    with open(file, encoding='utf-8') as f:
-        code: str = f.read()
+    record: FileContract = parse_python_file(
+        file, cache_dir, skip_function_bodies, index
+    )
+
+    add_to_nested_defaultdict(codebase, file.split(sep), record)
+    logger.debug(f'\t{file} parsing successfully done')
+
+    return codebase
+
 
-    tree: ast.AST = ast.parse(code, filename=file)
+def parse_python_file(
+    file: FilePath,
+    cache_dir: str | None = None,
+    skip_function_bodies: bool = True,
+    index: ModuleIndex | None = None,
+) -> FileContract:
+    """
+    Parses the .py file and returns it's statements, without touching any codebase.
+
+    First parses the code, then defines the file metadata, such as role (from
+    `types.enums.FileRole`), navigates into it's AST nodes (statements) and calls the
+    `handle_std_nodes` function for dealing with the default observed statements.
+
+    Being a pure function of the file content, with a picklable return, it is safe to
+    be called from worker processes, as done by `codebase.read_codebase` when running
+    with more than one job. For the same reason, if a `cache_dir` is provided, the
+    result is cached there keyed by the file content and `handler_salt`, skipping the
+    whole `ast.parse`/`ast.unparse` work when the file did not change.
+
+    With `skip_function_bodies`, the default, nothing defined inside a function body is
+    documented, as the traversal does not even enter them.
+
+    The code snippets are slices of the file content, only decoded when rendered.
+
+    The record is stamped with the `SourceStamp` of the bytes just read - the file
+    `mtime` and `size`, taken before reading it, and the content hash - so the update
+    manifest records exactly what was parsed, without reading the file again.
+
+    The imports are classified through the module map of the run, loaded from the
+    `cache_dir` too, if any, on the first call; a cached result has them classified
+    again, since the installed packages may have changed since then. With an `index` of
+    the project modules, they are classified against it as well, after the cache, and
+    the relative ones resolved to absolute module paths.
+
+    :param file: Path for the Python file to be documented.
+    :type file: FilePath
+    :param cache_dir: Dir of the parsing cache, `None` for disabling it.
+    :type cache_dir: str | None = None
+    :param skip_function_bodies: If the statements inside functions are left out.
+    :type skip_function_bodies: bool = True
+    :param index: The project module index, for classifying the imports.
+    :type index: ModuleIndex | None = None
+    :return: The file metadata and every statement documented.
+    :rtype: FileContract
+    """
+
+    load_module_map(cache_dir)
+
+    with open(file, 'rb') as f:
+        st: stat_result = fstat(f.fileno())
+        raw: bytes = f.read()
+
+    record: FileContract
+    cached: object | None = None
+
+    if cache_dir is None:
+        record = _parse_python_code(raw, file, skip_function_bodies)
+    else:
+        key: str = cache_key(
+            raw, handler_salt(skip_function_bodies), splitext(file)[-1]
+        )
+
+        if (cached := read_cache(cache_dir, key)) is not None:
+            logger.debug('\tCode tree loaded from cache')
+            record = cast(FileContract, cached)
+        else:
+            record = _parse_python_code(raw, file, skip_function_bodies)
+            write_cache(cache_dir, key, record)
+
+    if index is not None or cached is not None:
+        record = _resolve_imports(record, file, index)
+
+    return record._replace(
+        stamp=SourceStamp(st.st_mtime_ns, st.st_size, sha256(raw).hexdigest())
+    )
+
+
+def _resolve_imports(
+    record: FileContract, file: FilePath, index: ModuleIndex | None = None
+) -> FileContract:
+    """
+    Classifies the file imports against the project modules, resolving relative ones.
+
+    Runs over the parsed or cached statements, since the result depends on where the
+    file is, which modules the project has and which packages are installed, not only
+    on the file content. With no `index`, just the module map of the run is used and
+    the relative imports are kept as written.
+
+    :param record: The parsed file, left untouched.
+    :type record: FileContract
+    :param file: Path for the Python file, for resolving it's relative imports.
+    :type file: FilePath
+    :param index: The project module index.
+    :type index: ModuleIndex | None = None
+    :return: The same file, with it's imports classified and resolved.
+    :rtype: FileContract
+    """
+
+    classify: Callable[[str], ImportType] = (
+        get_import_type if index is None else index.classify
+    )
+    statements: list[StandardReturn] = list(record.statements)
+
+    for i, stmt in enumerate(statements):
+        if isinstance(stmt, ImportContract):
+            statements[i] = stmt._replace(category=classify(stmt.name))
+        elif isinstance(stmt, ImportFromContract):
+            path: ModulePath = cast(ModulePath, stmt.path)
+
+            if index is not None:
+                path = index.resolve(path, file)
+
+            statements[i] = stmt._replace(
+                path=path,
+                category=ImportType.Local if path.startswith('.') else classify(path),
+            )
+
+    return record._replace(statements=tuple(statements))
+
+
+def _parse_python_code(
+    raw: bytes,
+    file: FilePath,
+    skip_function_bodies: bool = True,
+) -> FileContract:
+    """
+    Extracts the file metadata and statements from an already read Python code.
+
+    :param raw: The Python source code itself, as UTF-8 bytes.
+    :type raw: bytes
+    :param file: Path for the Python file, used for defining it's role.
+    :type file: FilePath
+    :param skip_function_bodies: If the statements inside functions are left out.
+    :type skip_function_bodies: bool = True
+    :return: The file metadata and every statement documented.
+    :rtype: FileContract
+    """
+
+    tree: ast.AST = ast.parse(raw.decode('utf-8-sig'), filename=file)
+    source: Source = Source(raw)
     logger.debug('\tCode tree parsed')
 
     statements: list[StandardReturn] = []
 
-    __meta__: StandardReturn = {
-        '__role__': (
+    __meta__: FileMetaContract = FileMetaContract(
+        role=(
             FileRole.PythonSourceCode
             if file.endswith('.py')
             else FileRole.PythonStubFile
         ),
-        '__docstring__': 'No file docstring provided.',
-    }
+        docstring=(
+            isinstance(tree, ast.Module)
+            and ast.get_docstring(tree)
+            or 'No file docstring provided.'
+        ),
+    )
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Module) and (__docstring__ := ast.get_docstring(node)):
-            __meta__['__docstring__'] = __docstring__
-        elif isinstance(node, ast.ClassDef):
+    for node in _walk_statements(tree, skip_function_bodies):
+        if isinstance(node, ast.ClassDef):
             _mark_methods(node)
         elif isinstance(node, ast.FunctionDef) and getattr(node, 'parent', None):
             continue
 
-        data: list[StandardReturn] = _handle_std_nodes(node)
+        node_data: list[StandardReturn] = _handle_std_nodes(node, source)
 
-        if data:
-            statements.extend(data)
+        if node_data:
+            statements.extend(node_data)
             logger.debug("\tNode inserted into file's structure")
 
-    statements.insert(0, __meta__)
+    return FileContract(__meta__, tuple(statements))
 
-    add_to_nested_defaultdict(codebase, file.split(sep), statements)
-    logger.debug(f'\t{file} parsing successfully done')
 
-    return codebase
+def _walk_statements(
+    tree: ast.AST, skip_function_bodies: bool = True
+) -> Iterator[ast.AST]:
+    """
+    Yields the statements of a tree, in the very same order `ast.walk` would.
+
+    Statements only ever live inside other statements (or `ast.ExceptHandler` and
+    `ast.match_case`), never inside expressions, so the breadth-first traversal just
+    descends into the fields listed by `STMT_FIELDS` for each node type. Expressions
+    are never visited, since none of them is documented.
+
+    If `skip_function_bodies`, `SCOPED_STMT_FIELDS` is used instead, so the functions
+    themselves are yielded but nothing inside them is.
+
+    Example:
+
+    ```python
+    import ast
 
+    tree: ast.AST = ast.parse('if DEBUG:\n    import pdb')
+    [type(i).__name__ for i in _walk_statements(tree)]
+    # ['Module', 'If', 'Import']
+    ```
 
-def _handle_std_nodes(node: ast.AST) -> list[StandardReturn]:
+    :param tree: The root node, usually an `ast.Module`.
+    :type tree: ast.AST
+    :param skip_function_bodies: If the statements inside functions are left out.
+    :type skip_function_bodies: bool = True
+    :return: Generator yielding the root and then every statement bellow it.
+    :rtype: Iterator[ast.AST]
+    """
+
+    fields: dict[type[ast.AST], tuple[str, ...]] = (
+        SCOPED_STMT_FIELDS if skip_function_bodies else STMT_FIELDS
+    )
+    todo: deque[ast.AST] = deque([tree])
+
+    while todo:
+        node: ast.AST = todo.popleft()
+
+        for field in fields.get(type(node), ()):
+            todo.extend(getattr(node, field))
+
+        yield node
+
+
+def _handle_std_nodes(
+    node: ast.AST, source: Source | None = None
+) -> list[StandardReturn]:
     """
     Processes an abstract syntax tree (AST) node and returns a handler for the node.
 
@@ -138,79 +405,78 @@ def _handle_std_nodes(node: ast.AST) -> list[StandardReturn]:
     - Classes: `ast.ClassDef`
     - Assertions: `ast.Assert`
 
+    The handler is found with a single lookup by the node exact type at the
+    `STD_NODE_HANDLERS` table, so nodes of any other type cost just that lookup.
+
     :param node: The AST node to process.
     :type node: ast.AST
+    :param source: The file source, for slicing the code snippets from.
+    :type source: Source | None = None
     :return: An object containing information associated with the node.
     :rtype: list[StandardReturn]
     """
 
-    data: list[StandardReturn] = []
-
-    if not isinstance(
-        node,
-        ast.Import
-        | ast.ImportFrom
-        | ast.Assign
-        | ast.AnnAssign
-        | ast.FunctionDef
-        | ast.AsyncFunctionDef
-        | ast.ClassDef
-        | ast.Assert,
-    ):
-        return data
+    handler: Callable[..., list[StandardReturn]] | None = STD_NODE_HANDLERS.get(
+        type(node)
+    )
+
+    if handler is None:
+        return []
 
     logger.debug(f'\tStd node found: {type(node)}')
 
-    # -------------------------
-    # Imports - ast.Import | ast.ImportFrom
-    # -------------------------
+    return handler([], node, source=source)
 
-    if isinstance(node, ast.Import):
-        data = _handle_import(data, node)
-    elif isinstance(node, ast.ImportFrom):
-        data = _handle_import_from(data, node)
 
-    # -------------------------
-    # Constants - ast.Assign | ast.AnnAssign
-    # -------------------------
+def _handle_constant_assign(
+    struct: list[StandardReturn], node: ast.Assign, source: Source | None = None
+) -> list[StandardReturn]:
+    """
+    Calls `_handle_assign` only if any of the node targets looks like a constant.
 
-    elif isinstance(node, ast.Assign):
-        lst: list[str] = []
-        for i in node.targets:
-            lst.extend(_handle_node(i))
+    A target looks like a constant if it's uppercase or one of the
+    `constants.ACCEPTABLE_LOWER_CONSTANTS`, such as `__all__`.
 
-        if any(map(str.isupper, lst)) or any(
-            map(lambda x: bin(x, ACCEPTABLE_LOWER_CONSTANTS), lst)
-        ):
-            data = _handle_assign(data, node)
-    elif isinstance(node, ast.AnnAssign):
-        if isinstance(node.target, ast.Name) and node.target.id.isupper():
-            data = _handle_annassign(data, node)
+    :param struct: The structure to be updated with statement details.
+    :type struct: list[StandardReturn]
+    :param node: The AST node representing a variable assignment.
+    :type node: ast.Assign
+    :param source: The file source, for slicing the code snippet from.
+    :type source: Source | None = None
+    :return: The updated struct, untouched if no constant is assigned.
+    :rtype: list[StandardReturn]
+    """
 
-    # -------------------------
-    # Functions - ast.FunctionDef | ast.AsyncFunctionDef
-    # -------------------------
+    lst: list[str] = []
+    for i in node.targets:
+        lst.extend(_handle_node(i))
 
-    elif isinstance(node, ast.FunctionDef):
-        data = _handle_function_def(data, node)
-    elif isinstance(node, ast.AsyncFunctionDef):
-        data = _handle_async_function_def(data, node)
+    if any(map(str.isupper, lst)) or not ACCEPTABLE_LOWER_CONSTANTS.isdisjoint(lst):
+        return _handle_assign(struct, node, source)
 
-    # -------------------------
-    # Classes - ast.ClassDef
-    # -------------------------
+    return struct
 
-    elif isinstance(node, ast.ClassDef):
-        data = _handle_class_def(data, node)
 
-    # -------------------------
-    # Assertions - ast.Assert
-    # -------------------------
+def _handle_constant_annassign(
+    struct: list[StandardReturn], node: ast.AnnAssign, source: Source | None = None
+) -> list[StandardReturn]:
+    """
+    Calls `_handle_annassign` only if the node target is an uppercase name.
 
-    else:
-        data = _handle_assert(data, node)
+    :param struct: The structure to be updated with statement details.
+    :type struct: list[StandardReturn]
+    :param node: The AST node representing a variable assignment with annotation.
+    :type node: ast.AnnAssign
+    :param source: The file source, for slicing the code snippet from.
+    :type source: Source | None = None
+    :return: The updated struct, untouched if no constant is assigned.
+    :rtype: list[StandardReturn]
+    """
 
-    return data
+    if isinstance(node.target, ast.Name) and node.target.id.isupper():
+        return _handle_annassign(struct, node, source)
+
+    return struct
 
 
 def _handle_node(node: ast.AST) -> list[str]:
@@ -234,20 +500,35 @@ def _handle_node(node: ast.AST) -> list[str]:
     return [ast.unparse(node)]
 
 
+def _code_snippet(node: ast.stmt, source: Source | None) -> CodeSnippet:
+    """
+    Gets the statement code, sliced from the source or, without it, unparsed.
+
+    :param node: The statement node.
+    :type node: ast.stmt
+    :param source: The file source the node was parsed from, if available.
+    :type source: Source | None
+    :return: The lazy source segment or the unparsed code.
+    :rtype: CodeSnippet
+    """
+
+    return source.segment(node) if source else ast.unparse(node)
+
+
 def __handle_import(imported_identifier: ImportedIdentifier) -> StandardReturn:
     """
-    Constructs a standardized dictionary representation for an import statement.
+    Constructs a standardized record representation for an import statement.
 
     This function processes the given library name, determines its import category
-    (local, native, or third-party), and builds a standardized dictionary structure
+    (local, native, or third-party), and builds a standardized record structure
     representing the import statement. The resulting data includes information about
     the statement type, library name, import category, and the generated import code.
 
     Key concepts:
     - Import Categorization: Determines whether the library is native (built-in),
       third-party, or local.
-    - Standardized Structure: Returns a dictionary conforming to the `StandardReturn`
-      format, ensuring consistency across codebase documentation.
+    - Standardized Structure: Returns an `ImportContract`, one of the `StandardReturn`
+      records, ensuring consistency across codebase documentation.
     - Dynamic Code Generation: Constructs the import statement dynamically based on
       the library name.
 
@@ -256,19 +537,19 @@ def __handle_import(imported_identifier: ImportedIdentifier) -> StandardReturn:
     ```python
     data: StandardReturn = __handle_import('os')
     data
-    # {
-    #     'statement': Statement.Import,
-    #     'name': 'os',
-    #     'path': None,
-    #     'category': ImportType.Native,
-    #     'code': 'import os',
-    # }
+    # ImportContract(
+    #     statement=Statement.Import,
+    #     name='os',
+    #     path=None,
+    #     category=ImportType.Native,
+    #     code='import os',
+    # )
     ```
 
     :param imported_identifier: The name of the lib, mod or element imported.
     :type imported_identifier: ImportedIdentifier
-    :return: A standardized dictionary representing the import statement.
-    :rtype: list[StandardReturn]
+    :return: A standardized record representing the import statement.
+    :rtype: StandardReturn
     """
 
     statement: Final[Statement] = Statement.Import
@@ -283,15 +564,11 @@ def __handle_import(imported_identifier: ImportedIdentifier) -> StandardReturn:
         code=f'import {imported_identifier}',
     )
 
-    data: StandardReturn = standard_struct()
-
-    data.update(contract._asdict())
-
-    return data
+    return contract
 
 
 def _handle_import(
-    struct: list[StandardReturn], node: ast.Import
+    struct: list[StandardReturn], node: ast.Import, source: Source | None = None
 ) -> list[StandardReturn]:
     """
     Updates a standard structure with information from an import statement node.
@@ -322,6 +599,8 @@ def _handle_import(
     :type struct: list[StandardReturn]
     :param node: The AST node representing an import statement.
     :type node: ast.Import
+    :param source: The file source, for slicing the code snippet from.
+    :type source: Source | None = None
     :return: The updated structure with information about the imported libraries.
     :rtype: list[StandardReturn]
     """
@@ -333,7 +612,7 @@ def _handle_import(
 
 
 def _handle_import_from(
-    struct: list[StandardReturn], node: ast.ImportFrom
+    struct: list[StandardReturn], node: ast.ImportFrom, source: Source | None = None
 ) -> list[StandardReturn]:
     """
     Processes an `ast.ImportFrom` node and returns its data.
@@ -345,7 +624,9 @@ def _handle_import_from(
     - Third-Party: The module is installed via external libraries.
     - Local: The module is neither built-in nor a third-party library, problably local.
 
-    Each module's data includes its path and category, stored in a structured dict.
+    Relative imports, such as `from . import models`, are always local ones.
+
+    Each module's data includes its path and category, stored in a structured record.
 
     Example:
 
@@ -362,23 +643,19 @@ def _handle_import_from(
     :type struct: list[StandardReturn]
     :param node: The AST node representing an import statement.
     :type node: ast.ImportFrom
-    :return: A dict containing the statement type and categorized module information.
+    :param source: The file source, for slicing the code snippet from.
+    :type source: Source | None = None
+    :return: The struct with the statement type and categorized module information.
     :rtype: list[StandardReturn]
     """
 
     statement: Final[Statement] = Statement.ImportFrom
     names: Final[list[ImportedIdentifier]] = [i.name for i in node.names]
-    path: Final[ModulePath | None] = node.module
-    category: ImportType = ImportType.Local
-    code: Final[CodeSnippet] = ast.unparse(node)
-
-    if bin(
-        f'{path}.'.split('.')[0],
-        BUILTIN_MODULES,
-    ):
-        category = ImportType.Native
-    elif get_import_type(str(path)):
-        category = ImportType.TrdParty
+    path: Final[ModulePath] = '.' * node.level + (node.module or '')
+    category: Final[ImportType] = (
+        ImportType.Local if node.level else get_import_type(path)
+    )
+    code: Final[CodeSnippet] = _code_snippet(node, source)
 
     for i in names:
         contract: ImportFromContract = ImportFromContract(
@@ -388,22 +665,20 @@ def _handle_import_from(
             category=category,
             code=code,
         )
-        data: StandardReturn = standard_struct()
-        data.update(contract._asdict())
 
-        struct.append(data)
+        struct.append(contract)
 
     return struct
 
 
 def _handle_assign(
-    struct: list[StandardReturn], node: ast.Assign
+    struct: list[StandardReturn], node: ast.Assign, source: Source | None = None
 ) -> list[StandardReturn]:
     """
     Processes an `ast.Assign` node and returns its data.
 
     This function analyzes the components of an assignment, including the target vars
-    and the assigned value, returning a structured dict with the extracted details.
+    and the assigned value, returning a structured record with the extracted details.
 
     Key elements of the returned data:
     - tokens: A list of string repr for all target variables in the assignment.
@@ -424,14 +699,16 @@ def _handle_assign(
     :type struct: list[StandardReturn]
     :param node: The AST node representing the node statement.
     :type node: ast.Assign
-    :return: A dict containing the statement type, target variables, and assigned value.
+    :param source: The file source, for slicing the code snippet from.
+    :type source: Source | None = None
+    :return: The struct with the statement type, target variables, and assigned value.
     :rtype: list[StandardReturn]
     """
 
     statement: Final[Statement] = Statement.Assign
     tokens: Final[list[Token]] = [_handle_node(i)[0] for i in node.targets]
     value: Final[Value] = _handle_node(node.value)[0]
-    code: Final[CodeSnippet] = ast.unparse(node)
+    code: Final[CodeSnippet] = _code_snippet(node, source)
 
     contract: AssignContract = AssignContract(
         statement=statement,
@@ -440,24 +717,20 @@ def _handle_assign(
         code=code,
     )
 
-    data: StandardReturn = standard_struct()
-
-    data.update(contract._asdict())
-
-    struct.append(data)
+    struct.append(contract)
 
     return struct
 
 
 def _handle_annassign(
-    struct: list[StandardReturn], node: ast.AnnAssign
+    struct: list[StandardReturn], node: ast.AnnAssign, source: Source | None = None
 ) -> list[StandardReturn]:
     """
     Processes an `ast.AnnAssign` node and returns its data.
 
     This function analyzes the components of an assignment, including the target var
-    and the assigned value, plus the typing annotation, returning a structured dict with
-    the extracted details.
+    and the assigned value, plus the typing annotation, returning a structured record
+    with the extracted details.
 
     Key elements of the returned data:
     - token: A string repr for the target var in the assignment.
@@ -479,7 +752,9 @@ def _handle_annassign(
     :type struct: list[StandardReturn]
     :param node: The AST node representing the node statement.
     :type node: ast.AnnAssign
-    :return: A dict with the statement type, target var, type hint and assigned value.
+    :param source: The file source, for slicing the code snippet from.
+    :type source: Source | None = None
+    :return: The struct with the statement type, target var, type hint and value.
     :rtype: list[StandardReturn]
     """
 
@@ -487,7 +762,7 @@ def _handle_annassign(
     name: Token = _handle_node(node.target)[0]
     annot: Annotation = _handle_node(node.annotation)[0]
     value: Value = _handle_node(node.value)[0] if node.value else ''
-    code: CodeSnippet = ast.unparse(node)
+    code: CodeSnippet = _code_snippet(node, source)
 
     contract: AnnAssignContract = AnnAssignContract(
         statement=statement,
@@ -497,11 +772,7 @@ def _handle_annassign(
         code=code,
     )
 
-    data: StandardReturn = standard_struct()
-
-    data.update(contract._asdict())
-
-    struct.append(data)
+    struct.append(contract)
 
     return struct
 
@@ -666,6 +937,8 @@ def __process_function_type(node: ast.FunctionDef, is_from_class: bool) -> Funct
     - Elif contains a `yield` type statements, it returns a `Generator`.
     - Otherwise, it returns a `Function`.
 
+    The `yield` lookup is done by `__yields`, which never enters nested scopes.
+
     :param node: The AST node representing the function.
     :type node: ast.FunctionDef
     :param is_from_class: Indicates if the function is defined within a class.
@@ -674,17 +947,60 @@ def __process_function_type(node: ast.FunctionDef, is_from_class: bool) -> Funct
     :rtype: FunctionType
     """
 
-    if is_from_class or bin(node.name, BUILTIN_DUNDER_METHODS):
+    if is_from_class or node.name in BUILTIN_DUNDER_METHODS:
         return FunctionType.Method
 
-    elif any(isinstance(n, ast.Yield | ast.YieldFrom) for n in ast.walk(node)):
+    elif __yields(node):
         return FunctionType.Generator
 
     return FunctionType.Function
 
 
+def __yields(node: ast.FunctionDef) -> bool:
+    """
+    Checks if a function body has any `yield` or `yield from` of it's own.
+
+    Only the function own scope is searched: nested functions, lambdas and classes are
+    not entered, since a `yield` there belongs to them - just their decorators and
+    default values, evaluated by the enclosing function, are. This way, each node of a
+    file is searched at most once, no matter how deeply the functions are nested,
+    instead of every function walking all the functions inside it once again.
+
+    :param node: The AST node representing the function.
+    :type node: ast.FunctionDef
+    :return: If the function is a generator.
+    :rtype: bool
+    """
+
+    todo: list[ast.AST] = list(node.body)
+
+    while todo:
+        child: ast.AST = todo.pop()
+
+        if isinstance(child, ast.Yield | ast.YieldFrom):
+            return True
+        elif isinstance(child, ast.FunctionDef | ast.AsyncFunctionDef):
+            todo.extend(child.decorator_list)
+            todo.extend(child.args.defaults)
+            todo.extend(i for i in child.args.kw_defaults if i)
+        elif isinstance(child, ast.Lambda):
+            todo.extend(child.args.defaults)
+            todo.extend(i for i in child.args.kw_defaults if i)
+        elif isinstance(child, ast.ClassDef):
+            todo.extend(child.decorator_list)
+            todo.extend(child.bases)
+            todo.extend(i.value for i in child.keywords)
+        else:
+            todo.extend(ast.iter_child_nodes(child))
+
+    return False
+
+
 def _handle_function_def(
-    struct: list[StandardReturn], node: ast.FunctionDef, is_from_class: bool = False
+    struct: list[StandardReturn],
+    node: ast.FunctionDef,
+    is_from_class: bool = False,
+    source: Source | None = None,
 ) -> list[StandardReturn]:
     """
     Processes an `ast.FunctionDef` node and returns its data.
@@ -713,7 +1029,9 @@ def _handle_function_def(
     :type node: ast.FunctionDef
     :param is_from_class: The arg who tells if shoud be directly defined as a Method.
     :type is_from_class: bool = False
-    :return: A dict containing the statement type and the data listed before.
+    :param source: The file source, for slicing the code snippet from.
+    :type source: Source | None = None
+    :return: The struct with the statement type and the data listed before.
     :rtype: list[StandardReturn]
     """
 
@@ -724,7 +1042,7 @@ def _handle_function_def(
     rtype: Final[Annotation | None] = (
         _handle_node(node.returns)[0] if node.returns else None
     )
-    code: Final[CodeSnippet] = ast.unparse(node)
+    code: Final[CodeSnippet] = _code_snippet(node, source)
 
     args_str: Final[Args] = __process_function_args(node.args)
     kwargs_str: Final[Kwargs] = __process_function_kwargs(node.args)
@@ -743,17 +1061,15 @@ def _handle_function_def(
         code=code,
     )
 
-    data: StandardReturn = standard_struct()
-
-    data.update(contract._asdict())
-
-    struct.append(data)
+    struct.append(contract)
 
     return struct
 
 
 def _handle_async_function_def(
-    struct: list[StandardReturn], node: ast.AsyncFunctionDef
+    struct: list[StandardReturn],
+    node: ast.AsyncFunctionDef,
+    source: Source | None = None,
 ) -> list[StandardReturn]:
     """
     Processes an `ast.AsyncFunctionDef` node and returns its data.
@@ -778,7 +1094,9 @@ def _handle_async_function_def(
     :type struct: list[StandardReturn]
     :param node: The AST node representing a func def statement.
     :type node: ast.AsyncFunctionDef
-    :return: A dict containing the statement type and the data listed before.
+    :param source: The file source, for slicing the code snippet from.
+    :type source: Source | None = None
+    :return: The struct with the statement type and the data listed before.
     :rtype: list[StandardReturn]
     """
 
@@ -789,7 +1107,7 @@ def _handle_async_function_def(
     rtype: Final[Annotation | None] = (
         _handle_node(node.returns)[0] if node.returns else None
     )
-    code: Final[CodeSnippet] = ast.unparse(node)
+    code: Final[CodeSnippet] = _code_snippet(node, source)
 
     args_str: Final[Args] = __process_function_args(node.args)
     kwargs_str: Final[Kwargs] = __process_function_kwargs(node.args)
@@ -806,11 +1124,7 @@ def _handle_async_function_def(
         code=code,
     )
 
-    data: StandardReturn = standard_struct()
-
-    data.update(contract._asdict())
-
-    struct.append(data)
+    struct.append(contract)
 
     return struct
 
@@ -896,13 +1210,13 @@ def __process_class_kwargs(keywords: list[ast.keyword]) -> str:
 
 
 def _handle_class_def(
-    struct: list[StandardReturn], node: ast.ClassDef
+    struct: list[StandardReturn], node: ast.ClassDef, source: Source | None = None
 ) -> list[StandardReturn]:
     """
     Processes an `ast.ClassDef` node and returns its data.
 
     This function analyzes the components of a class definition, including its name,
-    base classes, decorators, and keyword arguments, returning a structured dict with
+    base classes, decorators, and keyword arguments, returning a structured record with
     the extracted details.
 
     Key elements of the returned data:
@@ -926,7 +1240,9 @@ def _handle_class_def(
     :type struct: list[StandardReturn]
     :param node: The AST node representing a class definition.
     :type node: ast.ClassDef
-    :return: A dict with the statement type, name, base classes, decorators, and kwargs.
+    :param source: The file source, for slicing the code snippet from.
+    :type source: Source | None = None
+    :return: The struct with the statement type, name, bases, decorators, and kwargs.
     :rtype: list[StandardReturn]
     """
 
@@ -938,7 +1254,7 @@ def _handle_class_def(
     ]
     decos: Final[list[Decorator]] = [_handle_node(i)[0] for i in node.decorator_list]
     kwargs_str: Kwargs = __process_class_kwargs(node.keywords)
-    code: Final[CodeSnippet] = ast.unparse(node)
+    code: Final[CodeSnippet] = _code_snippet(node, source)
 
     contract: ClassDefContract = ClassDefContract(
         statement=statement,
@@ -950,29 +1266,23 @@ def _handle_class_def(
         code=code,
     )
 
-    data: StandardReturn = standard_struct()
-
-    data.update(contract._asdict())
-
-    struct.append(data)
+    struct.append(contract)
 
     for child in node.body:
         if isinstance(child, ast.FunctionDef):
-            function_data: StandardReturn = standard_struct()
-            function_data.update(_handle_function_def([], child, is_from_class=True)[0])
-            struct.append(function_data)
+            _handle_function_def(struct, child, is_from_class=True, source=source)
 
     return struct
 
 
 def _handle_assert(
-    struct: list[StandardReturn], node: ast.Assert
+    struct: list[StandardReturn], node: ast.Assert, source: Source | None = None
 ) -> list[StandardReturn]:
     """
     Processes an `ast.Assert` node and returns its data.
 
     This function analyzes the components of an assertion, including the expression of
-    the test and the optional message, returning a structured dict with the extracted
+    the test and the optional message, returning a structured record with the extracted
     details.
 
     Key elements of the returned data:
@@ -984,7 +1294,9 @@ def _handle_assert(
     :type struct: list[StandardReturn]
     :param node: The AST node representing an assertion statement.
     :type node: ast.Assert
-    :return: A dict with the statement type, test expression, and optional message.
+    :param source: The file source, for slicing the code snippet from.
+    :type source: Source | None = None
+    :return: The struct with the statement type, test expression, and message.
     :rtype: list[StandardReturn]
     """
 
@@ -993,7 +1305,7 @@ def _handle_assert(
     msg: Final[AssertionMessage | None] = (
         _handle_node(node.msg)[0] if node.msg else None
     )
-    code: Final[CodeSnippet] = ast.unparse(node)
+    code: Final[CodeSnippet] = _code_snippet(node, source)
 
     contract: AssertContract = AssertContract(
         statement=statement,
@@ -1002,13 +1314,21 @@ def _handle_assert(
         code=code,
     )
 
-    data: StandardReturn = standard_struct()
+    struct.append(contract)
 
-    data.update(contract._asdict())
+    return struct
 
-    struct.append(data)
 
-    return struct
+STD_NODE_HANDLERS: Final[dict[type[ast.AST], Callable[..., list[StandardReturn]]]] = {
+    ast.Import: _handle_import,
+    ast.ImportFrom: _handle_import_from,
+    ast.Assign: _handle_constant_assign,
+    ast.AnnAssign: _handle_constant_annassign,
+    ast.FunctionDef: _handle_function_def,
+    ast.AsyncFunctionDef: _handle_async_function_def,
+    ast.ClassDef: _handle_class_def,
+    ast.Assert: _handle_assert,
+}
 
 
 def _mark_methods(node: ast.ClassDef) -> None:
@@ -1043,6 +1363,23 @@ def wrapped_mark_methods_for_testing(node: ast.ClassDef) -> None:
     return _mark_methods(node)
 
 
+def wrapped_walk_statements_for_testing(
+    tree: ast.AST, skip_function_bodies: bool = True
+) -> list[ast.AST]:
+    """
+    Just encapsulates `_walk_statements` function, just for unittesting.
+
+    :param tree: The root node, usually an `ast.Module`.
+    :type tree: ast.AST
+    :param skip_function_bodies: If the statements inside functions are left out.
+    :type skip_function_bodies: bool = True
+    :return: The root and then every statement bellow it.
+    :rtype: list[ast.AST]
+    """
+
+    return list(_walk_statements(tree, skip_function_bodies))
+
+
 def wrapped_handle_std_nodes_for_testing(node: ast.AST) -> list[StandardReturn]:
     """
     Just encapsulates `_handle_std_nodes` function, just for unittesting.
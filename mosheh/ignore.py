@@ -0,0 +1,352 @@
+"""
+Decides which paths are left out when walking the codebase, before even entering them.
+
+The rules follow the `.gitignore` syntax and are grouped in sets, each one relative to
+the dir it was defined for; when walking, the sets are checked in the order below, the
+last match winning, just like the lines of a single `.gitignore` file:
+
+1. `DEFAULT_EXCLUDE`: virtual envs, VCS metadata, caches and build outputs, which never
+    hold documentable code but may hold way more files than the codebase itself.
+2. `.gitignore` files: from the Git repository root down to the walked dir, so the
+    ones above the codebase root count as well.
+3. `io.exclude`: the `mosheh.json` patterns, relative to the codebase root.
+4. `io.include`: the `mosheh.json` patterns re-including what any of the above left
+    out, also relative to the codebase root.
+
+About the syntax: blank lines and `#` comments are skipped, a leading `!` negates the
+pattern, a trailing `/` matches just dirs and a pattern with a `/` anywhere else is
+anchored to it's base dir, while the other ones match at any depth. `*` and `?` never
+match a `/`, `[...]` matches a char set and `**` matches any number of dirs.
+
+Example:
+
+```python
+rules: RuleSet = compile_rules(['build/', '!build/keep.py', '/docs'], '/project')
+match_rules(rules, '/project/app/build', True)
+# True
+match_rules(rules, '/project/app/docs', True)
+# None
+```
+
+The walker checks each entry with `is_ignored`; an ignored dir is still walked if
+`includes_inside` it, as `io.include` may point to something inside it.
+"""
+
+import re
+from collections.abc import Iterable, Sequence
+from os import path, sep
+from typing import Final, NamedTuple
+
+from mosheh.types.basic import FilePath
+
+
+DEFAULT_EXCLUDE: Final[tuple[str, ...]] = (
+    '.git/',
+    '.hg/',
+    '.svn/',
+    '.venv/',
+    'venv/',
+    '.tox/',
+    '.nox/',
+    '.eggs/',
+    '*.egg-info/',
+    '__pycache__/',
+    '.mypy_cache/',
+    '.pytest_cache/',
+    '.ruff_cache/',
+    'node_modules/',
+    'site-packages/',
+    '/build/',
+    '/dist/',
+)
+
+GITIGNORE: Final[str] = '.gitignore'
+
+
+class Rule(NamedTuple):
+    """A single compiled pattern, as written on a `.gitignore` line."""
+
+    regex: re.Pattern[str]
+    negated: bool
+    dir_only: bool
+    anchored: bool
+    prefix: str
+
+
+class RuleSet(NamedTuple):
+    """The compiled patterns of a same base dir, in their declaration order."""
+
+    base: FilePath
+    rules: tuple[Rule, ...]
+    names: re.Pattern[str]
+    paths: re.Pattern[str]
+
+
+def compile_rules(patterns: Iterable[str], base: FilePath) -> RuleSet:
+    """
+    Compiles `.gitignore`-like patterns, relative to `base`, into a `RuleSet`.
+
+    :param patterns: The patterns or the `.gitignore` lines themselves.
+    :type patterns: Iterable[str]
+    :param base: The dir the patterns are relative to.
+    :type base: FilePath
+    :return: The compiled rules.
+    :rtype: RuleSet
+    """
+
+    rules: list[Rule] = []
+
+    for line in patterns:
+        pattern: str = line.rstrip()
+
+        if not pattern or pattern.startswith('#'):
+            continue
+
+        negated: bool = pattern.startswith('!')
+        pattern = pattern.removeprefix('!').removeprefix('\\')
+        dir_only: bool = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+
+        if not pattern:
+            continue
+
+        anchored: bool = '/' in pattern
+        pattern = pattern.lstrip('/')
+
+        rules.append(
+            Rule(
+                regex=re.compile(_translate(pattern)),
+                negated=negated,
+                dir_only=dir_only,
+                anchored=anchored,
+                prefix=re.split(r'[*?\[]', pattern)[0] if anchored else '',
+            )
+        )
+
+    return RuleSet(
+        path.abspath(base),
+        tuple(rules),
+        _combine(i for i in rules if not i.anchored),
+        _combine(i for i in rules if i.anchored),
+    )
+
+
+def read_gitignore(dirpath: FilePath) -> RuleSet | None:
+    """
+    Reads the `.gitignore` file of a dir, if there is a readable one.
+
+    :param dirpath: The dir possibly holding a `.gitignore` file.
+    :type dirpath: FilePath
+    :return: It's compiled rules or `None`.
+    :rtype: RuleSet | None
+    """
+
+    try:
+        with open(path.join(dirpath, GITIGNORE), encoding='utf-8') as f:
+            return compile_rules(f.read().splitlines(), dirpath)
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def parent_gitignores(root: FilePath) -> list[RuleSet]:
+    """
+    Reads the `.gitignore` files above `root`, up to the Git repository root.
+
+    If `root` is not inside a Git repository, nothing is read, since no `.gitignore`
+    file would apply there.
+
+    :param root: The codebase root dir.
+    :type root: FilePath
+    :return: The compiled rules, from the outermost dir to the innermost one.
+    :rtype: list[RuleSet]
+    """
+
+    dirs: list[FilePath] = []
+    current: FilePath = path.dirname(path.abspath(root))
+
+    if path.exists(path.join(root, '.git')):
+        return []
+
+    while True:
+        dirs.append(current)
+
+        if path.exists(path.join(current, '.git')):
+            break
+
+        parent: FilePath = path.dirname(current)
+
+        if parent == current:
+            return []
+
+        current = parent
+
+    return [i for i in map(read_gitignore, reversed(dirs)) if i is not None]
+
+
+def match_rules(rules: RuleSet, file: FilePath, is_dir: bool) -> bool | None:
+    """
+    Checks a path against a rule set, the last matching rule winning.
+
+    The patterns with no `/`, matching at any depth, are checked against the path name
+    only. Since most paths match no rule at all, they are discarded by a single regex
+    of each kind, before checking the rules one by one.
+
+    :param rules: The compiled rules.
+    :type rules: RuleSet
+    :param file: The absolute path to be checked.
+    :type file: FilePath
+    :param is_dir: If the path is a dir.
+    :type is_dir: bool
+    :return: `True` if ignored, `False` if re-included and `None` if not matched.
+    :rtype: bool | None
+    """
+
+    rel: str | None = _relative(file, rules.base)
+
+    if rel is None:
+        return None
+
+    name: str = rel.rpartition('/')[2]
+    result: bool | None = None
+
+    if not (rules.names.fullmatch(name) or rules.paths.fullmatch(rel)):
+        return None
+
+    for rule in rules.rules:
+        if rule.dir_only and not is_dir:
+            continue
+        if rule.regex.fullmatch(rel if rule.anchored else name):
+            result = not rule.negated
+
+    return result
+
+
+def is_ignored(
+    file: FilePath,
+    is_dir: bool,
+    sets: Sequence[RuleSet],
+    include: RuleSet | None = None,
+    parent_ignored: bool = False,
+) -> bool:
+    """
+    Checks if a path must be left out, following the rule sets and then `include`.
+
+    :param file: The absolute path to be checked.
+    :type file: FilePath
+    :param is_dir: If the path is a dir.
+    :type is_dir: bool
+    :param sets: The rule sets, from the lowest priority to the highest one.
+    :type sets: Sequence[RuleSet]
+    :param include: The rules re-including paths, taking precedence over the others.
+    :type include: RuleSet | None = None
+    :param parent_ignored: If the parent dir is ignored, so is the path by default.
+    :type parent_ignored: bool = False
+    :return: If the path must be left out.
+    :rtype: bool
+    """
+
+    ignored: bool = parent_ignored
+
+    for rules in sets:
+        if (result := match_rules(rules, file, is_dir)) is not None:
+            ignored = result
+
+    if not ignored or include is None:
+        return ignored
+
+    return match_rules(include, file, is_dir) is not True
+
+
+def includes_inside(include: RuleSet, dirpath: FilePath) -> bool:
+    """
+    Checks if some anchored `include` pattern points inside a dir.
+
+    An ignored dir like that must still be walked, with it's content ignored unless
+    included, e.g. `build/gen/` is re-included while the rest of `build/` is not.
+
+    :param include: The rules re-including paths.
+    :type include: RuleSet
+    :param dirpath: The absolute dir path.
+    :type dirpath: FilePath
+    :return: If some included path may be inside the dir.
+    :rtype: bool
+    """
+
+    rel: str | None = _relative(dirpath, include.base)
+
+    return rel is not None and any(
+        i.prefix.startswith(f'{rel}/') for i in include.rules if not i.negated
+    )
+
+
+def _combine(rules: Iterable[Rule]) -> re.Pattern[str]:
+    """
+    Joins the rules regexes into a single one, matching if any of them does.
+
+    :param rules: The rules to be joined.
+    :type rules: Iterable[Rule]
+    :return: The joined regex, never matching if there is no rule.
+    :rtype: re.Pattern[str]
+    """
+
+    return re.compile('|'.join(f'(?:{i.regex.pattern})' for i in rules) or '(?!)')
+
+
+def _relative(file: FilePath, base: FilePath) -> str | None:
+    """
+    Turns a path into a `/`-separated one relative to `base`, for matching the rules.
+
+    Slicing the absolute paths, as the walked ones are, avoids `os.path.relpath`
+    normalizing both paths for every single dir entry.
+
+    :param file: The absolute path to be turned relative.
+    :type file: FilePath
+    :param base: The absolute dir the path is relative to.
+    :type base: FilePath
+    :return: The relative path, `None` if not inside `base`.
+    :rtype: str | None
+    """
+
+    if not file.startswith(base) or file[len(base) : len(base) + 1] != sep:
+        return None
+
+    rel: str = file[len(base) + 1 :]
+
+    return rel if sep == '/' else rel.replace(sep, '/')
+
+
+def _translate(pattern: str) -> str:
+    """
+    Translates a `.gitignore` glob into a regex, where `*` never matches a `/`.
+
+    :param pattern: The glob pattern, with no leading nor trailing `/`.
+    :type pattern: str
+    :return: The equivalent regex.
+    :rtype: str
+    """
+
+    regex: list[str] = []
+    i: int = 0
+
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            regex.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('**', i):
+            regex.append('.*')
+            i += 2
+        elif pattern[i] == '*':
+            regex.append('[^/]*')
+            i += 1
+        elif pattern[i] == '?':
+            regex.append('[^/]')
+            i += 1
+        elif pattern[i] == '[' and (end := pattern.find(']', i + 2)) != -1:
+            chars: str = pattern[i + 1 : end].replace('\\', '\\\\')
+            regex.append(f'[{"^" + chars[1:] if chars.startswith("!") else chars}]')
+            i = end + 1
+        else:
+            regex.append(re.escape(pattern[i]))
+            i += 1
+
+    return ''.join(regex)
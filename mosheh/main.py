@@ -14,12 +14,10 @@ The stuff documented for each file is avaible at https://lucasgoncsilva.github.i
 from argparse import ArgumentParser, Namespace, RawDescriptionHelpFormatter
 from logging import CRITICAL, DEBUG, ERROR, INFO, WARNING, basicConfig, getLogger
 
-from rich.logging import RichHandler
+import mosheh.commands
 
-from mosheh.commands import create, init, update
 
-
-def set_logging_config(v: int = 3) -> None:
+def set_logging_config(v: int = 3, rich: bool = True) -> None:
     """
     Configures the logging level for the application based on the provided verbosity.
 
@@ -27,6 +25,10 @@ def set_logging_config(v: int = 3) -> None:
     level `v` controls the logging granularity for the `mosheh` logger, and optionally
     for the `mkdocs` logger in debug mode.
 
+    `rich` is only imported here, once a command rendering output is about to run, so
+    the CLI startup - or just printing the help - does not pay for it; with `rich` set
+    to `False`, e.g. for `init`, it's never imported, plain `logging` being used.
+
     :param v: Verbosity level, from 0 (critical) to 4 (debug). Defaults to 3 (info).\n
         - 0: Critical
         - 1: Error
@@ -34,14 +36,21 @@ def set_logging_config(v: int = 3) -> None:
         - 3: Info (default)
         - 4: Debug
     :type v: int = 3
+    :param rich: If the logs are handled by `RichHandler` instead of plain `logging`.
+    :type rich: bool = True
     :return: None
     :rtype: None
     """
 
-    basicConfig(
-        format='%(message)s',
-        handlers=[RichHandler()],
-    )
+    if rich:
+        from rich.logging import RichHandler
+
+        basicConfig(
+            format='%(message)s',
+            handlers=[RichHandler()],
+        )
+    else:
+        basicConfig(format='%(levelname)-8s %(message)s')
 
     match v:
         case 0:
@@ -64,7 +73,8 @@ def main() -> None:
 
     It takes no parameters inside code itself, but uses ArgumentParser to deal with
     them. Parsing the args, extracts the infos provided to deal and construct the
-    output doc based on them.
+    output doc based on them; just the chosen command module is imported, from
+    `mosheh.commands`, right before running it.
 
     :return: None
     :rtype: None
@@ -84,7 +94,7 @@ def main() -> None:
     parser_init.add_argument(
         '--path', type=str, default='.', help='Path for `mosheh.json` config file.'
     )
-    parser_init.set_defaults(func=init)
+    parser_init.set_defaults(command='init')
 
     # Command: create
     parser_create = subparsers.add_parser(
@@ -93,7 +103,14 @@ def main() -> None:
     parser_create.add_argument(
         '--json', type=str, default='.', help='Path for `mosheh.json` config file.'
     )
-    parser_create.set_defaults(func=create)
+    parser_create.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Number of processes parsing the codebase, 0 for all CPUs; overrides'
+        ' `io.jobs`.',
+    )
+    parser_create.set_defaults(command='create')
 
     # Command: update
     parser_update = subparsers.add_parser(
@@ -104,7 +121,45 @@ def main() -> None:
     parser_update.add_argument(
         '--json', type=str, default='.', help='Path for `mosheh.json` config file.'
     )
-    parser_update.set_defaults(func=update)
+    parser_update.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Number of processes parsing the codebase, 0 for all CPUs; overrides'
+        ' `io.jobs`.',
+    )
+    parser_update.add_argument(
+        '--since',
+        type=str,
+        default=None,
+        help='Git revision to diff against, patching just the pages of the Python'
+        ' files changed since it.',
+    )
+    parser_update.set_defaults(command='update')
+
+    # Command: watch
+    parser_watch = subparsers.add_parser(
+        'watch',
+        help='Updates the documentation based on `mosheh.json` and then patches it'
+        ' on every change to the codebase, until interrupted.',
+    )
+    parser_watch.add_argument(
+        '--json', type=str, default='.', help='Path for `mosheh.json` config file.'
+    )
+    parser_watch.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Number of processes parsing the codebase, 0 for all CPUs; overrides'
+        ' `io.jobs`.',
+    )
+    parser_watch.add_argument(
+        '--debounce',
+        type=int,
+        default=100,
+        help='Milliseconds with no change for a burst of changes to be patched.',
+    )
+    parser_watch.set_defaults(command='watch')
 
     parser.add_argument(
         '--verbose',
@@ -116,9 +171,9 @@ def main() -> None:
 
     args: Namespace = parser.parse_args()
 
-    set_logging_config(args.verbose)
+    set_logging_config(args.verbose, rich=args.command != 'init')
 
-    args.func(args)
+    getattr(mosheh.commands, args.command)(args)
 
 
 if __name__ == '__main__':
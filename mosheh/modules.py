@@ -0,0 +1,348 @@
+"""
+Classifies imported modules as native, third-party or local without importing them.
+
+Asking `importlib.util.find_spec` about each imported module is slow and, for dotted
+names, imports the parent packages, running third-party code just for documenting it.
+Instead, this module builds a map of every top-level module name available to the
+interpreter once per run, so classifying an import is just a dict lookup:
+
+- Native: every name from `constants.BUILTIN_MODULES`, i.e. `sys.stdlib_module_names`
+  and `sys.builtin_module_names`.
+- Third-Party: every top-level package or module found by scanning the `sys.path`
+  entries which are site dirs, i.e. `site-packages` or `dist-packages`.
+- Local: anything else, which is never stored, being just the lookup default.
+
+The site dirs are scanned with `os.scandir`, reading just the entry names, so nothing
+is imported, executed or even opened. The map is persisted through `mosheh.cache`,
+keyed by a fingerprint of the interpreter and of the site dirs - including their
+mtimes, which change on every package (un)install - so the next runs load it instead
+of scanning again.
+
+Example:
+
+```python
+load_module_map('.mosheh_cache')
+get_module_map().get('numpy', ImportType.Local)
+# ImportType.TrdParty
+```
+
+The project own modules are indexed apart, by `build_module_index`, from the files
+found under the documented root dir. A `ModuleIndex` resolves relative imports to the
+absolute module path and classifies as local every module of the project, even the
+ones shadowing an installed or stdlib name, exactly like the import system does when
+running from the root dir; so the result never depends on where Mosheh is called from.
+
+```python
+index: ModuleIndex = build_module_index('PROJECT')
+index.resolve('..models', 'PROJECT/account/views/home.py')
+# 'account.models'
+index.classify('account.models')
+# ImportType.Local
+```
+"""
+
+import site
+import sys
+from collections.abc import Iterable
+from functools import cache
+from logging import Logger, getLogger
+from os import path, scandir, stat, walk
+from typing import Final
+
+from mosheh import constants
+from mosheh.cache import cache_key, read_cache, write_cache
+from mosheh.types.basic import FilePath, ModuleName, ModulePath
+from mosheh.types.enums import ImportType
+
+
+logger: Logger = getLogger('mosheh')
+
+SITE_DIR_NAMES: Final[tuple[str, ...]] = ('site-packages', 'dist-packages')
+
+MODULE_SUFFIXES: Final[tuple[str, ...]] = ('.py', '.pyi', '.pyc', '.so', '.pyd')
+
+_module_map: dict[ModuleName, ImportType] | None = None
+
+
+def get_module_map() -> dict[ModuleName, ImportType]:
+    """
+    Returns the module map of this run, building it on the first call.
+
+    :return: Each top-level module name mapped to it's import type.
+    :rtype: dict[ModuleName, ImportType]
+    """
+
+    return _module_map if _module_map is not None else load_module_map()
+
+
+def load_module_map(cache_dir: str | None = None) -> dict[ModuleName, ImportType]:
+    """
+    Loads the module map of this run, from the cache if available, or builds it.
+
+    Just the first call does something: once loaded, the very same map is returned,
+    no matter the `cache_dir`.
+
+    :param cache_dir: Dir of the cache, `None` for always scanning the site dirs.
+    :type cache_dir: str | None = None
+    :return: Each top-level module name mapped to it's import type.
+    :rtype: dict[ModuleName, ImportType]
+    """
+
+    global _module_map
+
+    if _module_map is not None:
+        return _module_map
+
+    key: str = cache_key(module_map_fingerprint().encode(), 'module-map')
+
+    if cache_dir is not None and isinstance(cached := read_cache(cache_dir, key), dict):
+        logger.debug('\tModule map loaded from cache')
+        _module_map = cached
+        return cached
+
+    _module_map = build_module_map()
+    logger.debug(f'\tModule map built with {len(_module_map)} modules')
+
+    if cache_dir is not None:
+        write_cache(cache_dir, key, _module_map)
+
+    return _module_map
+
+
+def build_module_map(
+    site_dirs: list[str] | None = None,
+) -> dict[ModuleName, ImportType]:
+    """
+    Scans the site dirs for their top-level modules, without importing any of them.
+
+    The stdlib names take precedence over the installed ones, as the stdlib comes first
+    on `sys.path`; between site dirs, the first one listing a name wins, just like the
+    import system itself.
+
+    :param site_dirs: The dirs to be scanned; `site_packages()` if `None`.
+    :type site_dirs: list[str] | None = None
+    :return: Each top-level module name mapped to it's import type.
+    :rtype: dict[ModuleName, ImportType]
+    """
+
+    module_map: dict[ModuleName, ImportType] = {}
+
+    for site_dir in site_packages() if site_dirs is None else site_dirs:
+        for name in _top_level_names(site_dir):
+            module_map.setdefault(name, ImportType.TrdParty)
+
+    for name in constants.BUILTIN_MODULES:
+        module_map[name] = ImportType.Native
+
+    return module_map
+
+
+@cache
+def site_packages() -> list[str]:
+    """
+    Lists the `sys.path` entries holding third-party packages, keeping their order.
+
+    :return: The site dirs absolute paths.
+    :rtype: list[str]
+    """
+
+    known: set[str] = {
+        path.abspath(i) for i in (*site.getsitepackages(), site.getusersitepackages())
+    }
+    dirs: list[str] = []
+
+    for entry in map(path.abspath, filter(None, sys.path)):
+        if entry in dirs or not path.isdir(entry):
+            continue
+        if entry in known or path.basename(entry) in SITE_DIR_NAMES:
+            dirs.append(entry)
+
+    return dirs
+
+
+@cache
+def module_map_fingerprint() -> str:
+    """
+    Identifies the interpreter and it's installed packages, for keying the module map.
+
+    Made of the interpreter executable and version, plus each site dir with it's mtime,
+    so installing or removing any package leads to a new fingerprint.
+
+    :return: The fingerprint, as a plain string.
+    :rtype: str
+    """
+
+    parts: list[str] = [sys.executable, sys.version]
+
+    for site_dir in site_packages():
+        parts.append(f'{site_dir}:{stat(site_dir).st_mtime_ns}')
+
+    return '\0'.join(parts)
+
+
+def _top_level_names(site_dir: str) -> set[ModuleName]:
+    """
+    Lists the importable top-level names of a dir, by it's entries names only.
+
+    Packages, namespace ones included, are the dirs with a valid identifier name, while
+    modules are the Python and extension files, such as `six.py` or
+    `_cffi_backend.cpython-312-x86_64-linux-gnu.so`.
+
+    :param site_dir: The dir to be scanned.
+    :type site_dir: str
+    :return: Every top-level module name found.
+    :rtype: set[ModuleName]
+    """
+
+    names: set[ModuleName] = set()
+
+    try:
+        entries = list(scandir(site_dir))
+    except OSError:
+        return names
+
+    for entry in entries:
+        if entry.name.startswith('__'):
+            continue
+
+        if entry.is_dir():
+            name: str = entry.name
+        elif entry.name.endswith(MODULE_SUFFIXES):
+            name = entry.name.partition('.')[0]
+        else:
+            continue
+
+        if name.isidentifier():
+            names.add(name)
+
+    return names
+
+
+class ModuleIndex:
+    """The project modules, by their absolute module path, for resolving imports."""
+
+    __slots__ = ('root', 'modules', 'packages', 'top_level')
+
+    def __init__(
+        self,
+        root: str,
+        modules: dict[ModulePath, FilePath],
+        packages: dict[FilePath, ModulePath],
+    ) -> None:
+        """
+        Indexes the project modules paths, files and top-level names.
+
+        :param root: The project root dir, where the absolute imports start from.
+        :type root: str
+        :param modules: Each module path mapped to it's file.
+        :type modules: dict[ModulePath, FilePath]
+        :param packages: Each normalized file path mapped to it's package path.
+        :type packages: dict[FilePath, ModulePath]
+        :return: None
+        :rtype: None
+        """
+
+        self.root: str = root
+        self.modules: dict[ModulePath, FilePath] = modules
+        self.packages: dict[FilePath, ModulePath] = packages
+        self.top_level: frozenset[ModuleName] = frozenset(
+            i.partition('.')[0] for i in modules
+        )
+
+    def classify(self, module: ModulePath) -> ImportType:
+        """
+        Classifies an absolute module path, the project modules coming first.
+
+        :param module: The module path, e.g. `'account.models'` or `'os.path'`.
+        :type module: ModulePath
+        :return: `ImportType` enum for native, 3rd party or local one.
+        :rtype: ImportType
+        """
+
+        if module.partition('.')[0] in self.top_level:
+            return ImportType.Local
+
+        return get_module_map().get(module.partition('.')[0], ImportType.Local)
+
+    def resolve(self, module: ModulePath, file: FilePath) -> ModulePath:
+        """
+        Turns a relative module path, as written on `file`, into an absolute one.
+
+        Absolute paths are returned as they are, just like the relative ones with no
+        package to start from - e.g. on a root-level file or going up beyond the
+        top-level package - which are kept in their dotted form, as written.
+
+        :param module: The module path, e.g. `'..models'` or `'.'`.
+        :type module: ModulePath
+        :param file: The file importing the module.
+        :type file: FilePath
+        :return: The absolute module path, e.g. `'account.models'`.
+        :rtype: ModulePath
+        """
+
+        name: ModulePath = module.lstrip('.')
+        level: int = len(module) - len(name)
+        package: ModulePath | None = self.packages.get(path.normpath(file))
+
+        if not level or package is None:
+            return module
+
+        parts: list[str] = package.split('.') if package else []
+
+        if level > len(parts):
+            return module
+
+        return '.'.join([*parts[: len(parts) - level + 1], *filter(None, [name])])
+
+
+def build_module_index(
+    root: str, files: Iterable[FilePath] | None = None
+) -> ModuleIndex:
+    """
+    Indexes every Python module of the project, by it's absolute module path.
+
+    The module paths are relative to `root` or, if `root` is itself a package, to it's
+    parent dir, e.g. `PROJECT/account/models.py` becomes `account.models`. Files out of
+    a valid module path, such as `my-scripts/run.py`, are left out.
+
+    :param root: The project root dir.
+    :type root: str
+    :param files: The project Python files; every one under `root` if `None`.
+    :type files: Iterable[FilePath] | None = None
+    :return: The project module index.
+    :rtype: ModuleIndex
+    """
+
+    base: str = root
+
+    if path.isfile(path.join(root, '__init__.py')):
+        base = path.dirname(path.abspath(root))
+
+    if files is None:
+        files = (
+            path.join(dirpath, file)
+            for dirpath, _, filenames in walk(root)
+            for file in filenames
+            if file.endswith(('.py', '.pyi'))
+        )
+
+    modules: dict[ModulePath, FilePath] = {}
+    packages: dict[FilePath, ModulePath] = {}
+
+    for file in files:
+        parts: list[str] = path.relpath(
+            path.splitext(path.abspath(file))[0], path.abspath(base)
+        ).split(path.sep)
+
+        is_package: bool = parts[-1] == '__init__'
+
+        if is_package:
+            parts.pop()
+
+        if not parts or not all(i.isidentifier() for i in parts):
+            continue
+
+        modules.setdefault('.'.join(parts), file)
+        packages[path.normpath(file)] = '.'.join(parts if is_package else parts[:-1])
+
+    return ModuleIndex(root, modules, packages)
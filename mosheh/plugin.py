@@ -0,0 +1,220 @@
+"""
+MkDocs plugin generating the codebase documentation on each build, straight in memory.
+
+Instead of writing every page to disk, for MkDocs to read them all back, the plugin
+reads the codebase on `on_config`, setting the codebase Nav section right on the
+loaded config, and adds each page as a generated `File` on `on_files`; so neither the
+`mkdocs.yml` file nor any Markdown file is ever written. When serving, the codebase is
+watched as well, so any change to it rebuilds the documentation.
+
+Registered as the `mosheh` plugin, it's enabled on the `mkdocs.yml` file, with it's
+options matching the `mosheh.json` ones, every one of them optional:
+
+```yaml
+plugins:
+  - mosheh:
+      root: ../src
+      codebase_nav_path: Codebase
+      jobs: 0
+      cache_dir: .mosheh_cache
+      skip_function_bodies: true
+      exclude: [tests/fixtures/]
+      include: []
+```
+
+Where `root` and `cache_dir` are relative to the `mkdocs.yml` dir. If the `nav` is set
+and has no `codebase_nav_path` section, it's added at the end.
+
+Alternatively, with just a `nav_file` option, also relative to the `mkdocs.yml` dir,
+the codebase is not read at all: the pages are the ones on the docs dir, as written by
+`create` or `update` with `documentation.codebaseNavFile`, and the codebase Nav section
+is read from that file, so `mkdocs.yml` is never rewritten by Mosheh.
+"""
+
+from logging import Logger, getLogger
+from os import path
+from typing import Any
+
+from mkdocs.config import config_options as c
+from mkdocs.config.base import Config
+from mkdocs.config.defaults import MkDocsConfig
+from mkdocs.exceptions import PluginError
+from mkdocs.livereload import LiveReloadServer
+from mkdocs.plugins import BasePlugin
+from mkdocs.structure.files import File, Files
+from yaml import CLoader, YAMLError, load
+
+from mosheh.codebase import read_codebase
+from mosheh.doc.shared import render_pages
+from mosheh.types.basic import CodebaseDict, FilePath
+from mosheh.utils import build_nav_struct, remove_abspath_from_codebase
+
+
+logger: Logger = getLogger('mosheh')
+
+
+class MoshehPluginConfig(Config):
+    """The plugin options, as set on the `mkdocs.yml` file."""
+
+    root = c.Type(str, default='.')
+    codebase_nav_path = c.Type(str, default='Codebase')
+    jobs = c.Type(int, default=1)
+    cache_dir = c.Optional(c.Type(str))
+    skip_function_bodies = c.Type(bool, default=True)
+    exclude = c.ListOfItems(c.Type(str), default=[])
+    include = c.ListOfItems(c.Type(str), default=[])
+    nav_file = c.Optional(c.Type(str))
+
+
+class MoshehPlugin(BasePlugin[MoshehPluginConfig]):
+    """Reads the codebase and serves it's documentation pages from memory."""
+
+    root: FilePath = ''
+    nav_file: FilePath | None = None
+    codebase: CodebaseDict = {}
+
+    def on_config(self, config: MkDocsConfig) -> MkDocsConfig:
+        """
+        Reads the codebase and sets it's Nav section on the config, not on the file.
+
+        With `nav_file`, the section is just read from there, the codebase not at all.
+
+        :param config: The loaded MkDocs config.
+        :type config: MkDocsConfig
+        :return: The same config, with the codebase Nav section set.
+        :rtype: MkDocsConfig
+        """
+
+        base: FilePath = path.dirname(path.abspath(config.config_file_path or ''))
+
+        if self.config.nav_file is not None:
+            self.nav_file = path.join(base, self.config.nav_file)
+
+            if config.nav is not None:
+                _set_codebase_nav(
+                    config.nav,
+                    _read_nav_file(self.nav_file),
+                    self.config.codebase_nav_path,
+                )
+
+            return config
+
+        cache_dir: str | None = self.config.cache_dir
+        self.root = path.normpath(path.join(base, self.config.root))
+        logger.info(f'Starting codebase loading at {self.root}')
+
+        codebase: CodebaseDict = read_codebase(
+            self.root,
+            self.config.jobs,
+            path.join(base, cache_dir) if cache_dir is not None else None,
+            self.config.skip_function_bodies,
+            self.config.exclude,
+            self.config.include,
+        )
+        self.codebase = remove_abspath_from_codebase(codebase) if codebase else {}
+        logger.info('Codebase successfully loaded')
+
+        if config.nav is not None:
+            _set_codebase_nav(
+                config.nav,
+                build_nav_struct(self.codebase, self.config.codebase_nav_path),
+                self.config.codebase_nav_path,
+            )
+
+        return config
+
+    def on_files(self, files: Files, *, config: MkDocsConfig) -> Files:
+        """
+        Adds each codebase page as a generated file, replacing any on the docs dir.
+
+        With `nav_file`, the pages already on the docs dir are left as they are.
+
+        :param files: The files found on the docs dir.
+        :type files: Files
+        :param config: The loaded MkDocs config.
+        :type config: MkDocsConfig
+        :return: The same files, plus the codebase pages.
+        :rtype: Files
+        """
+
+        if self.nav_file is not None:
+            return files
+
+        pages: list[tuple[FilePath, str]] = render_pages(
+            self.codebase, self.config.codebase_nav_path, self.config.jobs
+        )
+
+        for src_uri, content in pages:
+            if (stale := files.get_file_from_path(src_uri)) is not None:
+                files.remove(stale)
+
+            files.append(File.generated(config, src_uri, content=content))
+
+        logger.info(f'Pages: {len(pages)} served from memory')
+
+        return files
+
+    def on_serve(
+        self, server: LiveReloadServer, *, config: MkDocsConfig, builder: Any
+    ) -> LiveReloadServer:
+        """
+        Watches the codebase, so any change to it rebuilds the documentation.
+
+        With `nav_file`, just the file is watched, being outside of the docs dir.
+
+        :param server: The live reload server.
+        :type server: LiveReloadServer
+        :param config: The loaded MkDocs config.
+        :type config: MkDocsConfig
+        :param builder: The function rebuilding the documentation.
+        :type builder: Any
+        :return: The same server, also watching the codebase.
+        :rtype: LiveReloadServer
+        """
+
+        server.watch(self.nav_file or self.root)
+
+        return server
+
+
+def _read_nav_file(nav_file: FilePath) -> list[Any]:
+    """
+    Reads the codebase Nav section, as written by `doc.shared.get_update_set_nav`.
+
+    :param nav_file: The separate file holding the codebase Nav section.
+    :type nav_file: FilePath
+    :return: The codebase Nav section content.
+    :rtype: list[Any]
+    """
+
+    try:
+        with open(nav_file, encoding='utf-8') as f:
+            section: list[Any] = load(f, Loader=CLoader) or []
+    except (OSError, YAMLError) as e:
+        raise PluginError(f'Mosheh Nav file "{nav_file}" not readable: {e}') from e
+
+    return section
+
+
+def _set_codebase_nav(
+    nav: list[Any], section: list[Any], codebase_nav_path: str
+) -> None:
+    """
+    Sets the Nav codebase section to the current state, as `get_update_set_nav` does.
+
+    :param nav: The config Nav, changed in place.
+    :type nav: list[Any]
+    :param section: The codebase Nav section content.
+    :type section: list[Any]
+    :param codebase_nav_path: Expected codebase nav name to be used/found.
+    :type codebase_nav_path: str
+    :return: None
+    :rtype: None
+    """
+
+    for i, item in enumerate(nav):
+        if isinstance(item, dict) and codebase_nav_path in item:
+            nav[i] = {codebase_nav_path: section}
+            return
+
+    nav.append({codebase_nav_path: section})
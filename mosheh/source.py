@@ -0,0 +1,175 @@
+"""
+Keeps the original source of a parsed file around, so the statements code snippets are
+just slices of it instead of being regenerated by `ast.unparse`.
+
+Unparsing is the most expensive call of the whole parsing phase, mostly for classes,
+which are unparsed and then have every method unparsed once again, while the very same
+code was just read from disk. Also, the unparsed code loses the original formatting and
+comments.
+
+Here, a `Source` wraps the file raw bytes plus the offset where each line starts, and
+builds a `SourceSegment` for each statement from it's AST line and column offsets. A
+segment just stores these offsets: the text itself is only decoded when rendering, by
+calling `str` on it.
+
+Example:
+
+```python
+import ast
+
+source: Source = Source(b'class Foo:\n    def bar(self):\n        return 1\n')
+node: ast.AST = ast.parse(source.data).body[0].body[0]
+segment: SourceSegment = source.segment(node)
+str(segment)
+# 'def bar(self):\n    return 1'
+```
+
+Segments are picklable, so they can be cached and sent back from worker processes: the
+segments of the same file share the same source bytes, pickled once.
+"""
+
+import ast
+from itertools import accumulate
+from typing import Any, Final
+
+
+BOM: Final[bytes] = b'\xef\xbb\xbf'
+
+
+class Source:
+    """The raw content of a parsed file, indexed by line for slicing segments of it."""
+
+    __slots__ = ('data', 'line_starts')
+
+    def __init__(self, data: bytes) -> None:
+        """
+        Indexes where each line of the content starts.
+
+        :param data: The file content.
+        :type data: bytes
+        :return: None
+        :rtype: None
+        """
+
+        self.data: bytes = data
+        self.line_starts: list[int] = list(
+            accumulate(map(len, data.splitlines(keepends=True)), initial=0)
+        )
+
+        if data.startswith(BOM):
+            self.line_starts[0] = len(BOM)
+
+    def segment(self, node: ast.stmt) -> 'SourceSegment':
+        """
+        Builds the segment of a statement, decorators included if any.
+
+        :param node: The statement node, parsed from this very source.
+        :type node: ast.stmt
+        :return: The statement segment.
+        :rtype: SourceSegment
+        """
+
+        first: ast.stmt | ast.expr = node
+        decorators: list[ast.expr] | None = getattr(node, 'decorator_list', None)
+
+        if decorators:
+            first = decorators[0]
+
+        line_start: int = self.line_starts[first.lineno - 1]
+        start: int = line_start + first.col_offset
+
+        if first is not node:
+            start = self.data.rfind(b'@', line_start, start)
+
+        end: int = self.line_starts[(node.end_lineno or node.lineno) - 1] + (
+            node.end_col_offset or 0
+        )
+
+        return SourceSegment(self.data, line_start, start, end)
+
+
+class SourceSegment:
+    """A lazy code snippet, decoded from the source only when converted to `str`."""
+
+    __slots__ = ('source', 'line_start', 'start', 'end')
+
+    def __init__(self, source: bytes, line_start: int, start: int, end: int) -> None:
+        """
+        Stores where the snippet is, without touching the source at all.
+
+        :param source: The whole file content.
+        :type source: bytes
+        :param line_start: Offset of the line where the snippet starts.
+        :type line_start: int
+        :param start: Offset of the snippet first byte.
+        :type start: int
+        :param end: Offset right after the snippet last byte.
+        :type end: int
+        :return: None
+        :rtype: None
+        """
+
+        self.source: bytes = source
+        self.line_start: int = line_start
+        self.start: int = start
+        self.end: int = end
+
+    def __str__(self) -> str:
+        """
+        Decodes the snippet, dedenting it by the indentation of it's first line.
+
+        :return: The snippet code, exactly as written on the file.
+        :rtype: str
+        """
+
+        prefix: bytes = self.source[self.line_start : self.start]
+        margin: str = prefix[: len(prefix) - len(prefix.lstrip())].decode('utf-8')
+        code: str = self.source[self.start : self.end].decode('utf-8')
+        first, *lines = code.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+
+        return '\n'.join([first, *(i.removeprefix(margin) for i in lines)])
+
+    def __repr__(self) -> str:
+        """
+        Represents the snippet just like it's decoded string.
+
+        :return: The snippet code repr.
+        :rtype: str
+        """
+
+        return repr(str(self))
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compares by the decoded code, so a segment equals the equivalent string.
+
+        :param other: A segment or string to compare with.
+        :type other: object
+        :return: If both represent the same code.
+        :rtype: bool
+        """
+
+        if isinstance(other, SourceSegment | str):
+            return str(self) == str(other)
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """
+        Hashes by the decoded code, consistently with `__eq__`.
+
+        :return: The snippet code hash.
+        :rtype: int
+        """
+
+        return hash(str(self))
+
+    def __reduce__(self) -> tuple[type['SourceSegment'], tuple[Any, ...]]:
+        """
+        Pickles the segment by it's constructor args, the source bytes included.
+
+        :return: The segment class and it's constructor args.
+        :rtype: tuple[type[SourceSegment], tuple[Any, ...]]
+        """
+
+        return SourceSegment, (self.source, self.line_start, self.start, self.end)
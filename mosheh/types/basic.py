@@ -8,11 +8,29 @@ be an argument or a code snippet.
 
 The use of `typing.Annotated` does not change the alias itself, but helps with a
 description about the type.
+
+`StandardReturn`, the data of each statement, is the union of the contracts from
+`types.contracts`, only imported for type checking since they use these aliases too;
+each file of a `CodebaseDict` is a `FileContract`, it's metadata plus statements.
 """
 
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
+
+from mosheh.source import SourceSegment
+
 
-from mosheh.types.enums import FileRole, FunctionType, ImportType, Statement
+if TYPE_CHECKING:
+    from mosheh.types.contracts import (
+        AnnAssignContract,
+        AssertContract,
+        AssignContract,
+        AsyncFunctionDefContract,
+        ClassDefContract,
+        FileContract,
+        FunctionDefContract,
+        ImportContract,
+        ImportFromContract,
+    )
 
 
 type Token = Annotated[str, 'Variable, function or parameter name']
@@ -22,7 +40,7 @@ type Value = Annotated[str, 'Variable assigned value']
 type DefaultValue = Annotated[str, 'Default value']
 type FilePath = Annotated[str, 'File or dir name']
 type ModulePath = Annotated[str, 'Path for a module import']
-type CodeSnippet = Annotated[str, 'Code snippet, example']
+type CodeSnippet = Annotated[str | SourceSegment, 'Code snippet, example']
 type Args = Annotated[str, 'Arguments (e.g. `name: type = default`)']
 type Kwargs = Annotated[str, 'Arguments (e.g. `name: type = default`)']
 type AssertionTest = Annotated[str, 'Assertion itself']
@@ -33,18 +51,18 @@ type ImportedIdentifier = Annotated[Token | ModuleName, 'Importable stuff']
 type Decorator = Annotated[Token | ModuleName, 'Class or func decorator']
 type Inheritance = Annotated[Token | ModuleName, 'Classes which a class inherits']
 
-type StandardReturn = dict[
-    str,
-    Statement
-    | ImportType
-    | FunctionType
-    | list[Decorator]
-    | Inheritance
-    | FileRole
-    | None,
-]
+type StandardReturn = (
+    ImportContract
+    | ImportFromContract
+    | AssignContract
+    | AnnAssignContract
+    | ClassDefContract
+    | FunctionDefContract
+    | AsyncFunctionDefContract
+    | AssertContract
+)
 
 
 type StandardReturnProcessor = str | StandardReturn
 
-type CodebaseDict = dict[FilePath, list[StandardReturn]]
+type CodebaseDict = dict[FilePath, FileContract]
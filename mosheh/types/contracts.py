@@ -5,9 +5,19 @@ defined the "Contracts" for each statement tracked.
 
 These dataclasses are used to ensure the correct value type and attribution, so every
 time each of them appears, they are going to have the desired and expected behavior.
+
+Being `NamedTuple`s - immutable, slotted and without any per-instance dict - the
+contracts are also the in-memory representation of each statement, from the handlers
+up to the rendering, so a big codebase is not held as millions of small dicts. Each
+parsed file is a `FileContract`, holding it's metadata apart from it's statements, so
+rendering, caching or sending it to another process never has to copy nor change it;
+along with the `SourceStamp` of the bytes it was parsed from, if read from disk. For
+anything still expecting the old dict form, `to_dict` and `from_dict` convert between
+both, losslessly.
 """
 
-from typing import NamedTuple
+from collections.abc import Mapping
+from typing import Any, Final, NamedTuple
 
 from mosheh.types.basic import (
     Annotation,
@@ -22,10 +32,19 @@ from mosheh.types.basic import (
     Kwargs,
     ModuleName,
     ModulePath,
+    StandardReturn,
     Token,
     Value,
 )
-from mosheh.types.enums import FunctionType, ImportType, Statement
+from mosheh.types.enums import FileRole, FunctionType, ImportType, Statement
+from mosheh.utils import standard_struct
+
+
+class FileMetaContract(NamedTuple):
+    """File metadata contract, apart from the file statements."""
+
+    role: FileRole
+    docstring: Docstring
 
 
 class ImportContract(NamedTuple):
@@ -114,3 +133,77 @@ class AssertContract(NamedTuple):
     test: AssertionTest
     msg: AssertionMessage | None
     code: CodeSnippet
+
+
+class SourceStamp(NamedTuple):
+    """Fingerprint of the very bytes a file was parsed from, for the update manifest."""
+
+    mtime: int
+    size: int
+    hash: str
+
+
+class FileContract(NamedTuple):
+    """Parsed file contract, it's metadata and statements, never changed once built."""
+
+    meta: FileMetaContract
+    statements: tuple[StandardReturn, ...]
+    stamp: SourceStamp | None = None
+
+
+CONTRACTS: Final[dict[Statement, type[StandardReturn]]] = {
+    Statement.Import: ImportContract,
+    Statement.ImportFrom: ImportFromContract,
+    Statement.Assign: AssignContract,
+    Statement.AnnAssign: AnnAssignContract,
+    Statement.ClassDef: ClassDefContract,
+    Statement.FunctionDef: FunctionDefContract,
+    Statement.AsyncFunctionDef: AsyncFunctionDefContract,
+    Statement.Assert: AssertContract,
+}
+
+
+def to_dict(record: StandardReturn | FileMetaContract) -> dict[str, Any]:
+    """
+    Converts a contract into the legacy `utils.standard_struct` dict form.
+
+    The file metadata uses the `__role__` and `__docstring__` keys, while every
+    statement contract just has it's fields as keys.
+
+    Example:
+
+    ```python
+    to_dict(AssertContract(Statement.Assert, 'x', None, 'assert x'))
+    # {'statement': Statement.Assert, 'test': 'x', 'msg': None, 'code': 'assert x'}
+    ```
+
+    :param record: The file metadata or statement contract.
+    :type record: StandardReturn | FileMetaContract
+    :return: The same data as a dict.
+    :rtype: dict[str, Any]
+    """
+
+    data: dict[str, Any] = standard_struct()
+
+    if isinstance(record, FileMetaContract):
+        data.update(__role__=record.role, __docstring__=record.docstring)
+    else:
+        data.update(record._asdict())
+
+    return data
+
+
+def from_dict(data: Mapping[str, Any]) -> StandardReturn | FileMetaContract:
+    """
+    Converts a legacy dict, as returned by `to_dict`, back into it's contract.
+
+    :param data: The file metadata or statement dict.
+    :type data: Mapping[str, Any]
+    :return: The matching contract.
+    :rtype: StandardReturn | FileMetaContract
+    """
+
+    if 'statement' not in data:
+        return FileMetaContract(role=data['__role__'], docstring=data['__docstring__'])
+
+    return CONTRACTS[data['statement']](**data)
@@ -10,7 +10,7 @@ The config JSON itself is divided at 2 parts: Documentation and IO:
 The idea here is to use TypedDict as a typing alias plus contract - kinda.
 """
 
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 
 
 class DocumentationJSON(TypedDict):
@@ -24,6 +24,7 @@ class DocumentationJSON(TypedDict):
     logoPath: str | None
     readmePath: str | None
     codebaseNavPath: str
+    codebaseNavFile: NotRequired[str | None]
 
 
 class IOJSON(TypedDict):
@@ -31,6 +32,12 @@ class IOJSON(TypedDict):
 
     rootDir: str
     outputDir: str
+    jobs: NotRequired[int]
+    cacheDir: NotRequired[str | None]
+    skipFunctionBodies: NotRequired[bool]
+    streaming: NotRequired[bool]
+    exclude: NotRequired[list[str]]
+    include: NotRequired[list[str]]
 
 
 class DefaultJSON(TypedDict):
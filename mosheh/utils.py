@@ -9,18 +9,21 @@ implementing some functionality which can be related.
 Here are usually maintained reusable code applicable everywhere.
 """
 
-import importlib.util
-import sysconfig
 from bisect import bisect_left
 from collections import defaultdict
-from collections.abc import Sequence
-from typing import Any, cast
+from collections.abc import Iterable, Iterator, Sequence
+from os import sep
+from typing import TYPE_CHECKING, Any, cast
 
-from mosheh.constants import BUILTIN_MODULES
-from mosheh.types.basic import CodebaseDict, ModuleName, StandardReturn
+from mosheh.modules import get_module_map
+from mosheh.types.basic import CodebaseDict, FilePath, ModuleName
 from mosheh.types.enums import ImportType
 
 
+if TYPE_CHECKING:
+    from mosheh.types.contracts import FileContract
+
+
 def bin(item: Any, universe: Sequence[Any]) -> bool:
     """
     Binary Search algorithm which returns not the index, but a boolean.
@@ -54,47 +57,24 @@ def get_import_type(lib: ModuleName) -> ImportType:
     """
     Classifies the module into a valid `ImportType` alternative.
 
-    By literally just... find spec using... unhh... find_spec()... searches
-    for modules in the environment path and returns it.
+    Just looks the top-level name of the module up on the module map of this run, as
+    built by `mosheh.modules`, so nothing is ever imported; anything not found there is
+    considered a local module.
 
     Example:
 
     ```python
-    get_import_type('mkdocs')
+    get_import_type('mkdocs.plugins')
     # ImportType.TrdParty
     ```
 
-    :param lib: The lib name, e.g. "numpy" or "numba".
+    :param lib: The lib name, e.g. "numpy" or "numba.cuda".
     :type lib: ModuleName
     :return: `ImportType` enum for native, 3rd party or local one.
     :rtype: ImportType
     """
 
-    try:
-        if lib in BUILTIN_MODULES:
-            return ImportType.Native
-
-        spec = importlib.util.find_spec(lib)
-        if not spec or not spec.origin:
-            return ImportType.Local
-
-        origin: str = spec.origin
-
-        if origin in ('built-in', 'frozen') or (
-            origin.endswith(('.so', '.pyd', '.dll')) and 'lib-dynload' in origin
-        ):
-            return ImportType.Native
-
-        if 'site-packages' in origin or 'dist-packages' in origin:
-            return ImportType.TrdParty
-
-        stdlib_path = sysconfig.get_paths()['stdlib']
-        if origin.startswith(stdlib_path):
-            return ImportType.Native
-
-        return ImportType.Local
-    except Exception:
-        return ImportType.Local
+    return get_module_map().get(lib.partition('.')[0], ImportType.Local)
 
 
 def nested_defaultdict() -> defaultdict[Any, Any]:
@@ -128,27 +108,25 @@ def nested_defaultdict() -> defaultdict[Any, Any]:
 def add_to_nested_defaultdict(
     structure: defaultdict[Any, Any],
     path: list[str],
-    data: list[StandardReturn],
+    data: 'FileContract | list[Any]',
 ) -> defaultdict[Any, Any]:
     """
     Adds data to a nested dictionary structure based on a specified path.
 
     This function traverses a nested dictionary (`structure`) using a list of keys
-    (`path`). If the path consists of a single key, the data is added directly to the
-    corresponding level. Otherwise, the function recursively traverses deeper into the
-    structure, creating nested dictionaries as needed, until the data is added at the
-    specified location.
+    (`path`), level by level, creating nested dictionaries as needed, until the data is
+    added at the specified location.
 
     Key concepts:
-    - Recursive Traversal: The function calls itself recursively to traverse and modify
-      deeper levels of the nested dictionary.
+    - Iterative Traversal: Just one step for each key, with no recursion nor copy of
+      the path, so each insert costs O(depth) no matter how deep it goes.
 
     Example:
 
     ```python
     structure: defaultdict = nested_defaultdict()
     path: list[str] = ['level1', 'level2', 'level3']
-    data: list[StandardReturn] = [{'key': 'value'}]
+    data: list[Any] = [{'key': 'value'}]
     add_to_nested_defaultdict(structure, path, data)
     # defaultdict(defaultdict, {'level1': {'level2': {'level3': [{'key': 'value'}]}}})
     ```
@@ -158,21 +136,115 @@ def add_to_nested_defaultdict(
     :param path: A list of keys representing the path to the target location.
     :type path: list[str]
     :param data: The data to add at the specified path.
-    :type data: list[StandardReturn]
+    :type data: FileContract | list[Any]
     :return: The modified dictionary with the new data added.
     :rtype: defaultdict[Any, Any]
     """
 
-    if len(path) == 1:
-        structure[path[0]] = data
-    elif len(path) > 1:
-        structure[path[0]] = add_to_nested_defaultdict(
-            structure[path[0]], path[1:], data
-        )
+    if not path:
+        return structure
+
+    node: defaultdict[Any, Any] = structure
+
+    for name in path[:-1]:
+        node = node[name]
+
+    node[path[-1]] = data
 
     return structure
 
 
+def add_to_codebase_tree(
+    tree: CodebaseDict,
+    path: Sequence[str],
+    data: 'FileContract | list[Any]',
+) -> CodebaseDict:
+    """
+    Adds data to a `CodebaseDict` based on a specified path, just as a trie insert.
+
+    Works as `add_to_nested_defaultdict`, in O(depth) steps, but creating each missing
+    dir as a regular dict right away; so a tree built this way is ready to be used,
+    with no `convert_to_regular_dict` copy at the end.
+
+    Example:
+
+    ```python
+    tree: CodebaseDict = {}
+    add_to_codebase_tree(tree, ['PROJECT', 'core', 'urls.py'], [])
+    # {'PROJECT': {'core': {'urls.py': []}}}
+    ```
+
+    :param tree: The codebase struct to modify.
+    :type tree: CodebaseDict
+    :param path: The dirs names followed by the file name.
+    :type path: Sequence[str]
+    :param data: The data to add at the specified path.
+    :type data: FileContract | list[Any]
+    :return: The modified codebase struct with the new data added.
+    :rtype: CodebaseDict
+    """
+
+    if not path:
+        return tree
+
+    node: dict[str, Any] = cast(dict[str, Any], tree)
+
+    for name in path[:-1]:
+        node = node.setdefault(name, {})
+
+    node[path[-1]] = data
+
+    return tree
+
+
+def walk_codebase(
+    tree: CodebaseDict, prefix: str = '', separator: str = sep
+) -> Iterator[tuple[int, str, str, Any]]:
+    """
+    Yields every dir and file of a `CodebaseDict`, parents first, following it's order.
+
+    Instead of recursion, keeps a stack with an iterator for each dir being walked, so
+    any depth is fine, no matter the recursion limit. Each item is the nesting level,
+    the name, the path joined with `separator` and the content, a dict for dirs.
+
+    Example:
+
+    ```python
+    tree: CodebaseDict = {'PROJECT': {'manage.py': [], 'core': {'urls.py': []}}}
+    list(walk_codebase(tree, separator='/'))
+    # [(0, 'PROJECT', 'PROJECT', {...}), (1, 'manage.py', 'PROJECT/manage.py', []),
+    #  (1, 'core', 'PROJECT/core', {...}), (2, 'urls.py', 'PROJECT/core/urls.py', [])]
+    ```
+
+    :param tree: Codebase `codebase.read_codebase` struct.
+    :type tree: CodebaseDict
+    :param prefix: Path the yielded paths start from.
+    :type prefix: str = ''
+    :param separator: String joining the dirs names.
+    :type separator: str = os.sep
+    :return: Each dir and file level, name, path and content.
+    :rtype: Iterator[tuple[int, str, str, Any]]
+    """
+
+    stack: list[tuple[str, Iterator[tuple[str, Any]]]] = [
+        (prefix, iter(cast(dict[str, Any], tree).items()))
+    ]
+
+    while stack:
+        base, items = stack[-1]
+
+        for name, content in items:
+            full_path: str = f'{base}{separator}{name}' if base else name
+
+            yield len(stack) - 1, name, full_path, content
+
+            if isinstance(content, dict):
+                stack.append((full_path, iter(content.items())))
+                break
+        else:
+            stack.pop()
+
+
 def build_nav_struct(
     tree: CodebaseDict, codebase_nav_path: str = 'Codebase', prefix: str = ''
 ) -> list[dict[str, Any]]:
@@ -180,7 +252,7 @@ def build_nav_struct(
     Processes the `codebase.read_codebase` into valid yaml "Nav" dump format.
 
     While taking the codebase structure, processed by `codebase.read_codebase` on the
-    `Codebase` format, recursively iterates the codebase mapping every file and
+    `Codebase` format, walks the codebase with `walk_codebase` mapping every file and
     directory, returning something similar to the example below:
 
     ```python
@@ -227,35 +299,95 @@ def build_nav_struct(
     """
 
     result: list[dict[str, Any]] = []
+    levels: list[list[dict[str, Any]]] = [result]
 
-    for name, content in cast(dict[str, Any], tree).items():
-        full_path = f'{prefix}/{name}' if prefix else name
+    for depth, name, full_path, content in walk_codebase(tree, prefix, '/'):
+        del levels[depth + 1 :]
 
-        if isinstance(content, list):
-            result.append({name: f'{codebase_nav_path}/{full_path}.md'})
+        if isinstance(content, dict):
+            nested: list[dict[str, Any]] = []
+            levels[depth].append({name: nested})
+            levels.append(nested)
         else:
-            nested: list[dict[str, Any]] = build_nav_struct(
-                content, codebase_nav_path, full_path
-            )
-            result.append({name: nested})
+            levels[depth].append({name: f'{codebase_nav_path}/{full_path}.md'})
 
     return result
 
 
+def build_path_tree(files: Iterable[FilePath]) -> CodebaseDict:
+    """
+    Builds the `CodebaseDict` of the given files, but with no statements at all.
+
+    Being just the paths, it's enough for building the nav and listing the codebase
+    files, while costing a tiny fraction of the memory of the whole parsed codebase.
+
+    Example:
+
+    ```python
+    build_path_tree(['PROJECT/manage.py', 'PROJECT/core/urls.py'])
+    # {'PROJECT': {'manage.py': [], 'core': {'urls.py': []}}}
+    ```
+
+    :param files: The files paths, in the expected order.
+    :type files: Iterable[FilePath]
+    :return: The files as a codebase struct, each one with an empty list.
+    :rtype: CodebaseDict
+    """
+
+    tree: CodebaseDict = {}
+
+    for file in files:
+        add_to_codebase_tree(tree, file.split(sep), [])
+
+    return tree
+
+
+def iter_codebase_files(
+    tree: CodebaseDict, prefix: FilePath = ''
+) -> Iterator[tuple[FilePath, 'FileContract']]:
+    """
+    Yields every file of a `CodebaseDict` with it's path and statements.
+
+    Walks the codebase with `walk_codebase`, following it's own order, joining the dirs
+    names with the OS separator, exactly as `doc.shared.process_codebase` does when
+    naming the pages.
+
+    Example:
+
+    ```python
+    tree: CodebaseDict = {'PROJECT': {'manage.py': ..., 'core': {'urls.py': ...}}}
+    list(iter_codebase_files(tree))
+    # [('PROJECT/manage.py', FileContract(...)), ('PROJECT/core/urls.py', ...)]
+    ```
+
+    :param tree: Codebase `codebase.read_codebase` struct.
+    :type tree: CodebaseDict
+    :param prefix: Accumulative path for joining.
+    :type prefix: FilePath = ''
+    :return: Each file path paired with it's statements.
+    :rtype: Iterator[tuple[FilePath, FileContract]]
+    """
+
+    for _, _, full_path, content in walk_codebase(tree, prefix):
+        if not isinstance(content, dict):
+            yield full_path, content
+
+
 def convert_to_regular_dict(d: defaultdict[Any, Any] | dict[Any, Any]) -> CodebaseDict:
     """
     Converts a nested `defaultdict` into a regular dictionary.
 
-    This function recursively traverses a `defaultdict` and its nested dictionaries,
-    converting all instances of `defaultdict` into standard Python dictionaries. This
-    ensures the resulting structure is free of `defaultdict` behavior.
+    This function traverses a `defaultdict` and its nested dictionaries, level by
+    level with a stack instead of recursion, converting all instances of `defaultdict`
+    into standard Python dictionaries. This ensures the resulting structure is free of
+    `defaultdict` behavior.
 
     Key concepts:
     - defaultdict: A dictionary subclass from the `collections` module that provides
       default values for missing keys. This func removes that behavior by converting
       it into a regular dictionary.
-    - Recursive Conversion: The function traverses and converts all nested dict,
-      ensuring the entire structure is converted.
+    - Iterative Conversion: The function traverses and converts all nested dict,
+      ensuring the entire structure is converted, no matter how deep it goes.
 
     Example:
 
@@ -272,20 +404,33 @@ def convert_to_regular_dict(d: defaultdict[Any, Any] | dict[Any, Any]) -> Codeba
     :rtype: CodebaseDict
     """
 
-    if isinstance(d, defaultdict):
-        d = {k: convert_to_regular_dict(v) for k, v in d.items()}
+    if not isinstance(d, defaultdict):
+        return d
 
-    return d
+    result: dict[Any, Any] = {}
+    stack: list[tuple[dict[Any, Any], dict[Any, Any]]] = [(d, result)]
 
+    while stack:
+        source, target = stack.pop()
 
-def standard_struct() -> StandardReturn:
+        for k, v in source.items():
+            if isinstance(v, defaultdict):
+                target[k] = {}
+                stack.append((v, target[k]))
+            else:
+                target[k] = v
+
+    return result
+
+
+def standard_struct() -> dict[str, Any]:
     """
     Defines the standard keys and values of code data dict.
 
     The keys are listed below, followed by they types, as below:
 
     ```python
-    dct: StandardReturn = {
+    dct: dict[str, Any] = {
         'statement': Statement,
         'name': Token,
         'tokens': list[Token | ImportedIdentifier],
@@ -315,8 +460,8 @@ def standard_struct() -> StandardReturn:
     # {}
     ```
 
-    :return: An empty dict annotated with special custom type.
-    :rtype: StandardReturn
+    :return: An empty dict, filled as the legacy form of a statement contract.
+    :rtype: dict[str, Any]
     """
 
     return {}
@@ -350,7 +495,10 @@ def indent_code(code: str, level: int = 4) -> str:
 
     indent: str = ' ' * level
     new_code: str = '\n'.join(
-        map(lambda line: f'{indent}{line}' if line.strip() else '', code.splitlines())
+        [
+            f'{indent}{line}' if line and not line.isspace() else ''
+            for line in code.splitlines()
+        ]
     )
 
     return new_code
@@ -377,30 +525,69 @@ def remove_abspath_from_codebase(
     return _remove_abspath_from_codebase_helper(next(iter(d.values())))
 
 
+def get_codebase_prefix(d: CodebaseDict) -> FilePath:
+    """
+    Returns the path removed from `CodebaseDict` by `remove_abspath_from_codebase`.
+
+    Follows exactly the same steps of the abspath removal, but collecting the dirs
+    names skipped, so joining the result with any file path from the cleaned codebase
+    leads to the original file path.
+
+    Example:
+
+    ```python
+    codebase: CodebaseDict = read_codebase('/home/user/project')
+    get_codebase_prefix(codebase)
+    # '/home/user'
+    ```
+
+    :param d: `codebase.read_codebase` output structure.
+    :type d: CodebaseDict
+    :return: The path prefix removed from the codebase.
+    :rtype: FilePath
+    """
+
+    parts: list[str] = [next(iter(d))]
+    node: Any = next(iter(d.values()))
+
+    while isinstance(node, dict):
+        deeper: Any = next(iter(node.values()))
+
+        if not (isinstance(deeper, dict) and len(deeper) == 1):
+            break
+
+        parts.append(next(iter(node)))
+        node = deeper
+
+    return sep.join(parts) or sep
+
+
 def _remove_abspath_from_codebase_helper(
-    d: CodebaseDict | list[StandardReturn],
+    d: 'CodebaseDict | FileContract',
 ) -> CodebaseDict:
     """
     ### YOU SHOULD NOT BE CALLING THIS FUNCTION!
 
     Removes abspath dirs names from `CodebaseDict` structure.
 
-    The real recursive abspath-remove-o-matic function, not used primary just because
-    of typing annotations.
+    The real abspath-remove-o-matic function, not used primary just because of typing
+    annotations.
 
-    Inside it, recursively iterates the income `d`, goes until the first non-dictionary
-    or single-length item is found, returning from this point.
+    Inside it, iterates the income `d` level by level, goes until the first
+    non-dictionary or single-length item is found, returning from this point.
 
     :param d: `codebase.read_codebase` output structure.
-    :type d: CodebaseDict | list[StandardReturn]
+    :type d: CodebaseDict | FileContract
     :return: `codebase.read_codebase` output removing abspath.
     :rtype: CodebaseDict
     """
 
-    if isinstance(d, dict):
-        deeper = next(iter(d.values()))
+    while isinstance(d, dict):
+        deeper: Any = next(iter(d.values()))
+
+        if not (isinstance(deeper, dict) and len(deeper) == 1):
+            break
 
-        if isinstance(deeper, dict) and len(deeper) == 1:
-            return _remove_abspath_from_codebase_helper(deeper)
+        d = deeper
 
     return cast(CodebaseDict, d)
@@ -0,0 +1,179 @@
+"""
+Watches the codebase for changes, batching each burst of them once it settles down.
+
+Used by the `watch` command, this module relies on `watchdog`, which listens to the
+OS own file events - `inotify` on Linux, `FSEvents` on macOS - so no matter how big
+the codebase is, nothing is walked nor `stat`ed while waiting for changes.
+
+Saving a file usually fires a burst of events, e.g. an editor writing a temp file
+and renaming it over the original one, or a `git checkout` touching hundreds of files
+at once; so the events are debounced, being collected until none arrives for a while,
+and just then classified into the files added, modified and deleted:
+
+- Modified: known files touched and still there.
+- Deleted: known files touched and not there anymore.
+- Added: a new Python file, or any dir created, moved or deleted, makes the codebase be
+    walked again, since the ignore rules decide if new files are part of it and a moved
+    dir fires no event for the files inside it.
+
+Example:
+
+```python
+for changes in watch_changes('/home/user/project', files):
+    print(changes)
+    # FileChanges(added=[], modified=['/home/user/project/models.py'], deleted=[])
+```
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from logging import Logger, getLogger
+from os import path
+from queue import Empty, SimpleQueue
+from time import monotonic
+from typing import Final, NamedTuple
+
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+
+from mosheh.codebase import list_python_files
+from mosheh.types.basic import FilePath
+
+
+logger: Logger = getLogger('mosheh')
+
+CHANGE_EVENTS: Final[frozenset[str]] = frozenset(
+    {'created', 'modified', 'deleted', 'moved', 'closed'}
+)
+
+
+class FileChanges(NamedTuple):
+    """Absolute paths of the Python files changed, grouped by what happened to them."""
+
+    added: list[FilePath]
+    modified: list[FilePath]
+    deleted: list[FilePath]
+
+
+class _EventCollector(FileSystemEventHandler):
+    """Puts each changed path on a queue, along with if it's a structural dir change."""
+
+    def __init__(self, events: SimpleQueue[tuple[FilePath, bool]]) -> None:
+        self.events: SimpleQueue[tuple[FilePath, bool]] = events
+
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        if event.event_type not in CHANGE_EVENTS:
+            return
+
+        structural: bool = event.is_directory and event.event_type != 'modified'
+
+        for i in (event.src_path, event.dest_path):
+            if i:
+                self.events.put((str(i), structural))
+
+
+def watch_changes(
+    root: FilePath,
+    files: Iterable[FilePath],
+    exclude: Sequence[str] = (),
+    include: Sequence[str] = (),
+    debounce: float = 0.1,
+) -> Iterator[FileChanges]:
+    """
+    Yields the Python files changed under `root`, a batch for each burst of changes.
+
+    Blocks until some event arrives, then keeps collecting them until `debounce`
+    seconds pass with no other one, before classifying the whole batch. Batches with
+    no Python file actually changed are not yielded at all. The OS watch is stopped
+    as soon as the generator is closed.
+
+    :param root: The codebase root dir.
+    :type root: FilePath
+    :param files: The Python files currently known, as from `list_python_files`.
+    :type files: Iterable[FilePath]
+    :param exclude: `.gitignore`-like patterns of paths to be left out.
+    :type exclude: Sequence[str] = ()
+    :param include: `.gitignore`-like patterns of paths to be walked anyway.
+    :type include: Sequence[str] = ()
+    :param debounce: Seconds with no event for a burst to be considered done.
+    :type debounce: float = 0.1
+    :return: The changed files of each burst.
+    :rtype: Iterator[FileChanges]
+    """
+
+    events: SimpleQueue[tuple[FilePath, bool]] = SimpleQueue()
+    known: set[FilePath] = set(files)
+    observer = Observer()
+    observer.schedule(_EventCollector(events), root, recursive=True)
+    observer.start()
+
+    try:
+        while True:
+            touched: dict[FilePath, bool] = dict([events.get()])
+            deadline: float = monotonic() + debounce
+
+            while (left := deadline - monotonic()) > 0:
+                try:
+                    file, structural = events.get(timeout=left)
+                except Empty:
+                    break
+
+                touched[file] = touched.get(file, False) or structural
+                deadline = monotonic() + debounce
+
+            changes: FileChanges = _classify(touched, known, root, exclude, include)
+
+            if not any(changes):
+                continue
+
+            known.difference_update(changes.deleted)
+            known.update(changes.added)
+            logger.debug(f'\t{changes}')
+
+            yield changes
+    finally:
+        observer.stop()
+        observer.join()
+
+
+def _classify(
+    touched: dict[FilePath, bool],
+    known: set[FilePath],
+    root: FilePath,
+    exclude: Sequence[str],
+    include: Sequence[str],
+) -> FileChanges:
+    """
+    Classifies the touched paths into the Python files added, modified and deleted.
+
+    Known files are told apart just by existing or not, while anything that may add
+    files to the codebase makes it be walked again with `list_python_files`.
+
+    :param touched: Each touched path mapped to if it had a structural dir change.
+    :type touched: dict[FilePath, bool]
+    :param known: The Python files known before the changes.
+    :type known: set[FilePath]
+    :param root: The codebase root dir.
+    :type root: FilePath
+    :param exclude: `.gitignore`-like patterns of paths to be left out.
+    :type exclude: Sequence[str]
+    :param include: `.gitignore`-like patterns of paths to be walked anyway.
+    :type include: Sequence[str]
+    :return: The changed Python files, each group sorted.
+    :rtype: FileChanges
+    """
+
+    python: list[FilePath] = [
+        i for i in touched if i.endswith('.py') or i.endswith('.pyi')
+    ]
+    current: set[FilePath]
+
+    if any(touched.values()) or any(i not in known and path.isfile(i) for i in python):
+        current = set(list_python_files(root, exclude, include, quiet=True))
+    else:
+        current = known.difference(i for i in python if not path.isfile(i))
+
+    return FileChanges(
+        added=sorted(current - known),
+        modified=sorted(i for i in python if i in known and i in current),
+        deleted=sorted(known - current),
+    )
@@ -0,0 +1,131 @@
+"""
+Benchmarks the output dirs creation, counting the filesystem syscalls it makes.
+
+Compares the legacy per-page check - `path.exists` on the page dir, then `makedirs`
+if missing, for every single page - against the current plan, where every page dir is
+listed once by `plan_output_dirs` and created by `make_output_dirs`, parents first,
+with a single `mkdir` each. Both run on a fresh output (`create`) and on an existing
+one (`update`), which is where the legacy checks are all redundant.
+
+The syscalls are counted by wrapping `os.stat` and `os.mkdir`, which `path.exists`
+and `makedirs` end up calling, so no `strace` is needed.
+
+Usage:
+
+```sh
+uv run python -m tests.benchmark.dirs [DIR] [--repeat N]
+```
+
+Where `DIR` defaults to `tests/PROJECT`, but any big codebase, such as the Python
+stdlib itself, gives more meaningful numbers.
+"""
+
+import os
+from argparse import ArgumentParser, Namespace
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from os import makedirs, path
+from shutil import rmtree
+from tempfile import mkdtemp
+from time import perf_counter
+from typing import Any
+
+from mosheh.codebase import stream_codebase
+from mosheh.doc import shared
+from mosheh.types.basic import FilePath
+from mosheh.utils import iter_codebase_files, remove_abspath_from_codebase
+
+
+def legacy_dirs(files: list[FilePath], docs_path: FilePath) -> None:
+    for file in files:
+        folder_path: FilePath = path.dirname(
+            path.join(docs_path, 'Codebase', file + '.md')
+        )
+
+        if not path.exists(path.join('.', folder_path)):
+            makedirs(path.join('.', folder_path))
+
+
+def planned_dirs(files: list[FilePath], docs_path: FilePath) -> None:
+    shared.make_output_dirs(
+        path.join(docs_path, 'Codebase'),
+        shared.plan_output_dirs(files, '', docs_path),
+    )
+
+
+@contextmanager
+def count_syscalls() -> Iterator[Counter[str]]:
+    counter: Counter[str] = Counter()
+    originals: dict[str, Callable[..., Any]] = {
+        'stat': os.stat,
+        'mkdir': os.mkdir,
+    }
+
+    def wrap(name: str) -> Callable[..., Any]:
+        def counted(*args: Any, **kwargs: Any) -> Any:
+            counter[name] += 1
+            return originals[name](*args, **kwargs)
+
+        return counted
+
+    os.stat, os.mkdir = wrap('stat'), wrap('mkdir')
+    shared.mkdir = os.mkdir
+
+    try:
+        yield counter
+    finally:
+        os.stat, os.mkdir = originals['stat'], originals['mkdir']
+        shared.mkdir = os.mkdir
+
+
+def measure(
+    create: Callable[[list[FilePath], FilePath], None],
+    files: list[FilePath],
+    repeat: int,
+) -> tuple[Counter[str], Counter[str], float]:
+    best: float = float('inf')
+    cold: Counter[str] = Counter()
+    warm: Counter[str] = Counter()
+
+    for _ in range(repeat):
+        tmp: str = mkdtemp()
+        docs_path: FilePath = path.join(tmp, 'docs')
+
+        try:
+            with count_syscalls() as cold:
+                create(files, docs_path)
+
+            start: float = perf_counter()
+            with count_syscalls() as warm:
+                create(files, docs_path)
+            best = min(best, perf_counter() - start)
+        finally:
+            rmtree(tmp)
+
+    return cold, warm, best
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('root', nargs='?', default='tests/PROJECT')
+    parser.add_argument('--repeat', type=int, default=5)
+    args: Namespace = parser.parse_args()
+
+    tree = remove_abspath_from_codebase(stream_codebase(args.root)[0])
+    files: list[FilePath] = [i for i, _ in iter_codebase_files(tree)]
+
+    print(f'{len(files)} pages from {args.root}')
+
+    for label, create in (('before', legacy_dirs), ('after', planned_dirs)):
+        cold, warm, best = measure(create, files, args.repeat)
+        print(
+            f'{label:<6}  create: {cold.total():>6} syscalls '
+            f'({cold["stat"]} stat, {cold["mkdir"]} mkdir)  '
+            f'update: {warm.total():>6} syscalls '
+            f'({warm["stat"]} stat, {warm["mkdir"]} mkdir) in {best * 1000:.2f}ms'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+"""
+Benchmarks the parse phase, reporting the time spent per 100k lines of Python code.
+
+Compares the legacy traversal - `ast.walk` over every node, each one going through
+the `isinstance` union check and having it's code regenerated by `ast.unparse` -
+against the current one, which walks just the statements, dispatches them by type and
+slices their code lazily from the source. With the full traversal, both extract the
+same statements; the default scope-aware traversal, skipping function bodies, is
+measured as well. `ast.parse` alone is the floor of them all.
+
+Usage:
+
+```sh
+uv run python -m tests.benchmark.parse [DIR] [--repeat N]
+```
+
+Where `DIR` defaults to `tests/PROJECT`, but any big codebase, such as the Python
+stdlib itself, gives more meaningful numbers.
+"""
+
+import ast
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from functools import partial
+from os import path, walk
+from time import perf_counter
+
+from mosheh.handlers.python import (
+    _parse_python_code,
+    wrapped_handle_std_nodes_for_testing,
+    wrapped_mark_methods_for_testing,
+)
+from mosheh.types.basic import StandardReturn
+
+
+LEGACY_STD_NODES = (
+    ast.Import,
+    ast.ImportFrom,
+    ast.Assign,
+    ast.AnnAssign,
+    ast.FunctionDef,
+    ast.AsyncFunctionDef,
+    ast.ClassDef,
+    ast.Assert,
+)
+
+
+def legacy_parse(raw: bytes, file: str) -> list[StandardReturn]:
+    statements: list[StandardReturn] = []
+
+    for node in ast.walk(ast.parse(raw.decode('utf-8'), filename=file)):
+        if isinstance(node, ast.ClassDef):
+            wrapped_mark_methods_for_testing(node)
+        elif isinstance(node, ast.FunctionDef) and getattr(node, 'parent', None):
+            continue
+
+        if isinstance(node, LEGACY_STD_NODES):
+            statements.extend(wrapped_handle_std_nodes_for_testing(node))
+
+    return statements
+
+
+def parse_only(raw: bytes, file: str) -> list[StandardReturn]:
+    ast.parse(raw.decode('utf-8'), filename=file)
+
+    return []
+
+
+def load_sources(root: str) -> list[tuple[str, bytes]]:
+    sources: list[tuple[str, bytes]] = []
+
+    for dirpath, _, filenames in walk(root):
+        for filename in sorted(filenames):
+            if not filename.endswith('.py'):
+                continue
+
+            file: str = path.join(dirpath, filename)
+
+            try:
+                with open(file, 'rb') as f:
+                    raw: bytes = f.read()
+                ast.parse(raw.decode('utf-8'), filename=file)
+            except (SyntaxError, UnicodeDecodeError, ValueError):
+                continue
+
+            sources.append((file, raw))
+
+    return sources
+
+
+def measure(
+    parse: Callable[[bytes, str], list[StandardReturn]],
+    sources: list[tuple[str, bytes]],
+    repeat: int,
+) -> float:
+    best: float = float('inf')
+
+    for _ in range(repeat):
+        start: float = perf_counter()
+        for file, raw in sources:
+            parse(raw, file)
+        best = min(best, perf_counter() - start)
+
+    return best
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('root', nargs='?', default='tests/PROJECT')
+    parser.add_argument('--repeat', type=int, default=5)
+    args: Namespace = parser.parse_args()
+
+    sources: list[tuple[str, str]] = load_sources(args.root)
+    lines: int = sum(raw.count(b'\n') + 1 for _, raw in sources)
+    scale: float = 100_000 / lines
+
+    floor: float = measure(parse_only, sources, args.repeat) * scale
+    before: float = measure(legacy_parse, sources, args.repeat) * scale
+    full: float = (
+        measure(
+            partial(_parse_python_code, skip_function_bodies=False),
+            sources,
+            args.repeat,
+        )
+        * scale
+    )
+    after: float = measure(_parse_python_code, sources, args.repeat) * scale
+
+    print(f'{len(sources)} files, {lines} lines from {args.root}')
+    print(f'ast.parse only:                 {floor:.3f}s per 100k lines')
+    print(f'before (ast.walk + isinstance): {before:.3f}s per 100k lines')
+    print(f'after (statements + dispatch):  {full:.3f}s per 100k lines')
+    print(f'after (skipping func bodies):   {after:.3f}s per 100k lines')
+
+    for label, value in (('full', full), ('scoped', after)):
+        print(
+            f'{label} speedup: {before / value:.2f}x overall, '
+            f'{(before - floor) / (value - floor):.2f}x excluding ast.parse'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmarks the render phase, turning a single 5k statements module into Markdown.
+
+A synthetic module is generated with the same share of each statement kind - imports,
+constants, classes, functions and assertions - so every template and handler is
+exercised, with multiline snippets and docstrings to be indented. It's parsed once and
+then rendered over and over, reporting the best time and the peak memory allocated
+by a single render.
+
+Usage:
+
+```sh
+uv run python -m tests.benchmark.render [--statements N] [--repeat N]
+```
+"""
+
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from time import perf_counter
+
+from mosheh.doc.shared import _codebase_to_markdown
+from mosheh.handlers.python import _parse_python_code
+from mosheh.types.contracts import FileContract
+
+
+KINDS: int = 7
+
+
+def generate_module(statements: int) -> str:
+    lines: list[str] = ['"""Synthetic module for benchmarking the renderer."""', '']
+
+    for i in range(statements // KINDS + 1):
+        lines += [
+            f'import module_{i}',
+            f'from package_{i}.sub import name_{i}',
+            f'CONST_{i} = {i}',
+            f'TYPED_{i}: dict[str, int] = {{"key": {i}}}',
+            '',
+            f'class Class{i}(Base, metaclass=Meta):',
+            f'    """Class {i} docstring,',
+            '    spanning lines."""',
+            '',
+            f'    attr: int = {i}',
+            '',
+            f'def function_{i}(x: int, *args: str, y: int = 1, **kwargs: str) -> int:',
+            f'    """Function {i} docstring.',
+            '',
+            '    :param x: Some number.',
+            '    :return: Another number."""',
+            '',
+            '    if x:',
+            f'        return x + {i}',
+            '    return y',
+            '',
+            f'assert CONST_{i} == {i}, "constant {i} changed"',
+            '',
+        ]
+
+    return '\n'.join(lines)
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--statements', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=10)
+    args: Namespace = parser.parse_args()
+
+    source: bytes = generate_module(args.statements).encode()
+    record: FileContract = _parse_python_code(source, 'module.py')
+    best: float = float('inf')
+    size: int = 0
+
+    for _ in range(args.repeat):
+        start: float = perf_counter()
+        size = len(_codebase_to_markdown(record, 'module.py'))
+        best = min(best, perf_counter() - start)
+
+    tracemalloc.start()
+    _codebase_to_markdown(record, 'module.py')
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f'{len(record.statements)} statements, {size / 1024:.0f}KiB of Markdown')
+    print(f'render: {best * 1000:.2f}ms, peak allocated {peak / 1024:.0f}KiB')
+
+
+if __name__ == '__main__':
+    main()
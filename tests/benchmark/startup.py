@@ -0,0 +1,66 @@
+"""
+Benchmarks the CLI startup, reporting how long importing each entry point takes.
+
+Every statement runs on a fresh interpreter with `-X importtime`, keeping the best
+cumulative time of the measured module over the repeats, and is compared against the
+startup budget: the heavy modules, such as `rich` or the handlers, must only be loaded
+by the commands needing them, which `tests/unittest/main.py` already checks without
+relying on the machine speed.
+
+Usage:
+
+```sh
+uv run python -m tests.benchmark.startup [--repeat N]
+```
+"""
+
+import subprocess
+import sys
+from argparse import ArgumentParser, Namespace
+from typing import Final
+
+
+IMPORT_TIME_BUDGET_US: Final[int] = 50_000
+
+STATEMENTS: Final[tuple[tuple[str, str], ...]] = (
+    ('import mosheh.main', 'mosheh.main'),
+    ('from mosheh.commands import init', 'mosheh.commands'),
+)
+
+
+def import_time(statement: str, module: str) -> int:
+    result: subprocess.CompletedProcess[str] = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        _, cumulative, name = line.removeprefix('import time:').split('|')
+
+        if name.strip() == module:
+            return int(cumulative)
+
+    raise ValueError(f'{module} not imported by "{statement}"')
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=10)
+    args: Namespace = parser.parse_args()
+
+    for statement, module in STATEMENTS:
+        best: int = min(import_time(statement, module) for _ in range(args.repeat))
+        status: str = 'ok' if best < IMPORT_TIME_BUDGET_US else 'OVER BUDGET'
+        print(
+            f'{statement:<36} {best / 1000:>7.2f}ms '
+            f'(budget {IMPORT_TIME_BUDGET_US / 1000:.0f}ms) {status}'
+        )
+
+
+if __name__ == '__main__':
+    main()
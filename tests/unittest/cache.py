@@ -0,0 +1,41 @@
+from pathlib import Path
+
+from mosheh.cache import cache_key, read_cache, write_cache
+
+
+def test_cache_key() -> None:
+    key: str = cache_key(b'import os', 'python-handler-1')
+
+    assert len(key) == 64
+    assert key == cache_key(b'import os', 'python-handler-1')
+    assert key != cache_key(b'import os', 'python-handler-2')
+    assert key != cache_key(b'import sys', 'python-handler-1')
+
+
+def test_read_write_cache(tmp_path: Path) -> None:
+    cache_dir: str = str(tmp_path / 'cache')
+    key: str = cache_key(b'x = 1')
+
+    assert read_cache(cache_dir, key) is None
+
+    write_cache(cache_dir, key, [{'key': 'value'}])
+
+    assert read_cache(cache_dir, key) == [{'key': 'value'}]
+    assert (tmp_path / 'cache' / '.gitignore').read_text() == '*\n'
+
+
+def test_read_broken_cache(tmp_path: Path) -> None:
+    key: str = cache_key(b'x = 1')
+    (tmp_path / key[:2]).mkdir()
+    (tmp_path / key[:2] / f'{key}.pickle').write_bytes(b'not a pickle')
+
+    assert read_cache(str(tmp_path), key) is None
+
+
+def test_write_unpicklable_cache(tmp_path: Path) -> None:
+    key: str = cache_key(b'x = 1')
+
+    write_cache(str(tmp_path), key, lambda: None)
+
+    assert read_cache(str(tmp_path), key) is None
+    assert list((tmp_path / key[:2]).iterdir()) == []
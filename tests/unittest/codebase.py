@@ -0,0 +1,177 @@
+from pathlib import Path
+
+import yaml
+
+from mosheh.codebase import list_python_files, read_codebase, stream_codebase
+from mosheh.doc.shared import (
+    get_update_set_nav,
+    make_output_dirs,
+    plan_output_dirs,
+    process_codebase,
+    process_files,
+)
+from mosheh.types.basic import CodebaseDict
+from mosheh.utils import (
+    build_nav_struct,
+    get_codebase_prefix,
+    iter_codebase_files,
+    remove_abspath_from_codebase,
+)
+
+
+PROJECT: str = str(Path(__file__).parent.parent / 'PROJECT')
+
+
+def test_read_codebase_parallel_matches_serial() -> None:
+    serial: CodebaseDict = read_codebase(PROJECT)
+    parallel: CodebaseDict = read_codebase(PROJECT, jobs=3)
+
+    assert parallel == serial
+    assert repr(parallel) == repr(serial)
+
+
+def test_stream_codebase_matches_read_codebase(tmp_path: Path) -> None:
+    codebase: CodebaseDict = read_codebase(PROJECT)
+    tree, parsed = stream_codebase(PROJECT, jobs=2)
+
+    assert [i for i, _ in iter_codebase_files(tree)] == [
+        i for i, _ in iter_codebase_files(codebase)
+    ]
+
+    process_codebase(
+        remove_abspath_from_codebase(codebase), PROJECT, str(tmp_path / 'a')
+    )
+    process_files(
+        parsed,
+        (i for i, _ in iter_codebase_files(remove_abspath_from_codebase(tree))),
+        get_codebase_prefix(tree),
+        PROJECT,
+        str(tmp_path / 'b'),
+    )
+
+    pages: list[Path] = sorted((tmp_path / 'a').rglob('*.md'))
+
+    assert pages
+    assert [i.relative_to(tmp_path / 'a') for i in pages] == sorted(
+        i.relative_to(tmp_path / 'b') for i in (tmp_path / 'b').rglob('*.md')
+    )
+
+    for page in pages:
+        other: Path = tmp_path / 'b' / page.relative_to(tmp_path / 'a')
+        assert page.read_text() == other.read_text()
+
+
+def test_process_codebase_parallel_matches_serial(tmp_path: Path) -> None:
+    codebase: CodebaseDict = remove_abspath_from_codebase(read_codebase(PROJECT))
+    serial: int = process_codebase(codebase, PROJECT, str(tmp_path / 'a'))
+    parallel: int = process_codebase(codebase, PROJECT, str(tmp_path / 'b'), jobs=3)
+    pages: list[Path] = sorted((tmp_path / 'a').rglob('*.md'))
+
+    assert serial == parallel == len(pages)
+    assert [i.relative_to(tmp_path / 'a') for i in pages] == sorted(
+        i.relative_to(tmp_path / 'b') for i in (tmp_path / 'b').rglob('*.md')
+    )
+
+    for page in pages:
+        other: Path = tmp_path / 'b' / page.relative_to(tmp_path / 'a')
+        assert page.read_text() == other.read_text()
+
+    assert process_codebase(codebase, PROJECT, str(tmp_path / 'b'), jobs=3) == 0
+
+
+def test_process_codebase_skips_unchanged_pages(tmp_path: Path) -> None:
+    codebase: CodebaseDict = remove_abspath_from_codebase(read_codebase(PROJECT))
+    snapshot: str = repr(codebase)
+    written: int = process_codebase(codebase, PROJECT, str(tmp_path))
+    pages: list[Path] = sorted(tmp_path.rglob('*.md'))
+
+    assert written == len(pages) > 0
+    assert repr(codebase) == snapshot
+
+    mtimes: list[int] = [i.stat().st_mtime_ns for i in pages]
+
+    assert process_codebase(codebase, PROJECT, str(tmp_path)) == 0
+    assert [i.stat().st_mtime_ns for i in pages] == mtimes
+
+    pages[0].write_text('outdated')
+
+    assert process_codebase(codebase, PROJECT, str(tmp_path)) == 1
+    assert pages[0].read_text() != 'outdated'
+
+
+def test_get_update_set_nav_skips_unchanged_nav(tmp_path: Path) -> None:
+    codebase: CodebaseDict = remove_abspath_from_codebase(read_codebase(PROJECT))
+    mkdocs_yml: Path = tmp_path / 'mkdocs.yml'
+    mkdocs_yml.write_text(
+        '# Hand written\nsite_name: Project\nnav:\n  - Homepage: index.md\n'
+        '  - Codebase: []\n'
+    )
+
+    assert get_update_set_nav(str(mkdocs_yml), codebase)
+
+    content: str = mkdocs_yml.read_text()
+    mtime: int = mkdocs_yml.stat().st_mtime_ns
+
+    assert yaml.safe_load(content)['nav'][1] == {'Codebase': build_nav_struct(codebase)}
+    assert not get_update_set_nav(str(mkdocs_yml), codebase)
+    assert mkdocs_yml.stat().st_mtime_ns == mtime
+
+    nav_file: Path = tmp_path / 'nav.yml'
+    mkdocs_yml.write_text('# Hand written\n')
+
+    assert get_update_set_nav(str(mkdocs_yml), codebase, nav_file=str(nav_file))
+    assert yaml.safe_load(nav_file.read_text()) == build_nav_struct(codebase)
+    assert not get_update_set_nav(str(mkdocs_yml), codebase, nav_file=str(nav_file))
+    assert mkdocs_yml.read_text() == '# Hand written\n'
+
+    nav_file.write_text(nav_file.read_text() + '- "extra": "extra.md"\n')
+
+    assert get_update_set_nav(str(mkdocs_yml), codebase, nav_file=str(nav_file))
+    assert yaml.safe_load(nav_file.read_text()) == build_nav_struct(codebase)
+
+
+def test_plan_output_dirs(tmp_path: Path) -> None:
+    docs: str = str(tmp_path / 'docs')
+    dirs: list[str] = plan_output_dirs(
+        ['manage.py', 'PROJECT/core/urls.py', 'PROJECT/core/api/v1.py', 'PROJECT/a.py'],
+        '',
+        docs,
+    )
+
+    assert [Path(i).relative_to(docs) for i in dirs] == [
+        Path('Codebase/PROJECT'),
+        Path('Codebase/PROJECT/core'),
+        Path('Codebase/PROJECT/core/api'),
+    ]
+    assert make_output_dirs(str(tmp_path / 'docs' / 'Codebase'), dirs) == 3
+    assert all(Path(i).is_dir() for i in dirs)
+    assert make_output_dirs(str(tmp_path / 'docs' / 'Codebase'), dirs) == 0
+
+
+def test_list_python_files(tmp_path: Path) -> None:
+    for file in (
+        'app/__init__.py',
+        'app/models.py',
+        'app/fixtures/big.py',
+        'app/fixtures/keep.py',
+        'app/generated.py',
+        'app/README.md',
+        '.venv/lib/site-packages/six.py',
+        'node_modules/pkg/index.py',
+        'app/__pycache__/models.py',
+        'build/lib/app/models.py',
+    ):
+        (tmp_path / file).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / file).touch()
+
+    (tmp_path / 'app' / '.gitignore').write_text('generated.py\n')
+
+    files: list[str] = list_python_files(
+        str(tmp_path), ['app/fixtures/'], ['app/fixtures/keep.py']
+    )
+
+    assert sorted(Path(i).relative_to(tmp_path).as_posix() for i in files) == [
+        'app/__init__.py',
+        'app/fixtures/keep.py',
+        'app/models.py',
+    ]
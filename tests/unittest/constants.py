@@ -1,17 +1,25 @@
+import sys
 from string import Formatter
 
 from mosheh.constants import (
     ACCEPTABLE_LOWER_CONSTANTS,
     ASSERT_MD_STRUCT,
+    ASSERT_MD_TEMPLATE,
     ASSIGN_MD_STRUCT,
+    ASSIGN_MD_TEMPLATE,
     BUILTIN_DUNDER_METHODS,
     BUILTIN_FUNCTIONS,
     BUILTIN_MODULES,
     CLASS_DEF_MD_STRUCT,
+    CLASS_DEF_MD_TEMPLATE,
     DEFAULT_MKDOCS_YML,
     FILE_MARKDOWN,
+    FILE_MD_TEMPLATE,
     FUNCTION_DEF_MD_STRUCT,
+    FUNCTION_DEF_MD_TEMPLATE,
     IMPORT_MD_STRUCT,
+    IMPORT_MD_TEMPLATE,
+    compile_template,
 )
 
 
@@ -29,25 +37,23 @@ def is_formatable_and_get_fields(s: str) -> tuple[bool, list[str] | None]:
 
 
 def test_BUILTIN_MODULES() -> None:
-    assert isinstance(BUILTIN_MODULES, list)
+    assert isinstance(BUILTIN_MODULES, frozenset)
     assert all(map(lambda x: isinstance(x, str), BUILTIN_MODULES))
-    assert BUILTIN_MODULES == sorted(BUILTIN_MODULES)
+    assert BUILTIN_MODULES == sys.stdlib_module_names | set(sys.builtin_module_names)
 
 
 def test_BUILTIN_FUNCTIONS() -> None:
-    assert isinstance(BUILTIN_FUNCTIONS, list)
+    assert isinstance(BUILTIN_FUNCTIONS, frozenset)
     assert all(map(lambda x: isinstance(x, str), BUILTIN_FUNCTIONS))
-    assert BUILTIN_FUNCTIONS == sorted(BUILTIN_FUNCTIONS)
 
 
 def test_BUILTIN_DUNDER_METHODS() -> None:
-    assert isinstance(BUILTIN_DUNDER_METHODS, list)
+    assert isinstance(BUILTIN_DUNDER_METHODS, frozenset)
     assert all(map(lambda x: isinstance(x, str), BUILTIN_DUNDER_METHODS))
-    assert BUILTIN_DUNDER_METHODS == sorted(BUILTIN_DUNDER_METHODS)
 
 
 def test_ACCEPTABLE_LOWER_CONSTANTS() -> None:
-    assert isinstance(ACCEPTABLE_LOWER_CONSTANTS, tuple)
+    assert isinstance(ACCEPTABLE_LOWER_CONSTANTS, frozenset)
     assert all(map(lambda x: isinstance(x, str), ACCEPTABLE_LOWER_CONSTANTS))
 
 
@@ -63,6 +69,7 @@ def test_DEFAULT_MKDOCS_YML() -> None:
             'edit_uri',
             'logo_path',
             'logo_path',
+            'mosheh_plugin',
             'codebase_nav_path',
         ],
     )
@@ -133,3 +140,20 @@ def test_ASSERT_MD_STRUCT() -> None:
         True,
         ['test', 'msg', 'code'],
     )
+
+
+def test_compile_template() -> None:
+    assert compile_template('{name}: 100% {value}') == '%(name)s: 100%% %(value)s'
+
+    for struct, template in (
+        (FILE_MARKDOWN, FILE_MD_TEMPLATE),
+        (IMPORT_MD_STRUCT, IMPORT_MD_TEMPLATE),
+        (ASSIGN_MD_STRUCT, ASSIGN_MD_TEMPLATE),
+        (CLASS_DEF_MD_STRUCT, CLASS_DEF_MD_TEMPLATE),
+        (FUNCTION_DEF_MD_STRUCT, FUNCTION_DEF_MD_TEMPLATE),
+        (ASSERT_MD_STRUCT, ASSERT_MD_TEMPLATE),
+    ):
+        fields: list[str] = is_formatable_and_get_fields(struct)[1] or []
+        values: dict[str, str] = {i: f'<{i} {{}} %s>' for i in fields}
+
+        assert template % values == struct.format(**values)
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+from mosheh.codebase import read_codebase
+from mosheh.constants import DEFAULT_INDEX_MD
+from mosheh.doc.create import create_doc
+
+
+PROJECT: str = str(Path(__file__).parent.parent.parent / 'PROJECT')
+
+
+def test_create_doc_without_mkdocs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv('PATH', '')
+    output: Path = tmp_path / 'doc'
+
+    create_doc(
+        codebase=read_codebase(PROJECT),
+        root=PROJECT,
+        output=str(output),
+        proj_name='Project',
+        logo_path=None,
+        readme_path=None,
+    )
+
+    assert (output / 'docs' / 'index.md').read_text() == DEFAULT_INDEX_MD
+    assert (output / 'docs' / 'Codebase').is_dir()
+
+    with open(output / 'mkdocs.yml', encoding='utf-8') as f:
+        config = yaml.load(f, Loader=yaml.BaseLoader)
+
+    assert config['site_name'] == 'Project'
+    assert config['nav'][0] == {'Homepage': 'index.md'}
+
+    (output / 'docs' / 'index.md').write_text('# Kept')
+    create_doc(
+        codebase=read_codebase(PROJECT),
+        root=PROJECT,
+        output=str(output),
+        proj_name='Project',
+        logo_path=None,
+        readme_path=None,
+    )
+
+    assert (output / 'docs' / 'index.md').read_text() == '# Kept'
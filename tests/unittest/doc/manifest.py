@@ -0,0 +1,98 @@
+from hashlib import sha256
+from pathlib import Path
+
+from mosheh.doc.manifest import (
+    ManifestDiff,
+    ManifestEntry,
+    diff_manifest,
+    load_manifest,
+    manifest_key,
+    remove_pages,
+    save_manifest,
+)
+from mosheh.handlers import parse_python_file
+from mosheh.types.contracts import FileContract
+
+
+def test_diff_manifest(tmp_path: Path) -> None:
+    (tmp_path / 'src').mkdir()
+    (tmp_path / 'src' / 'a.py').write_text('A = 1')
+    (tmp_path / 'src' / 'b.py').write_text('B = 1')
+
+    files: dict[str, ManifestEntry]
+    diff: ManifestDiff
+    files, diff = diff_manifest(
+        [('src/a.py', []), ('src/b.py', [])], str(tmp_path), '.', {}
+    )
+
+    assert diff.added == ['src/a.py', 'src/b.py']
+    assert files['src/a.py']['page'] == 'docs/Codebase/src/a.py.md'
+
+    output: Path = tmp_path / 'out'
+    for entry in files.values():
+        (output / entry['page']).parent.mkdir(parents=True, exist_ok=True)
+        (output / entry['page']).write_text('')
+
+    (tmp_path / 'src' / 'b.py').write_text('B = 2')
+    (tmp_path / 'src' / 'c.py').write_text('C = 1')
+
+    diff = diff_manifest(
+        [('src/b.py', []), ('src/c.py', [])], str(tmp_path), str(output), files
+    )[1]
+
+    assert diff == ManifestDiff(
+        added=['src/c.py'], changed=['src/b.py'], removed=['src/a.py'], unchanged=[]
+    )
+
+
+def test_diff_manifest_uses_parsed_bytes(tmp_path: Path) -> None:
+    (tmp_path / 'a.py').write_text('A = 1')
+    record: FileContract = parse_python_file(str(tmp_path / 'a.py'))
+    (tmp_path / 'a.py').write_text('A = 22')
+
+    files: dict[str, ManifestEntry] = diff_manifest(
+        [('a.py', record)], str(tmp_path), '.', {}
+    )[0]
+
+    assert files['a.py']['hash'] == sha256(b'A = 1').hexdigest()
+    assert files['a.py']['size'] == len('A = 1')
+
+    output: Path = tmp_path / 'out'
+    (output / files['a.py']['page']).parent.mkdir(parents=True)
+    (output / files['a.py']['page']).write_text('')
+
+    diff: ManifestDiff = diff_manifest(
+        [('a.py', [])], str(tmp_path), str(output), files
+    )[1]
+
+    assert diff.changed == ['a.py']
+
+
+def test_load_save_manifest(tmp_path: Path) -> None:
+    entry: ManifestEntry = ManifestEntry(mtime=1, size=2, hash='h', page='p')
+    key: str = manifest_key()
+
+    output: Path = tmp_path / 'out'
+    output.mkdir()
+
+    assert load_manifest(str(output), key) is None
+
+    save_manifest(str(output), key, str(tmp_path / 'src'), {'a.py': entry})
+
+    assert load_manifest(str(output), key) == {
+        'key': key,
+        'prefix': str(tmp_path / 'src'),
+        'files': {'a.py': entry},
+    }
+    assert load_manifest(str(output), manifest_key('Other')) is None
+
+
+def test_remove_pages(tmp_path: Path) -> None:
+    page: Path = tmp_path / 'docs' / 'Codebase' / 'pkg' / 'a.py.md'
+    page.parent.mkdir(parents=True)
+    page.write_text('')
+
+    remove_pages(str(tmp_path), ['docs/Codebase/pkg/a.py.md', 'docs/missing.md'])
+
+    assert not (tmp_path / 'docs' / 'Codebase').exists()
+    assert (tmp_path / 'docs').exists()
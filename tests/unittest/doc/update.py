@@ -0,0 +1,40 @@
+from pathlib import Path
+
+import pytest
+
+from mosheh.codebase import read_codebase
+from mosheh.doc.create import create_doc
+from mosheh.doc.update import update_doc
+
+
+def test_update_doc_shadowed_module(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv('PATH', '')
+    root: Path = tmp_path / 'src'
+    root.mkdir()
+    (root / 'a.py').write_text('import yaml\n')
+    (root / 'b.py').write_text('X = 1\n')
+    output: Path = tmp_path / 'doc'
+
+    create_doc(
+        codebase=read_codebase(str(root)),
+        root=str(root),
+        output=str(output),
+        proj_name='Project',
+        logo_path=None,
+        readme_path=None,
+    )
+    page: Path = next((output / 'docs' / 'Codebase').rglob('a.py.md'))
+
+    assert 'Category: trdparty' in page.read_text()
+
+    (root / 'yaml.py').write_text('Y = 1\n')
+    update_doc(
+        codebase=read_codebase(str(root)),
+        root=str(root),
+        output=str(output),
+        readme_path=None,
+    )
+
+    assert 'Category: local' in page.read_text()
@@ -0,0 +1,38 @@
+import subprocess
+from pathlib import Path
+from shutil import which
+
+import pytest
+
+from mosheh.git import GitChanges, get_changed_files
+
+
+@pytest.mark.skipif(which('git') is None, reason='Git not installed')
+def test_get_changed_files(tmp_path: Path) -> None:
+    def git(*args: str) -> None:
+        subprocess.run(['git', *args], cwd=tmp_path, check=True, capture_output=True)
+
+    src: Path = tmp_path / 'src'
+    src.mkdir()
+    (src / 'kept.py').write_text('A = 1')
+    (src / 'edited.py').write_text('B = 1')
+    (src / 'moved.py').write_text('C = 1\n' * 20)
+    (src / 'gone.py').write_text('D = 1')
+    (tmp_path / 'outside.py').write_text('E = 1')
+
+    git('init', '-q')
+    git('add', '.')
+    git('-c', 'user.name=t', '-c', 'user.email=t@t', 'commit', '-qm', 'base')
+
+    (src / 'edited.py').write_text('B = 2')
+    (src / 'gone.py').unlink()
+    git('mv', 'src/moved.py', 'src/renamed.py')
+    (src / 'new.py').write_text('F = 1')
+    (src / 'notes.txt').write_text('')
+    (tmp_path / 'outside.py').write_text('E = 2')
+
+    changes: GitChanges = get_changed_files(str(src), 'HEAD')
+
+    assert sorted(changes.added) == [str(src / 'new.py'), str(src / 'renamed.py')]
+    assert changes.modified == [str(src / 'edited.py')]
+    assert sorted(changes.deleted) == [str(src / 'gone.py'), str(src / 'moved.py')]
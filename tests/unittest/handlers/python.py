@@ -1,16 +1,26 @@
 # ruff: noqa: E501
 
-from ast import AST, ClassDef, FunctionDef, parse, walk
+import ast
+from ast import AST, ClassDef, ExceptHandler, FunctionDef, match_case, parse, stmt, walk
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+import pytest
+
+import mosheh.handlers.python
+import mosheh.modules
 from mosheh.handlers.python import (
+    parse_python_file,
     wrapped_handle_std_nodes_for_testing,
     wrapped_mark_methods_for_testing,
+    wrapped_walk_statements_for_testing,
 )
+from mosheh.modules import build_module_index
 from mosheh.types.basic import (
     StandardReturn,
 )
+from mosheh.types.contracts import to_dict
 from mosheh.types.enums import (
     FunctionType,
     ImportType,
@@ -289,4 +299,132 @@ def test_handle_std_nodes() -> None:
     assert len(statements) == len(expected)
 
     for i in statements:
-        assert i in expected
+        assert to_dict(i) in expected
+
+
+def test_walk_statements() -> None:
+    code: str = """
+import os
+
+try:
+    import ujson as json
+except ImportError:
+    import json
+else:
+    pass
+finally:
+    DONE = True
+
+match os.name:
+    case 'nt':
+        SEP = '\\\\'
+    case _:
+        SEP = '/'
+
+
+class Foo:
+    def bar(self):
+        with open(os.devnull) as f:
+            for line in f:
+                assert line, [lambda: i for i in line]
+"""
+
+    tree: AST = parse(code)
+
+    full: list[AST] = wrapped_walk_statements_for_testing(tree, False)
+    scoped: list[AST] = wrapped_walk_statements_for_testing(tree)
+
+    assert full == [
+        tree,
+        *(
+            node
+            for node in walk(tree)
+            if isinstance(node, stmt | ExceptHandler | match_case)
+        ),
+    ]
+    assert scoped == [i for i in full if i in scoped]
+    assert [type(i).__name__ for i in full if i not in scoped] == [
+        'With',
+        'For',
+        'Assert',
+    ]
+
+
+def test_deeply_nested_functions(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    depth: int = 60
+    lines: list[str] = [f'{"    " * i}def f{i}():' for i in range(depth)]
+    lines.append(f'{"    " * depth}yield from g(lambda: (yield))')
+    file: Path = tmp_path / 'nested.py'
+    file.write_text('\n'.join(lines))
+
+    nodes: int = sum(1 for _ in walk(parse(file.read_text())))
+    calls: list[AST] = []
+    iter_child_nodes = ast.iter_child_nodes
+
+    def counting_iter_child_nodes(node: AST) -> Iterator[AST]:
+        calls.append(node)
+        return iter_child_nodes(node)
+
+    monkeypatch.setattr(ast, 'iter_child_nodes', counting_iter_child_nodes)
+
+    statements: tuple[StandardReturn, ...] = parse_python_file(
+        str(file), skip_function_bodies=False
+    ).statements
+
+    assert len(calls) <= nodes
+    assert [i.name for i in statements] == [f'f{i}' for i in range(depth)]
+    assert [i.category for i in statements] == [FunctionType.Function] * (depth - 1) + [
+        FunctionType.Generator
+    ]
+
+
+def test_parse_python_file_imports(tmp_path: Path) -> None:
+    (tmp_path / 'pkg' / 'sub').mkdir(parents=True)
+    (tmp_path / 'pkg' / '__init__.py').touch()
+    (tmp_path / 'pkg' / 'models.py').touch()
+    file: Path = tmp_path / 'pkg' / 'sub' / 'views.py'
+    file.write_text(
+        'import os\nimport pkg.models\nfrom ..models import A\nfrom . import b\n'
+    )
+
+    plain: tuple[StandardReturn, ...] = parse_python_file(str(file)).statements
+    indexed: tuple[StandardReturn, ...] = parse_python_file(
+        str(file), str(tmp_path / 'cache'), index=build_module_index(str(tmp_path))
+    ).statements
+
+    assert [(i.path, i.category) for i in plain] == [
+        (None, ImportType.Native),
+        (None, ImportType.Local),
+        ('..models', ImportType.Local),
+        ('.', ImportType.Local),
+    ]
+    assert [(i.path, i.category) for i in indexed] == [
+        (None, ImportType.Native),
+        (None, ImportType.Local),
+        ('pkg.models', ImportType.Local),
+        ('pkg.sub', ImportType.Local),
+    ]
+    assert parse_python_file(str(file), str(tmp_path / 'cache')).statements == plain
+
+
+def test_parse_python_file_cache_reclassifies_imports(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file: Path = tmp_path / 'mod.py'
+    file.write_text('import os\nimport yaml\n')
+    cache_dir: str = str(tmp_path / 'cache')
+
+    assert [i.category for i in parse_python_file(str(file), cache_dir).statements] == [
+        ImportType.Native,
+        ImportType.TrdParty,
+    ]
+
+    monkeypatch.setattr(mosheh.modules, '_module_map', {'os': ImportType.Native})
+    monkeypatch.setattr(mosheh.handlers.python, '_parse_python_code', None)
+
+    assert [i.category for i in parse_python_file(str(file), cache_dir).statements] == [
+        ImportType.Native,
+        ImportType.Local,
+    ]
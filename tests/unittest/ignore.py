@@ -0,0 +1,60 @@
+from os import path
+
+import pytest
+
+from mosheh.ignore import (
+    RuleSet,
+    compile_rules,
+    includes_inside,
+    is_ignored,
+    match_rules,
+)
+
+
+BASE: str = path.abspath('project')
+
+
+@pytest.mark.parametrize(
+    ('pattern', 'file', 'is_dir', 'expected'),
+    [
+        ('build/', 'build', True, True),
+        ('build/', 'app/build', True, True),
+        ('build/', 'build', False, None),
+        ('/build/', 'app/build', True, None),
+        ('*.pyi', 'app/stubs/models.pyi', False, True),
+        ('app/*.py', 'app/models.py', False, True),
+        ('app/*.py', 'app/views/home.py', False, None),
+        ('app/**/*.py', 'app/views/home.py', False, True),
+        ('**/migrations', 'app/account/migrations', True, True),
+        ('test_[!a]*.py', 'test_b.py', False, True),
+        ('test_[!a]*.py', 'test_a.py', False, None),
+        ('# build', 'build', True, None),
+    ],
+)
+def test_match_rules(
+    pattern: str, file: str, is_dir: bool, expected: bool | None
+) -> None:
+    rules: RuleSet = compile_rules([pattern], BASE)
+
+    assert match_rules(rules, path.join(BASE, file), is_dir) is expected
+
+
+def test_is_ignored() -> None:
+    sets: list[RuleSet] = [
+        compile_rules(['.venv/', 'build/'], BASE),
+        compile_rules(['*.py', '!keep.py'], path.join(BASE, 'app')),
+    ]
+    include: RuleSet = compile_rules(['build/gen/', 'app/main.py'], BASE)
+
+    assert is_ignored(path.join(BASE, '.venv'), True, sets)
+    assert not is_ignored(path.join(BASE, 'setup.py'), False, sets)
+    assert is_ignored(path.join(BASE, 'app', 'models.py'), False, sets)
+    assert not is_ignored(path.join(BASE, 'app', 'keep.py'), False, sets)
+    assert is_ignored(path.join(BASE, 'app', 'main.py'), False, sets)
+    assert not is_ignored(path.join(BASE, 'app', 'main.py'), False, sets, include)
+    assert is_ignored(path.join(BASE, 'build'), True, sets, include)
+    assert not is_ignored(path.join(BASE, 'build', 'gen'), True, sets, include, True)
+    assert is_ignored(path.join(BASE, 'build', 'lib'), True, sets, include, True)
+    assert is_ignored(path.join(BASE, '.venv'), True, sets, include)
+    assert includes_inside(include, path.join(BASE, 'build'))
+    assert not includes_inside(include, path.join(BASE, '.venv'))
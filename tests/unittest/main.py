@@ -0,0 +1,63 @@
+import subprocess
+import sys
+from pathlib import Path
+from typing import Final
+
+import pytest
+
+
+HEAVY_MODULES: Final[tuple[str, ...]] = (
+    'rich',
+    'yaml',
+    'mosheh.handlers',
+    'mosheh.codebase',
+    'mosheh.doc',
+)
+
+
+def import_times(statement: str) -> dict[str, int]:
+    result: subprocess.CompletedProcess[str] = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        _, cumulative, module = line.removeprefix('import time:').split('|')
+        times[module.strip()] = int(cumulative)
+
+    return times
+
+
+@pytest.mark.parametrize(
+    'statement',
+    ['import mosheh.main', 'from mosheh.commands import init'],
+)
+def test_startup_imports(statement: str) -> None:
+    times: dict[str, int] = import_times(statement)
+
+    assert 'mosheh.commands' in times
+    assert not [i for i in times if i.startswith(HEAVY_MODULES)]
+
+
+def test_init_without_rich(tmp_path: Path) -> None:
+    subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            'import sys\n'
+            'from mosheh.main import main\n'
+            "sys.argv = ['mosheh', 'init', '--path', sys.argv[1]]\n"
+            'main()\n'
+            "assert 'rich' not in sys.modules\n",
+            str(tmp_path),
+        ],
+        check=True,
+    )
+
+    assert (tmp_path / 'mosheh.json').is_file()
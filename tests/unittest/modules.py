@@ -0,0 +1,96 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+import mosheh.modules
+from mosheh.modules import (
+    ModuleIndex,
+    build_module_index,
+    build_module_map,
+    get_module_map,
+    load_module_map,
+    module_map_fingerprint,
+)
+from mosheh.types.basic import ModuleName
+from mosheh.types.enums import ImportType
+
+
+def test_build_module_map(tmp_path: Path) -> None:
+    site_dir: Path = tmp_path / 'site-packages'
+    (site_dir / 'pkg').mkdir(parents=True)
+    (site_dir / 'pkg' / '__init__.py').write_text('raise RuntimeError')
+    (site_dir / 'namespace').mkdir()
+    (site_dir / 'pkg-1.0.dist-info').mkdir()
+    (site_dir / '__pycache__').mkdir()
+    (site_dir / 'six.py').write_text('raise RuntimeError')
+    (site_dir / '_ext.cpython-312-x86_64-linux-gnu.so').write_bytes(b'')
+    (site_dir / 'json.py').write_text('raise RuntimeError')
+    (site_dir / 'editable.pth').write_text(str(tmp_path))
+
+    module_map: dict[ModuleName, ImportType] = build_module_map([str(site_dir)])
+
+    assert {k for k, v in module_map.items() if v == ImportType.TrdParty} == {
+        'pkg',
+        'namespace',
+        'six',
+        '_ext',
+    }
+    assert module_map['json'] == ImportType.Native
+    assert module_map['sys'] == ImportType.Native
+    assert 'pkg' not in sys.modules
+
+
+def test_load_module_map(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(mosheh.modules, '_module_map', None)
+    module_map: dict[ModuleName, ImportType] = load_module_map(str(tmp_path))
+
+    assert get_module_map() is module_map
+    assert module_map['os'] == ImportType.Native
+    assert module_map['pytest'] == ImportType.TrdParty
+    assert module_map_fingerprint().startswith(sys.executable)
+
+    monkeypatch.setattr(mosheh.modules, '_module_map', None)
+    monkeypatch.setattr(mosheh.modules, 'build_module_map', dict)
+
+    assert load_module_map(str(tmp_path)) == module_map
+
+
+def test_build_module_index(tmp_path: Path) -> None:
+    root: Path = tmp_path / 'PROJECT'
+    for file in (
+        'account/__init__.py',
+        'account/models.py',
+        'account/views/home.py',
+        'crypt.py',
+        'my-scripts/run.py',
+    ):
+        (root / file).parent.mkdir(parents=True, exist_ok=True)
+        (root / file).touch()
+
+    index: ModuleIndex = build_module_index(str(root))
+    home: str = str(root / 'account' / 'views' / 'home.py')
+
+    assert set(index.modules) == {
+        'account',
+        'account.models',
+        'account.views.home',
+        'crypt',
+    }
+    assert index.resolve('..models', home) == 'account.models'
+    assert index.resolve('.', home) == 'account.views'
+    assert index.resolve('.', str(root / 'account' / '__init__.py')) == 'account'
+    assert index.resolve('....', home) == '....'
+    assert index.resolve('...', home) == '...'
+    assert index.resolve('.', str(root / 'crypt.py')) == '.'
+    assert index.resolve('.models', str(root / 'crypt.py')) == '.models'
+    assert index.resolve('os.path', home) == 'os.path'
+    assert index.classify('account.models') == ImportType.Local
+    assert index.classify('crypt') == ImportType.Local
+    assert index.classify('os.path') == ImportType.Native
+
+    (root / '__init__.py').touch()
+    index = build_module_index(str(root))
+
+    assert 'PROJECT.account.models' in index.modules
+    assert index.resolve('..models', home) == 'PROJECT.account.models'
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+from mkdocs.config import load_config
+from mkdocs.config.defaults import MkDocsConfig
+from mkdocs.structure.files import Files, get_files
+
+from mosheh.codebase import read_codebase
+from mosheh.doc.shared import process_codebase
+from mosheh.plugin import MoshehPlugin
+from mosheh.utils import build_nav_struct, remove_abspath_from_codebase
+
+
+PROJECT: str = str(Path(__file__).parent.parent / 'PROJECT')
+
+
+def test_plugin_serves_pages_from_memory(tmp_path: Path) -> None:
+    (tmp_path / 'docs').mkdir()
+    (tmp_path / 'docs' / 'index.md').write_text('# Home')
+    (tmp_path / 'mkdocs.yml').write_text(
+        'site_name: Project\nnav:\n  - Homepage: index.md\n  - Codebase: []\n'
+    )
+
+    config: MkDocsConfig = load_config(str(tmp_path / 'mkdocs.yml'))
+    plugin: MoshehPlugin = MoshehPlugin()
+    errors, _ = plugin.load_config(
+        {'root': str(Path(PROJECT).relative_to(tmp_path, walk_up=True))},
+        config.config_file_path,
+    )
+
+    assert not errors
+
+    config.plugins['mosheh'] = plugin
+    config = config.plugins.on_config(config)
+    files: Files = config.plugins.on_files(get_files(config), config=config)
+    codebase = remove_abspath_from_codebase(read_codebase(PROJECT))
+
+    assert config.nav == [
+        {'Homepage': 'index.md'},
+        {'Codebase': build_nav_struct(codebase)},
+    ]
+    assert sorted((tmp_path / 'docs').rglob('*')) == [tmp_path / 'docs' / 'index.md']
+
+    process_codebase(codebase, PROJECT, str(tmp_path / 'written'))
+    pages: list[Path] = sorted((tmp_path / 'written' / 'docs').rglob('*.md'))
+
+    assert len(files.documentation_pages()) == len(pages) + 1
+
+    for page in pages:
+        file = files.get_file_from_path(
+            page.relative_to(tmp_path / 'written' / 'docs').as_posix()
+        )
+
+        assert file is not None and file.generated_by == 'mosheh'
+        assert file.content_string == page.read_text()
+
+
+def test_plugin_reads_nav_file(tmp_path: Path) -> None:
+    (tmp_path / 'docs').mkdir()
+    (tmp_path / 'nav.yml').write_text('- "a.py": "Codebase/a.py.md"\n')
+    (tmp_path / 'mkdocs.yml').write_text(
+        'site_name: Project\nnav:\n  - Homepage: index.md\n'
+    )
+
+    config: MkDocsConfig = load_config(str(tmp_path / 'mkdocs.yml'))
+    plugin: MoshehPlugin = MoshehPlugin()
+    plugin.load_config({'nav_file': 'nav.yml'}, config.config_file_path)
+    config.plugins['mosheh'] = plugin
+    config = config.plugins.on_config(config)
+
+    assert config.nav == [
+        {'Homepage': 'index.md'},
+        {'Codebase': [{'a.py': 'Codebase/a.py.md'}]},
+    ]
+    assert len(config.plugins.on_files(get_files(config), config=config)) == 0
@@ -0,0 +1,59 @@
+import ast
+import pickle
+
+from mosheh.source import Source, SourceSegment
+
+
+CODE: bytes = b"""import os  # comment
+
+@decorator(
+    1
+)
+class Foo:
+    def bar(self):
+        return {  # kept as written
+            'a': 1,
+        }
+
+X = 1; Y = 2
+"""
+
+
+def test_source_segment() -> None:
+    source: Source = Source(CODE)
+    tree: ast.Module = ast.parse(CODE)
+    cls: ast.ClassDef = tree.body[1]  # type: ignore[assignment]
+
+    assert source.segment(tree.body[0]) == 'import os'
+    assert str(source.segment(cls)).startswith('@decorator(\n    1\n)\nclass Foo:')
+    assert source.segment(cls.body[0]) == (
+        "def bar(self):\n    return {  # kept as written\n        'a': 1,\n    }"
+    )
+    assert source.segment(tree.body[2]) == 'X = 1'
+    assert source.segment(tree.body[3]) == 'Y = 2'
+
+
+def test_source_segment_bom() -> None:
+    source: Source = Source(b'\xef\xbb\xbfX = 1\nY = 2\n')
+    tree: ast.Module = ast.parse('X = 1\nY = 2\n')
+
+    assert [str(source.segment(i)) for i in tree.body] == ['X = 1', 'Y = 2']
+
+
+def test_source_segment_line_breaks() -> None:
+    code: str = 'X = "a\x0cb\u2028c"\r\nclass Foo:\r    Y = 1\n'
+    source: Source = Source(code.encode())
+    tree: ast.Module = ast.parse(code)
+
+    assert source.segment(tree.body[0]) == 'X = "a\x0cb\u2028c"'
+    assert source.segment(tree.body[1]) == 'class Foo:\n    Y = 1'
+
+
+def test_source_segment_pickle() -> None:
+    source: Source = Source(CODE)
+    tree: ast.Module = ast.parse(CODE)
+    segments: list[SourceSegment] = [source.segment(i) for i in tree.body]
+    loaded: list[SourceSegment] = pickle.loads(pickle.dumps(segments))
+
+    assert loaded == segments
+    assert len({id(i.source) for i in loaded}) == 1
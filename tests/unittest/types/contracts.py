@@ -6,11 +6,14 @@ from mosheh.types.contracts import (
     AssertContract,
     AssignContract,
     ClassDefContract,
+    FileMetaContract,
     FunctionDefContract,
     ImportContract,
     ImportFromContract,
+    from_dict,
+    to_dict,
 )
-from mosheh.types.enums import FunctionType, ImportType, Statement
+from mosheh.types.enums import FileRole, FunctionType, ImportType, Statement
 
 
 @g(st.characters(), st.characters())
@@ -243,3 +246,33 @@ def test_assert_contract(test: str, msg: str | None, code: str) -> None:
 
     assert isinstance(contract, AssertContract)
     assert contract._asdict() == expected
+
+
+@g(st.characters())
+def test_file_meta_contract(docstring: str) -> None:
+    contract: FileMetaContract = FileMetaContract(
+        role=FileRole.PythonSourceCode, docstring=docstring
+    )
+
+    expected: dict[str, str | FileRole] = {
+        '__role__': FileRole.PythonSourceCode,
+        '__docstring__': docstring,
+    }
+
+    assert to_dict(contract) == expected
+    assert from_dict(expected) == contract
+
+
+@g(st.characters(), st.characters(), st.characters())
+def test_to_from_dict(name: str, path: str, code: str) -> None:
+    contract: ImportFromContract = ImportFromContract(
+        statement=Statement.ImportFrom,
+        name=name,
+        path=path,
+        category=ImportType.Local,
+        code=code,
+    )
+
+    assert to_dict(contract) == contract._asdict()
+    assert from_dict(to_dict(contract)) == contract
+    assert isinstance(from_dict(to_dict(contract)), ImportFromContract)
@@ -1,5 +1,7 @@
 from collections import defaultdict
-from typing import Any
+from os import path, sep
+from sys import getrecursionlimit
+from typing import Any, cast
 
 from hypothesis import given as g
 from hypothesis import strategies as st
@@ -7,13 +9,20 @@ from hypothesis import strategies as st
 from mosheh.types.basic import CodebaseDict, StandardReturn
 from mosheh.types.enums import ImportType
 from mosheh.utils import (
+    add_to_codebase_tree,
     add_to_nested_defaultdict,
     bin,
+    build_nav_struct,
+    build_path_tree,
     convert_to_regular_dict,
+    get_codebase_prefix,
     get_import_type,
     indent_code,
+    iter_codebase_files,
     nested_defaultdict,
+    remove_abspath_from_codebase,
     standard_struct,
+    walk_codebase,
 )
 
 
@@ -24,7 +33,10 @@ def test_bin(data: list[int]) -> None:
 
 def test_get_import_type() -> None:
     assert get_import_type('os') == ImportType.Native
-    assert get_import_type('stdlib_list') == ImportType.TrdParty
+    assert get_import_type('os.path') == ImportType.Native
+    assert get_import_type('yaml') == ImportType.TrdParty
+    assert get_import_type('yaml.loader') == ImportType.TrdParty
+    assert get_import_type('not_installed_at_all') == ImportType.Local
 
 
 def test_nested_defaultdict() -> None:
@@ -64,6 +76,48 @@ def test_convert_to_regular_dict() -> None:
     assert result == {'level1': [{'key': 'value'}]}
 
 
+def test_add_to_codebase_tree() -> None:
+    tree: CodebaseDict = {}
+    add_to_codebase_tree(tree, ['PROJECT', 'core', 'urls.py'], [])
+    result: CodebaseDict = add_to_codebase_tree(tree, ['PROJECT', 'manage.py'], [])
+
+    assert result is tree
+    assert type(result['PROJECT']) is dict
+    assert result == {'PROJECT': {'core': {'urls.py': []}, 'manage.py': []}}
+
+
+def test_walk_codebase() -> None:
+    tree: CodebaseDict = cast(
+        CodebaseDict,
+        {'PROJECT': {'manage.py': [], 'core': {'urls.py': []}, 'ui': {}}},
+    )
+
+    assert [i[:3] for i in walk_codebase(tree, separator='/')] == [
+        (0, 'PROJECT', 'PROJECT'),
+        (1, 'manage.py', 'PROJECT/manage.py'),
+        (1, 'core', 'PROJECT/core'),
+        (2, 'urls.py', 'PROJECT/core/urls.py'),
+        (1, 'ui', 'PROJECT/ui'),
+    ]
+
+
+def test_deep_codebase_tree() -> None:
+    parts: list[str] = ['home', *['d'] * getrecursionlimit(), 'deep.py']
+    files: list[str] = [sep.join(['', *parts]), sep.join(['', 'home', 'top.py'])]
+    cleaned: CodebaseDict = remove_abspath_from_codebase(build_path_tree(files))
+    nav: list[dict[str, Any]] = build_nav_struct(cleaned)
+
+    assert [i for i, _ in iter_codebase_files(cleaned)] == [
+        sep.join(parts),
+        sep.join(['home', 'top.py']),
+    ]
+
+    for name in parts[:-1]:
+        nav = nav[0][name]
+
+    assert nav == [{'deep.py': f'Codebase/{"/".join(parts)}.md'}]
+
+
 def test_standard_struct() -> None:
     dct: dict[Any, Any] = standard_struct()
 
@@ -77,3 +131,37 @@ def test_indent_code() -> None:
 
     assert isinstance(result, str)
     assert result == '    def test_foo() -> None:\n        pass'
+
+
+def test_iter_codebase_files() -> None:
+    tree: CodebaseDict = cast(
+        CodebaseDict,
+        {'PROJECT': {'manage.py': [{'a': 'b'}], 'core': {'urls.py': []}}},
+    )
+
+    assert list(iter_codebase_files(tree)) == [
+        (path.join('PROJECT', 'manage.py'), [{'a': 'b'}]),
+        (path.join('PROJECT', 'core', 'urls.py'), []),
+    ]
+
+
+def test_build_path_tree() -> None:
+    files: list[str] = [
+        path.join('PROJECT', 'manage.py'),
+        path.join('PROJECT', 'core', 'urls.py'),
+        path.join('PROJECT', 'core', 'views.py'),
+    ]
+
+    assert build_path_tree(files) == {
+        'PROJECT': {'manage.py': [], 'core': {'urls.py': [], 'views.py': []}}
+    }
+    assert [i for i, _ in iter_codebase_files(build_path_tree(files))] == files
+
+
+def test_get_codebase_prefix() -> None:
+    codebase: CodebaseDict = cast(
+        CodebaseDict,
+        {'': {'home': {'user': {'PROJECT': {'manage.py': [], 'urls.py': []}}}}},
+    )
+
+    assert get_codebase_prefix(codebase) == sep.join(['', 'home', 'user'])
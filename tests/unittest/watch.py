@@ -0,0 +1,75 @@
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+from threading import Timer
+
+import pytest
+
+from mosheh.codebase import list_python_files
+from mosheh.commands.watch_cmd import _parse_changes
+from mosheh.modules import build_module_index
+from mosheh.watch import FileChanges, watch_changes
+
+
+def next_changes(changes: Iterator[FileChanges], *actions: Timer) -> FileChanges:
+    for i in actions:
+        i.start()
+
+    return next(changes)
+
+
+def test_watch_changes(tmp_path: Path) -> None:
+    for file in ('a.py', 'b.py', 'pkg/c.py', 'notes.txt'):
+        (tmp_path / file).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / file).write_text('X = 1\n')
+
+    root: str = str(tmp_path)
+    changes: Iterator[FileChanges] = watch_changes(
+        root, list_python_files(root), debounce=0.2
+    )
+
+    def edit() -> None:
+        (tmp_path / 'a.py').write_text('X = 2\n')
+        (tmp_path / 'b.py').unlink()
+        (tmp_path / 'new.py').write_text('Y = 1\n')
+        (tmp_path / 'notes.txt').write_text('ignored')
+        (tmp_path / '.venv').mkdir()
+        (tmp_path / '.venv' / 'lib.py').write_text('Z = 1\n')
+
+    try:
+        assert next_changes(changes, Timer(0.3, edit)) == FileChanges(
+            added=[str(tmp_path / 'new.py')],
+            modified=[str(tmp_path / 'a.py')],
+            deleted=[str(tmp_path / 'b.py')],
+        )
+
+        assert next_changes(
+            changes,
+            Timer(0.1, (tmp_path / 'pkg').rename, [tmp_path / 'moved']),
+        ) == FileChanges(
+            added=[str(tmp_path / 'moved' / 'c.py')],
+            modified=[],
+            deleted=[str(tmp_path / 'pkg' / 'c.py')],
+        )
+    finally:
+        changes.close()
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_parse_changes_skips_invalid_files(
+    tmp_path: Path, jobs: int, caplog: pytest.LogCaptureFixture
+) -> None:
+    (tmp_path / 'good.py').write_text('X = 1\n')
+    (tmp_path / 'half_saved.py').write_text('def broken(:\n')
+    (tmp_path / 'latin.py').write_bytes(b'X = "\xe9"\n')
+    files: list[str] = [
+        str(tmp_path / i) for i in ('good.py', 'half_saved.py', 'latin.py', 'gone.py')
+    ]
+
+    with caplog.at_level(logging.ERROR, logger='mosheh'):
+        parsed = _parse_changes(
+            files, jobs, None, True, build_module_index(str(tmp_path))
+        )
+
+    assert [i for i, _ in parsed] == [files[0]]
+    assert [i for i in files[1:] if i in caplog.text] == files[1:]